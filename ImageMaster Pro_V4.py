@@ -1,6 +1,7 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk, simpledialog, colorchooser, font
-import uuid # For unique overlay IDs
+import uuid # Only for the once-per-session ID prefix
+import itertools # Monotonic counter for element IDs
 
 # Import TkinterDnD AFTER other tkinter imports but potentially before ThemedTk is used heavily
 try:
@@ -16,32 +17,109 @@ except ImportError:
             return tk.Tk(*args, **kwargs)
     DND_FILES = None # Dummy variable
 
-from ttkthemes import ThemedTk # Now used for the main frame, not the root itself
-from PIL import Image, ImageFilter, ImageTk, ImageDraw, ImageFont, ExifTags, ImageEnhance, UnidentifiedImageError
+from PIL import Image, UnidentifiedImageError
+
+# The heavier PIL submodules (filters, Tk bridge, drawing, fonts, EXIF,
+# enhancers) are only needed once an image is actually loaded, so they are
+# imported lazily to keep cold start lean. _load_pil_extras() fills these in.
+ImageFilter = ImageTk = ImageDraw = ImageFont = ExifTags = ImageEnhance = ImageOps = None
+
+def _load_pil_extras():
+    """Imports the heavyweight PIL submodules on first use (idempotent)."""
+    global ImageFilter, ImageTk, ImageDraw, ImageFont, ExifTags, ImageEnhance, ImageOps
+    if ImageFilter is None:
+        from PIL import ImageFilter as _f, ImageTk as _t, ImageDraw as _d, \
+             ImageFont as _fo, ExifTags as _e, ImageEnhance as _en, ImageOps as _io
+        ImageFilter, ImageTk, ImageDraw = _f, _t, _d
+        ImageFont, ExifTags, ImageEnhance, ImageOps = _fo, _e, _en, _io
+
+# NumPy is optional - used to accelerate per-pixel work when available
+try:
+    import numpy as np
+    _numpy_available = True
+except ImportError:
+    _numpy_available = False
+    np = None
 import os
 import json
 import threading
+import concurrent.futures # Worker pool for batch conversion
 import time
 import math
 import re # For regex parsing in handle_drop
 import sys  # For checking platform
-from collections import deque # For Undo/Redo stacks
+from collections import deque, OrderedDict # For Undo/Redo stacks and LRU caches
+import functools # lru_cache for the shared overlay/watermark decoder
+import logging
+import logging.handlers
+
+# Hot-path logger for the preview/display pipeline. print() flushes stdout
+# synchronously while holding the GIL, which competes with the render loop
+# (and goes through a slow pipe on Windows Tk), so repaint-critical code logs
+# here instead. Records buffer in memory and only flush through to stderr on
+# ERROR; at the default WARNING level DEBUG messages cost a single level check.
+_log = logging.getLogger('imagemasterpro')
+if not _log.handlers:
+    _log.addHandler(logging.handlers.MemoryHandler(
+        capacity=200, flushLevel=logging.ERROR,
+        target=logging.StreamHandler()))
+    _log.setLevel(logging.WARNING)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_rgba_master(path, mtime_ns, size):
+    """Decodes an overlay/watermark file to RGBA once per (path, stat) triple.
+
+    The mtime/size key makes edited files miss the cache naturally. Callers
+    must .copy() the result: each overlay dict owns (and may close()) its own
+    pil_image, so the cached master is never handed out directly. Decode
+    failures raise and are therefore not cached.
+    """
+    return Image.open(path).convert("RGBA")
+
+
+@functools.lru_cache(maxsize=256)
+def _trig_pair(angle_degrees):
+    """Memoized (cos, sin) of an angle given in degrees.
+
+    Hit tests and handle drawing evaluate the same element angles on every
+    mouse event; caching the pair replaces a radians conversion plus two trig
+    calls with one dict hit. 256 entries comfortably outlast rotation drags.
+    """
+    rad = math.radians(angle_degrees)
+    return math.cos(rad), math.sin(rad)
+
 
 # --- Tooltip Helper Class ---
 class ToolTip:
     """Simple Tooltip class for Tkinter widgets with debouncing"""
+
+    # Shared state for the event-driven hide: only one tooltip is ever visible,
+    # so a single application-wide <Motion> hook can police it instead of each
+    # instance running its own after() polling loop.
+    _active = None
+    _motion_hook_bound = False
+    # Screen size queried once and shared by all instances - it doesn't change
+    # mid-session and winfo_screenwidth/height are Tcl round-trips.
+    _screen_size = None
+
     def __init__(self, widget, text):
+        # Guard against double attachment: a second ToolTip on the same widget
+        # would stack duplicate <Enter>/<Leave> bindings that all fire per hover.
+        if getattr(widget, "_tooltip_attached", False):
+            return
+        widget._tooltip_attached = True
         self.widget = widget
         self.text = text
         self.tooltip = None
         self._enter_job = None
-        self._hide_job = None # Added to prevent flickering
+        self._widget_bbox = None # Cached at show time for the motion hook
+        self._tip_bbox = None
         self.widget.bind("<Enter>", self.enter)
         self.widget.bind("<Leave>", self.leave)
         self.widget.bind("<ButtonPress>", self.leave)  # Hide on click
 
     def enter(self, event=None):
-        self._cancel_hide()
         if not self.tooltip: # Only schedule show if not already visible
              if self._enter_job:
                  self.widget.after_cancel(self._enter_job)
@@ -51,31 +129,39 @@ class ToolTip:
         if self.tooltip:
             return
         try:
-            # Get widget position relative to the screen
-            x = self.widget.winfo_rootx() + self.widget.winfo_width() // 2
-            y = self.widget.winfo_rooty() + self.widget.winfo_height() + 5 # Position below the widget
+            # Read the widget geometry once; it doubles as the motion-hook bbox
+            widget_x, widget_y = self.widget.winfo_rootx(), self.widget.winfo_rooty()
+            widget_w, widget_h = self.widget.winfo_width(), self.widget.winfo_height()
+            self._widget_bbox = (widget_x, widget_y, widget_x + widget_w, widget_y + widget_h)
+
+            x = widget_x + widget_w // 2
+            y = widget_y + widget_h + 5 # Position below the widget
+
+            if ToolTip._screen_size is None:
+                ToolTip._screen_size = (self.widget.winfo_screenwidth(),
+                                        self.widget.winfo_screenheight())
+            scr_w, scr_h = ToolTip._screen_size
+
+            # Estimate the tooltip size from the text instead of forcing a
+            # geometry recompute with update_idletasks (each such call is a
+            # full idle-queue flush). Wraplength is 300 at ~6px per character.
+            text_px = len(self.text) * 6
+            tip_w = min(300, text_px) + 8
+            tip_h = 16 * (1 + text_px // 300) + 4
 
-            self.tooltip = tk.Toplevel(self.widget)
-            self.tooltip.wm_overrideredirect(True) # No window decorations
-            self.tooltip.wm_geometry(f"+{x}+{y}")
             # Adjust position if tooltip goes off-screen (simple adjustment)
-            self.tooltip.update_idletasks() # Ensure geometry is calculated
-            scr_w = self.widget.winfo_screenwidth()
-            scr_h = self.widget.winfo_screenheight()
-            tip_w = self.tooltip.winfo_width()
-            tip_h = self.tooltip.winfo_height()
-
             if x + tip_w > scr_w:
                  x = scr_w - tip_w - 5
             if x < 0 : x = 5 # Prevent going off left edge
 
             if y + tip_h > scr_h:
-                 y = self.widget.winfo_rooty() - tip_h - 5 # Position above
+                 y = widget_y - tip_h - 5 # Position above
             if y < 0 : y = 5 # Prevent going off top edge
 
+            self.tooltip = tk.Toplevel(self.widget)
+            self.tooltip.wm_overrideredirect(True) # No window decorations
             self.tooltip.wm_geometry(f"+{x}+{y}")
 
-
             label = tk.Label(self.tooltip, text=self.text, justify='left',
                              background="#ffffe0", relief='solid', borderwidth=1,
                              wraplength=300, font=("tahoma", "8", "normal"))
@@ -83,51 +169,52 @@ class ToolTip:
             # Add bindings to the tooltip itself to hide it
             label.bind("<Leave>", self.leave)
             label.bind("<ButtonPress>", self.leave)
+
+            # Estimated rect is close enough for the motion-hook hide test
+            self._tip_bbox = (x, y, x + tip_w, y + tip_h)
+
+            ToolTip._active = self
+            if not ToolTip._motion_hook_bound:
+                # One application-wide hook shared by all ToolTip instances
+                self.widget.bind_all("<Motion>", ToolTip._on_motion, add="+")
+                ToolTip._motion_hook_bound = True
         except Exception as e:
             print(f"Error showing tooltip: {e}")
             self._destroy_tooltip()
 
     def leave(self, event=None):
         self._cancel_show()
-        # Don't hide immediately, wait a bit in case the cursor moves onto the tooltip
-        if self.tooltip and not self._hide_job:
-            self._hide_job = self.widget.after(100, self._check_hide)
-
-    def _check_hide(self):
-        # Check if cursor is over the widget or the tooltip
-        if self.tooltip:
-            try:
-                widget_x, widget_y = self.widget.winfo_rootx(), self.widget.winfo_rooty()
-                widget_w, widget_h = self.widget.winfo_width(), self.widget.winfo_height()
-                tt_x, tt_y = self.tooltip.winfo_rootx(), self.tooltip.winfo_rooty()
-                tt_w, tt_h = self.tooltip.winfo_width(), self.tooltip.winfo_height()
-                cursor_x, cursor_y = self.widget.winfo_pointerxy()
-
-                over_widget = (widget_x <= cursor_x < widget_x + widget_w and
-                               widget_y <= cursor_y < widget_y + widget_h)
-                over_tooltip = (tt_x <= cursor_x < tt_x + tt_w and
-                                tt_y <= cursor_y < tt_y + tt_h)
-
-                if not over_widget and not over_tooltip:
-                    self._destroy_tooltip()
-            except (tk.TclError, AttributeError): # Handle cases where widget/tooltip might be gone
+        # Hide if the pointer has actually moved off both the widget and the tooltip
+        # (the motion hook covers the common case; this catches leaving the app window)
+        if self.tooltip and event is not None:
+            if not self._point_over_tooltip_area(event.x_root, event.y_root):
                 self._destroy_tooltip()
 
-        self._hide_job = None
+    def _point_over_tooltip_area(self, x, y):
+        """True if screen point (x, y) is over the widget or its visible tooltip."""
+        for bbox in (self._widget_bbox, self._tip_bbox):
+            if bbox and bbox[0] <= x < bbox[2] and bbox[1] <= y < bbox[3]:
+                return True
+        return False
 
+    @classmethod
+    def _on_motion(cls, event):
+        # Event-driven replacement for the old per-instance after() polling:
+        # a single bind_all hook that only does work while a tooltip is visible.
+        active = cls._active
+        if active and active.tooltip:
+            if not active._point_over_tooltip_area(event.x_root, event.y_root):
+                active._destroy_tooltip()
 
     def _cancel_show(self):
         if self._enter_job:
             self.widget.after_cancel(self._enter_job)
             self._enter_job = None
 
-    def _cancel_hide(self):
-        if self._hide_job:
-            self.widget.after_cancel(self._hide_job)
-            self._hide_job = None
-
     def _destroy_tooltip(self):
         self._cancel_show()
+        if ToolTip._active is self:
+            ToolTip._active = None
         if self.tooltip:
             try:
                 self.tooltip.destroy()
@@ -140,6 +227,15 @@ class ToolTip:
 class ImageMasterProApp:
     # --- Constants ---
     MAX_UNDO_HISTORY = 50 # Limit undo history size
+    MAX_ACTIVE_IMAGE_SETTINGS = 32 # Entries allowed to keep loaded PIL objects
+    # Pre-compiled once: TkDnD wraps paths containing spaces in {braces};
+    # compiling inside the drop handler would pay the regex build per drop.
+    _DND_BRACE_RE = re.compile(r'\{([^{}]+)\}')
+    # Recognized image extensions (lowercase); frozenset membership beats a
+    # list scan when filtering large folder drops.
+    IMAGE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.bmp', '.gif', '.tiff', '.tif', '.webp', '.ico', '.ppm', '.pgm', '.pbm'})
+    # Same set without the dots, for the rpartition-based fast test below
+    IMAGE_EXTENSIONS_NO_DOT = frozenset(ext[1:] for ext in IMAGE_EXTENSIONS)
 
     def __init__(self, root):
         # root is now the TkinterDnD enabled tk.Tk() instance (if available)
@@ -149,13 +245,17 @@ class ImageMasterProApp:
         self.root.columnconfigure(0, weight=1)
         self.root.rowconfigure(0, weight=1)
 
-        # Apply themed style using a main ThemedTk Frame inside the root
-        self.themed_style = ttk.Style()
+        # Apply themed style; ttkthemes is imported here (first use) rather than
+        # at module level so importing this file stays cheap.
         try:
-            # Get available themes using the style object associated with the root window
-            available_themes = ThemedTk(self.root, theme="arc").get_themes() # Temporary instance to get themes
+            from ttkthemes import ThemedStyle
+            # ThemedStyle attaches to the existing root - no throwaway Tk
+            # instance just to enumerate themes.
+            self.themed_style = ThemedStyle(self.root)
+            available_themes = self.themed_style.get_themes()
         except Exception as e:
-            print(f"Warning: Could not get themes using ThemedTk: {e}")
+            print(f"Warning: Could not get themes using ttkthemes: {e}")
+            self.themed_style = ttk.Style()
             available_themes = self.themed_style.theme_names() # Fallback to standard ttk themes
             if not available_themes: available_themes = ["clam", "alt", "default", "classic"] # Further fallback
             print(f"Falling back to ttk themes: {available_themes}")
@@ -163,15 +263,21 @@ class ImageMasterProApp:
         # --- State Variables ---
         self.image_list = []
         self.current_image_path = None
+        self._current_settings = None # Direct ref to image_settings[current_image_path] (or None)
         self.original_image = None # Holds the PIL Image object (never directly modified by effects after initial load+EXIF)
         self.rotated_flipped_image = None # Holds original_image after rotation/flip applied (base for processing)
+        self._base_image_version = 0 # Bumped on every rotated_flipped_image swap; keys the stage caches (id() can be reused)
         self.processed_image = None # Holds the PIL image after *all* processing FOR PREVIEW (incl. overlays)
         self.preview_image_tk = None # Holds the ImageTk object for canvas
         self.output_dir = tk.StringVar(value="")
         self.filename_var = tk.StringVar()
         self.theme_var = tk.StringVar(value="arc") # Default theme
         self.processed_base_size = None # Stores (width, height) of image after filter/resize/adjustments, before edits/watermark/overlays
-        self.image_settings = {} # Stores per-image settings {image_path: {'blur_areas': [], 'adjustments': {}, 'overlays': [], 'undo_stack': deque(), 'redo_stack': deque(), ...}}
+        # Per-image settings, ordered by recency of use {image_path: {'blur_areas': [], 'adjustments': {}, 'overlays': [], 'undo_stack': deque(), 'redo_stack': deque(), ...}}
+        # Entries past MAX_ACTIVE_IMAGE_SETTINGS get their PIL objects closed
+        # (Pillow keeps C buffers alive until close()); metadata stays so the
+        # images reload from their paths on the next visit.
+        self.image_settings = OrderedDict()
 
         # --- Drawing/Selection state ---
         self.selection_rect_id = None
@@ -191,6 +297,7 @@ class ImageMasterProApp:
         self.edit_orig_angle_on_drag_start = 0.0 # Original angle on drag start
         self.edit_center_on_drag_start = (0,0) # Center on drag start (original coords)
         self.edit_mouse_start_angle_on_drag = 0.0 # Relative mouse angle for rotation start
+        self._drag_render_pending = False # Coalesces drag-motion renders to one per idle slot
 
         # --- Watermark state (Text) ---
         self.watermark_text = tk.StringVar(value="SAMPLE")
@@ -221,6 +328,9 @@ class ImageMasterProApp:
         self.selected_overlay_uuid = None # UUID of the currently selected overlay in the listbox
         # Overlay data itself is stored in image_settings[current_image_path]['overlays']
         # Each overlay: {'uuid': str, 'path': str, 'pil_image': Image, 'rect': tuple, 'angle': float, 'opacity': int}
+        # Created here (not in the lazily-built Overlays tab) because non-tab
+        # code paths read/write it (settings load, undo)
+        self.overlay_opacity_var = tk.IntVar(value=128) # Links scale to selection
 
         # --- Zoom/Pan State ---
         self.zoom_factor = 1.0
@@ -243,7 +353,94 @@ class ImageMasterProApp:
         # --- Other State ---
         self.available_themes = available_themes # Store available themes
         self._preview_update_job = None # For debouncing preview updates
-        self._canvas_resize_job = None # For debouncing canvas resize
+        self._last_preview_ms = 0 # Last pipeline duration; feeds the adaptive interval
+        self._canvas_resize_job = None # Pending trailing resize redraw
+        self._last_resize_ts = 0.0 # Throttle clock for <Configure> bursts
+        self._last_resize_handled = None # (w, h) of last resize seen
+        self._debounce_jobs = {} # key -> pending after() id, see _debounce
+        self._ui_state_job = None # Pending coalesced widget-state sweep
+        self._ui_pending_processing = False # Sticky processing flag for the sweep
+        self._last_states = {} # widget id -> last state applied via _set_state
+        # Filled by _build_watermarks_tab; empty until that tab is first opened
+        self._text_wm_check = None
+        self._text_wm_widgets = []
+        self._img_wm_check = None
+        self._img_wm_need_path = []
+        self._img_wm_labels = []
+        # Cache of scaled crops + PhotoImages keyed by (image id, zoom, visible rect).
+        # Lets pan/zoom redraws reuse the expensive crop/resize/PhotoImage work.
+        self._preview_cache = OrderedDict()
+        self._PREVIEW_CACHE_SIZE = 4 # Small LRU bound to keep memory in check
+        # Reusable PhotoImage for steady-state pan/drag frames: once the
+        # display size settles, new crops are paste()d over this buffer
+        # instead of allocating a fresh Tk image per mouse event
+        self._scratch_photo = None
+        self._scratch_size = None # (w, h, mode) of the settled display size
+        # Draft-quality rendering while panning/zooming: interaction handlers
+        # stamp this, the display path drops to NEAREST within 0.3 s of it,
+        # and one deferred full-quality redraw runs when input goes idle
+        self._last_interaction_ts = 0.0
+        self._hq_redraw_job = None
+        # Dummy placeholder frames for image-notebook tabs, reused across
+        # rebuilds (grown to the largest list seen, never destroyed)
+        self._tab_frame_pool = []
+        # Small worker pool for image decode (PIL releases the GIL in C code,
+        # so big files no longer freeze the UI); daemon threads, dies with app
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        self._loading_path = None # Path of the decode allowed to land (latest wins)
+        # Single-flight worker for the preview pipeline: after the first
+        # paint, renders run off the Tk thread and only the newest snapshot
+        # is allowed to land (see _finish_preview_async)
+        self._preview_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._preview_future = None # In-flight (or queued) render, if any
+        self._preview_gen = 0 # Bumped per submitted job; stale results are dropped
+        self._last_drop_parse = (None, None) # (raw payload, parsed paths) memo
+        # Pool of scratch RGBA layers reused across watermark/overlay composites,
+        # so preview refreshes don't reallocate multi-MB buffers per frame
+        self._layer_pool = {} # (w, h, mode) -> list of free images
+        self._layer_pool_lock = threading.Lock() # Conversion workers share the pool
+        self._LAYER_POOL_PER_KEY = 4
+        # Rasterized text-watermark sprites keyed by (text, size, color, opacity),
+        # LRU-ordered; see _get_text_wm_sprite
+        self._wm_sprite_cache = OrderedDict()
+        self._WM_SPRITE_CACHE_SIZE = 32
+        # Conversion pool workers render text WMs concurrently; the sprite and
+        # transform caches need the same guarding as the layer pool
+        self._wm_cache_lock = threading.Lock()
+        # Transformed overlay/watermark sprites (opacity+resize+rotate applied)
+        # keyed by source identity and target geometry; see _prepare_overlay_sprite
+        self._wm_transform_cache = OrderedDict()
+        self._WM_TRANSFORM_CACHE_SIZE = 16
+        # Struct-of-arrays geometry index (NumPy columns) derived from the
+        # current image's overlays/edit areas; lets mouse hit-tests run as
+        # vectorized array ops instead of per-dict Python scans. None = stale.
+        self._geom_index = None
+        # uuid -> element dict index for the current image; spares drag
+        # interactions a linear list scan per event pair. None = stale.
+        self._area_lookup = None
+        self._area_lookup_path = None
+        # Canvas item id -> (area_type, uuid, handle_type) for interactive
+        # handles, recorded at draw time so hit-testing is one dict lookup
+        # instead of gettags + string parsing per item. Tk never reuses item
+        # ids, so stale entries are inert; cleared each full redraw anyway.
+        self._canvas_item_meta = {}
+        # Element IDs come from a monotonic counter instead of uuid4 (which
+        # costs an os.urandom syscall per element). The short random prefix,
+        # drawn once per session, keeps new IDs from colliding with ones
+        # loaded back from a previous session's saved settings.
+        self._id_prefix = uuid.uuid4().hex[:8]
+        self._next_element_id = itertools.count(1)
+        # Fingerprint of the inputs that fed the last full preview pipeline run.
+        # Sliders/FocusOut often fire without the value actually changing; when
+        # the fingerprint matches we can skip straight to redisplay.
+        self._last_pipeline_key = None
+        # Intermediate images from the front of the preview pipeline, keyed by
+        # cumulative prefix fingerprints (source -> filter -> resize ->
+        # adjustments). When only a late stage changed (watermark slider, new
+        # overlay, edit area tweak) the pipeline resumes from the deepest
+        # matching intermediate instead of re-running the expensive front.
+        self._stage_cache = OrderedDict()
+        self._STAGE_CACHE_SIZE = 6 # A few slider round-trips worth of intermediates
 
         # --- Initialize UI and Settings ---
         self.init_style() # Apply initial theme
@@ -253,9 +450,22 @@ class ImageMasterProApp:
         self.update_undo_redo_buttons() # Initial state
         self.root.geometry("1600x1300") # Set initial size (increased)
 
-        # Store original widget backgrounds for hover effects
-        self._original_widget_bgs = {}
 
+    # Theme-dependent style definitions, applied after every theme_use() call
+    # from one place instead of duplicated configure blocks
+    _STYLE_DEFS = {
+        "DND.TLabel": {"padding": 5},
+        "Zoom.TLabel": {"padding": (0, 5), "font": ("Segoe UI", 8)},
+        "Header.TLabel": {"font": ("Segoe UI", 9, "bold")},
+    }
+
+    def _apply_custom_styles(self):
+        """Re-applies the app's custom ttk styles (needed after a theme change)."""
+        for name, kwargs in self._STYLE_DEFS.items():
+            self.themed_style.configure(name, **kwargs)
+        # Hover feedback is driven by the ttk "active" state (set in
+        # on_dnd_enter/on_dnd_leave); the theme engine handles the repaint.
+        self.themed_style.map("DND.TLabel", background=[("active", "#E0E8F0")])
 
     def init_style(self):
         """Initializes styles and applies the initial theme."""
@@ -270,9 +480,7 @@ class ImageMasterProApp:
             self.themed_style.theme_use(self.theme_var.get())
             print(f"Applied theme: {self.theme_var.get()}")
             # Configure styles that might be theme-dependent
-            self.themed_style.configure("DND.TLabel", padding=5)
-            self.themed_style.configure("Zoom.TLabel", padding=(0, 5), font=("Segoe UI", 8)) # Style for zoom label
-            self.themed_style.configure("Header.TLabel", font=("Segoe UI", 9, "bold"))
+            self._apply_custom_styles()
 
         except Exception as e:
             messagebox.showerror("Style Error", f"Failed to initialize styles or theme '{self.theme_var.get()}': {e}")
@@ -328,12 +536,22 @@ class ImageMasterProApp:
         else:
             ToolTip(self.drag_drop_frame, "Drag and drop is disabled. Ensure TkDnD is installed. Use 'Browse'.")
 
-        # Add hover effect for DND area (only if tkdnd is available)
+        # Add hover effect for DND area (only if tkdnd is available).
+        # Bound to tkdnd's <<DropEnter>>/<<DropLeave>> rather than plain
+        # <Enter>/<Leave>: those only fire while a drag is actually in
+        # progress, so ordinary mouse traversal costs nothing, and the
+        # highlight appears exactly when a drop is possible.
         if _tkdnd_available:
-            self.drag_drop_frame.bind("<Enter>", self.on_dnd_enter)
-            self.drag_drop_frame.bind("<Leave>", self.on_dnd_leave)
-            self.dnd_label.bind("<Enter>", self.on_dnd_enter)
-            self.dnd_label.bind("<Leave>", self.on_dnd_leave)
+            for dnd_widget in (self.drag_drop_frame, self.dnd_label):
+                dnd_widget.dnd_bind('<<DropEnter>>', self.on_dnd_enter)
+                dnd_widget.dnd_bind('<<DropLeave>>', self.on_dnd_leave)
+                dnd_widget.dnd_bind('<<Drop>>', self.on_dnd_leave, add='+') # Un-highlight after drop
+            # Companion link for the hover handlers: entering one half of the
+            # frame/label pair also styles the other. Stored as a widget
+            # attribute so the hot path is a getattr, with no str(widget)
+            # Tcl-path build or dict hash per event.
+            self.drag_drop_frame._dnd_companion = self.dnd_label
+            self.dnd_label._dnd_companion = self.drag_drop_frame
 
 
         # --- FIX: Assign browse_button to self.browse_button ---
@@ -513,6 +731,10 @@ class ImageMasterProApp:
         reset_adjust_button.grid(row=3, column=0, columnspan=2, padx=5, pady=10, sticky="ew")
         ToolTip(reset_adjust_button, "Reset Brightness, Contrast, and Saturation to original (1.0).")
 
+        # Tab children are stable after construction; cache the list so state
+        # sweeps don't re-query nametowidget/winfo_children on every refresh
+        self._adjust_tab_widgets = list(adjustments_frame.winfo_children())
+
         # --- Tab 3: Manual Edits (Blur/Blackout) ---
         manual_edit_frame = ttk.Frame(self.processing_notebook, padding="10")
         self.processing_notebook.add(manual_edit_frame, text=" Edits ")
@@ -557,9 +779,157 @@ class ImageMasterProApp:
         self.clear_areas_button.pack(fill="x", pady=(0, 5))
         ToolTip(self.clear_areas_button, "Remove all blur and blackout areas for the current image.")
 
-        # --- Tab 4: Watermarks ---
-        watermark_frame = ttk.Frame(self.processing_notebook, padding="10")
-        self.processing_notebook.add(watermark_frame, text=" Watermarks ")
+        # Cache the state-controlled widgets inside this tab's sub-frames
+        # (shape radios, blur scale/labels) for the widget-state sweep.
+        # The two Add-Area buttons get their own conditional state there, so
+        # they are excluded here rather than filtered on every refresh.
+        self._edits_follow_img_state = [sub for frame in (shape_frame, blur_frame, blackout_frame)
+                                        for sub in frame.winfo_children()
+                                        if sub not in (self.blur_area_button, self.blackout_area_button)]
+
+        # --- Tabs 4 & 5: Watermarks / Overlays (lazy-built) ---
+        # These two tabs hold dozens of widgets the user may never open;
+        # placeholders are added now and the real contents are built on first
+        # selection (see _on_processing_tab_changed), keeping startup cost
+        # proportional to what is actually visible.
+        self._watermarks_tab_frame = ttk.Frame(self.processing_notebook, padding="10")
+        self.processing_notebook.add(self._watermarks_tab_frame, text=" Watermarks ")
+        self._overlays_tab_frame = ttk.Frame(self.processing_notebook, padding="10")
+        self.processing_notebook.add(self._overlays_tab_frame, text=" Overlays ")
+        self._tab_builders = {
+            str(self._watermarks_tab_frame): self._build_watermarks_tab,
+            str(self._overlays_tab_frame): self._build_overlays_tab,
+        }
+        self.processing_notebook.bind("<<NotebookTabChanged>>", self._on_processing_tab_changed)
+
+
+        # --- Right Preview Panel ---
+        preview_outer_frame = ttk.Frame(main_frame, padding=0) # No padding here
+        preview_outer_frame.grid(row=0, column=1, sticky="nsew", pady=0)
+        preview_outer_frame.rowconfigure(0, weight=1) # Canvas expands
+        preview_outer_frame.columnconfigure(0, weight=1) # Canvas expands
+
+        # Use a standard tk Frame for the canvas parent to avoid potential theme background issues
+        preview_canvas_frame = tk.Frame(preview_outer_frame, background="gray50")
+        preview_canvas_frame.grid(row=0, column=0, sticky="nsew")
+        preview_canvas_frame.rowconfigure(0, weight=1)
+        preview_canvas_frame.columnconfigure(0, weight=1)
+
+        self.preview_canvas = tk.Canvas(preview_canvas_frame, background="gray50", relief="sunken", borderwidth=1, highlightthickness=0)
+        self.preview_canvas.grid(row=0, column=0, sticky="nsew")
+        self.canvas_image_id = None # ID of the main image on canvas
+
+        # Bind Mouse Events
+        self.preview_canvas.bind("<Configure>", self.on_canvas_resize_debounced) # Handle window resize
+        self.preview_canvas.bind("<ButtonPress-1>", self.on_mouse_press)
+        self.preview_canvas.bind("<B1-Motion>", self.on_mouse_drag)
+        self.preview_canvas.bind("<ButtonRelease-1>", self.on_mouse_release)
+        # Zoom
+        if sys.platform == "darwin": # MacOS uses different binding for scroll wheel
+             self.preview_canvas.bind("<Command-MouseWheel>", self.on_mouse_wheel_zoom) # Cmd+Scroll
+             self.preview_canvas.bind("<Option-ButtonPress-1>", self.on_pan_press) # Option+Click for Pan Start
+             self.preview_canvas.bind("<Option-B1-Motion>", self.on_pan_drag)
+             self.preview_canvas.bind("<Option-ButtonRelease-1>", self.on_pan_release)
+        else: # Windows/Linux
+             self.preview_canvas.bind("<Control-MouseWheel>", self.on_mouse_wheel_zoom) # Ctrl+Scroll
+             self.preview_canvas.bind("<ButtonPress-2>", self.on_pan_press) # Middle Mouse for Pan Start
+             self.preview_canvas.bind("<B2-Motion>", self.on_pan_drag)
+             self.preview_canvas.bind("<ButtonRelease-2>", self.on_pan_release)
+
+        ToolTip(self.preview_canvas, "Image preview. Ctrl+Scroll=Zoom. MiddleClick/Alt+Drag=Pan. Drag=Select. Click/Drag Edits/Watermarks/Overlays.")
+
+        # Info/Zoom controls below canvas
+        preview_info_frame = ttk.Frame(preview_outer_frame, padding=(5, 2))
+        preview_info_frame.grid(row=1, column=0, sticky="ew")
+        preview_info_frame.columnconfigure(1, weight=1) # Let info label expand
+
+        self.image_info_label = ttk.Label(preview_info_frame, text="Load an image.", anchor=tk.W)
+        self.image_info_label.grid(row=0, column=1, sticky="ew", padx=(5,0))
+
+        self.zoom_label = ttk.Label(preview_info_frame, text="Zoom: 100%", style="Zoom.TLabel", anchor=tk.W)
+        self.zoom_label.grid(row=1, column=1, sticky="w", padx=(5,0))
+
+        zoom_button_frame = ttk.Frame(preview_info_frame)
+        zoom_button_frame.grid(row=0, column=0, rowspan=2, sticky="w") # Span 2 rows, align left
+
+        zoom_in_button = ttk.Button(zoom_button_frame, text="+", width=3, command=self.zoom_in)
+        zoom_in_button.pack(side=tk.LEFT, padx=1)
+        ToolTip(zoom_in_button, "Zoom In")
+        zoom_out_button = ttk.Button(zoom_button_frame, text="-", width=3, command=self.zoom_out)
+        zoom_out_button.pack(side=tk.LEFT, padx=1)
+        ToolTip(zoom_out_button, "Zoom Out")
+        zoom_fit_button = ttk.Button(zoom_button_frame, text="Fit", width=4, command=self.zoom_fit)
+        zoom_fit_button.pack(side=tk.LEFT, padx=1)
+        ToolTip(zoom_fit_button, "Fit Image to View")
+        zoom_100_button = ttk.Button(zoom_button_frame, text="100%", width=5, command=self.zoom_100)
+        zoom_100_button.pack(side=tk.LEFT, padx=1)
+        ToolTip(zoom_100_button, "Zoom to 100% (Actual Pixels)")
+        # Captured once for the widget-state sweep (no winfo_children walk)
+        self._zoom_buttons = [zoom_in_button, zoom_out_button, zoom_fit_button, zoom_100_button]
+
+
+        # --- Image List Notebook (Batch Mode) ---
+        self.image_notebook = ttk.Notebook(preview_outer_frame)
+        self.image_notebook.grid(row=2, column=0, sticky="nsew", pady=(10, 0))
+        preview_outer_frame.rowconfigure(2, weight=0) # Don't let notebook expand vertically excessively initially
+        self.image_notebook.bind("<<NotebookTabChanged>>", self.on_image_tab_change)
+        # Initially hidden if no images
+        self.image_notebook.grid_remove()
+
+        # --- Status Bar ---
+        status_frame = ttk.Frame(self.root, padding=(10, 5))
+        status_frame.grid(row=1, column=0, sticky="sew") # Span across bottom
+        status_frame.columnconfigure(0, weight=1)
+
+        self.status_label = ttk.Label(status_frame, text="Ready.", anchor=tk.W)
+        self.status_label.grid(row=0, column=0, sticky="ew")
+
+        # Convention: progress/status refreshes use update_idletasks() (or after()
+        # callbacks), never root.update() — update() re-enters user event handlers
+        # mid-batch and can cascade redraws.
+        self.progress_bar = ttk.Progressbar(status_frame, orient=tk.HORIZONTAL, mode='determinate')
+        self.progress_bar.grid(row=0, column=1, sticky="ew", padx=(10, 0))
+
+        # --- Bind Undo/Redo Keys ---
+        self.root.bind_all("<Control-z>", self.undo)
+        self.root.bind_all("<Control-y>", self.redo)
+        # MacOS specific Ctrl+Shift+Z for redo might be needed? Testing required.
+        if sys.platform == "darwin":
+            self.root.bind_all("<Command-z>", self.undo)
+            self.root.bind_all("<Command-Shift-z>", self.redo) # Cmd+Shift+Z is common Mac redo
+
+        # Drop targets inside the lazily-built tabs (watermark entry, overlay
+        # listbox) are registered by their tab builders.
+
+
+    # --- Lazy tab construction (Watermarks / Overlays) ---
+
+    def _on_processing_tab_changed(self, event=None):
+        """Builds a lazily-constructed tab the first time it is selected."""
+        try:
+            tab_id = self.processing_notebook.select()
+        except tk.TclError:
+            return
+        builder = self._tab_builders.pop(tab_id, None)
+        if builder:
+            builder()
+            self.update_widget_states()
+
+    def _make_opacity_scale(self, parent, var, record_cb, **kwargs):
+        """Builds a 0-255 opacity Scale wired to the coalesced preview queue.
+
+        The same pattern (live preview on drag, undo record on release) is
+        needed for text-watermark, image-watermark and overlay opacity, so
+        it lives here once instead of three inline copies.
+        """
+        scale = ttk.Scale(parent, from_=0, to=255, variable=var, orient=tk.HORIZONTAL,
+                          command=lambda v: self._request_preview(), **kwargs) # Live update, coalesced
+        scale.bind("<ButtonRelease-1>", record_cb) # Record for undo on release
+        return scale
+
+    def _build_watermarks_tab(self):
+        """Constructs the Watermarks tab contents (deferred from init_ui)."""
+        watermark_frame = self._watermarks_tab_frame
         watermark_frame.columnconfigure(1, weight=1)
 
         # --- Text Watermark Sub-Frame ---
@@ -567,8 +937,9 @@ class ImageMasterProApp:
         text_wm_subframe.pack(fill="x", pady=(0, 10))
         text_wm_subframe.columnconfigure(1, weight=1)
 
-        ttk.Checkbutton(text_wm_subframe, text="Enable Text Watermark", variable=self.use_text_watermark,
-                        command=self.record_text_wm_change).grid(row=0, column=0, columnspan=3, sticky="w", pady=(0, 10))
+        text_wm_check = ttk.Checkbutton(text_wm_subframe, text="Enable Text Watermark", variable=self.use_text_watermark,
+                                        command=self.record_text_wm_change)
+        text_wm_check.grid(row=0, column=0, columnspan=3, sticky="w", pady=(0, 10))
 
         ttk.Label(text_wm_subframe, text="Text:").grid(row=1, column=0, sticky="w", padx=2, pady=2)
         wm_text_entry = ttk.Entry(text_wm_subframe, textvariable=self.watermark_text)
@@ -577,11 +948,13 @@ class ImageMasterProApp:
         ToolTip(wm_text_entry, "Text for the watermark.")
 
         ttk.Label(text_wm_subframe, text="Size:").grid(row=2, column=0, sticky="w", padx=2, pady=2)
-        wm_size_spinbox = ttk.Spinbox(text_wm_subframe, from_=8, to=1000, textvariable=self.watermark_font_size, width=5,
-                                      command=self.record_text_wm_change) # Record on spin click
+        wm_size_spinbox = ttk.Spinbox(text_wm_subframe, from_=8, to=1000, textvariable=self.watermark_font_size, width=5)
         wm_size_spinbox.grid(row=2, column=1, sticky="w", padx=2, pady=2)
-        wm_size_spinbox.bind("<FocusOut>", self.record_text_wm_change) # Record on focus out
-        wm_size_spinbox.bind("<Return>", self.record_text_wm_change) # Record on enter
+        # One trace on the variable replaces the old command= + <FocusOut> +
+        # <Return> triple: it catches every input route (typing, spin, paste)
+        # and the trailing-edge debounce collapses keystroke bursts
+        self.watermark_font_size.trace_add(
+            "write", lambda *a: self._debounce("wm_record", 300, self.record_text_wm_change))
         ToolTip(wm_size_spinbox, "Font size for text watermark.")
 
         wm_color_button = ttk.Button(text_wm_subframe, text="Color", width=6, command=self.choose_watermark_color_action) # Use action
@@ -589,9 +962,7 @@ class ImageMasterProApp:
         ToolTip(wm_color_button, "Choose text color.")
 
         ttk.Label(text_wm_subframe, text="Opacity:").grid(row=3, column=0, sticky="w", padx=2, pady=2)
-        wm_opacity_scale = ttk.Scale(text_wm_subframe, from_=0, to=255, variable=self.watermark_opacity, orient=tk.HORIZONTAL,
-                                     command=self.update_preview_debounced) # Live update ok
-        wm_opacity_scale.bind("<ButtonRelease-1>", self.record_text_wm_change) # Record for undo on release
+        wm_opacity_scale = self._make_opacity_scale(text_wm_subframe, self.watermark_opacity, self.record_text_wm_change)
         wm_opacity_scale.grid(row=3, column=1, columnspan=2, sticky="ew", padx=2, pady=2)
         ToolTip(wm_opacity_scale, "Text opacity (0=transparent, 255=opaque).")
 
@@ -607,10 +978,12 @@ class ImageMasterProApp:
         image_wm_subframe.pack(fill="x", pady=(0, 10))
         image_wm_subframe.columnconfigure(1, weight=1)
 
-        ttk.Checkbutton(image_wm_subframe, text="Enable Image Watermark", variable=self.use_image_watermark,
-                        command=self.toggle_image_wm_action).grid(row=0, column=0, columnspan=3, sticky="w", pady=(0, 10)) # Use action
+        img_wm_check = ttk.Checkbutton(image_wm_subframe, text="Enable Image Watermark", variable=self.use_image_watermark,
+                                       command=self.toggle_image_wm_action) # Use action
+        img_wm_check.grid(row=0, column=0, columnspan=3, sticky="w", pady=(0, 10))
 
-        ttk.Label(image_wm_subframe, text="File:").grid(row=1, column=0, sticky="w", padx=2, pady=2)
+        wm_file_label = ttk.Label(image_wm_subframe, text="File:")
+        wm_file_label.grid(row=1, column=0, sticky="w", padx=2, pady=2)
         # Assign to self to allow drop target registration
         self.wm_img_entry = ttk.Entry(image_wm_subframe, textvariable=self.watermark_image_path, state="readonly")
         self.wm_img_entry.grid(row=1, column=1, sticky="ew", padx=2, pady=2)
@@ -619,11 +992,10 @@ class ImageMasterProApp:
         wm_img_browse.grid(row=1, column=2, sticky="w", padx=(5,2), pady=2)
         ToolTip(wm_img_browse, "Select an image file for the watermark for the *current* main image.")
 
-        ttk.Label(image_wm_subframe, text="Opacity:").grid(row=2, column=0, sticky="w", padx=2, pady=2)
+        wm_opacity_label = ttk.Label(image_wm_subframe, text="Opacity:")
+        wm_opacity_label.grid(row=2, column=0, sticky="w", padx=2, pady=2)
         # Opacity needs to be applied per-image if it's a per-image setting. Keep variable for UI link.
-        self.wm_image_opacity_scale = ttk.Scale(image_wm_subframe, from_=0, to=255, variable=self.watermark_image_opacity, orient=tk.HORIZONTAL,
-                                         command=self.update_preview_debounced) # Live update ok
-        self.wm_image_opacity_scale.bind("<ButtonRelease-1>", self.record_image_wm_change) # Record for undo
+        self.wm_image_opacity_scale = self._make_opacity_scale(image_wm_subframe, self.watermark_image_opacity, self.record_image_wm_change)
         self.wm_image_opacity_scale.grid(row=2, column=1, columnspan=2, sticky="ew", padx=2, pady=2)
         ToolTip(self.wm_image_opacity_scale, "Watermark image opacity (applied when interacting).")
 
@@ -633,10 +1005,33 @@ class ImageMasterProApp:
         reset_wm_place_button.grid(row=3, column=0, columnspan=3, padx=5, pady=5, sticky="ew")
         ToolTip(reset_wm_place_button, "Reset the current image watermark's size, position, and rotation.")
 
+        # Classify the state-controlled widgets once, by role, for the
+        # widget-state sweep - no isinstance/cget("text") probing per refresh
+        self._text_wm_check = text_wm_check
+        self._text_wm_widgets = [w for w in text_wm_subframe.winfo_children() if w is not text_wm_check]
+        self._img_wm_check = img_wm_check
+        self._img_wm_browse = wm_img_browse
+        # Enabled only when the checkbox is on AND a watermark image is set
+        self._img_wm_need_path = [self.wm_image_opacity_scale, reset_wm_place_button]
+        self._img_wm_labels = [wm_file_label, wm_opacity_label]
+
+
+
+        # Register the drop target that lives inside this tab. The tab is
+        # built lazily, so this already only runs once it is opened - and it
+        # has to happen at construction: Tk delivers no <Enter> crossing
+        # events during an external OS drag, so deferring to first hover
+        # would miss a user who opens the tab and immediately drags a file in.
+        if _tkdnd_available:
+            try:
+                self.wm_img_entry.drop_target_register(DND_FILES)
+                self.wm_img_entry.dnd_bind('<<Drop>>', self.handle_watermark_drop)
+            except Exception as e:
+                print(f"Error registering watermark drop target: {e}")
 
-        # --- Tab 5: Overlays ---
-        overlay_frame = ttk.Frame(self.processing_notebook, padding="10")
-        self.processing_notebook.add(overlay_frame, text=" Overlays ")
+    def _build_overlays_tab(self):
+        """Constructs the Overlays tab contents (deferred from init_ui)."""
+        overlay_frame = self._overlays_tab_frame
         overlay_frame.columnconfigure(0, weight=1) # Listbox expands
         overlay_frame.rowconfigure(1, weight=1) # Listbox expands
 
@@ -645,15 +1040,13 @@ class ImageMasterProApp:
         overlay_controls_frame.grid(row=0, column=0, columnspan=2, sticky="ew", pady=(0, 10))
         overlay_controls_frame.columnconfigure(1, weight=1) # Make slider expand
 
-        add_overlay_button = ttk.Button(overlay_controls_frame, text="Add Overlay", command=self.add_overlay_action)
-        add_overlay_button.grid(row=0, column=0, padx=2, pady=2)
-        ToolTip(add_overlay_button, "Browse for an image to add as a new overlay layer.")
+        self.add_overlay_button = ttk.Button(overlay_controls_frame, text="Add Overlay", command=self.add_overlay_action)
+        self.add_overlay_button.grid(row=0, column=0, padx=2, pady=2)
+        ToolTip(self.add_overlay_button, "Browse for an image to add as a new overlay layer.")
 
         ttk.Label(overlay_controls_frame, text="Opacity:").grid(row=0, column=1, padx=(10, 2), pady=2, sticky='e')
-        self.overlay_opacity_var = tk.IntVar(value=128) # Variable to link scale to selection
-        self.overlay_opacity_scale = ttk.Scale(overlay_controls_frame, from_=0, to=255, variable=self.overlay_opacity_var, orient=tk.HORIZONTAL, state=tk.DISABLED,
-                                               command=self.update_preview_debounced)
-        self.overlay_opacity_scale.bind("<ButtonRelease-1>", self.record_overlay_opacity_change) # Record for undo
+        self.overlay_opacity_scale = self._make_opacity_scale(overlay_controls_frame, self.overlay_opacity_var,
+                                                              self.record_overlay_opacity_change, state=tk.DISABLED)
         self.overlay_opacity_scale.grid(row=0, column=2, padx=(0, 5), pady=2, sticky='ew')
         ToolTip(self.overlay_opacity_scale, "Adjust opacity for the *selected* overlay.")
 
@@ -672,233 +1065,103 @@ class ImageMasterProApp:
         overlay_scrollbar.grid(row=0, column=1, sticky="ns")
         ToolTip(self.overlay_listbox, "List of overlays for the current image. Select one to edit, or drag & drop image files onto this list to add them.")
         self.overlay_listbox.bind("<<ListboxSelect>>", self.on_overlay_select)
-        # Add hover effect binding for overlay listbox
-        if _tkdnd_available:
-            self.overlay_listbox.bind("<Enter>", self.on_dnd_enter)
-            self.overlay_listbox.bind("<Leave>", self.on_dnd_leave)
-        # Add hover effect binding for overlay listbox
-        if _tkdnd_available:
-            self.overlay_listbox.bind("<Enter>", self.on_dnd_enter)
-            self.overlay_listbox.bind("<Leave>", self.on_dnd_leave)
-        # Add hover effect binding for overlay listbox
-        if _tkdnd_available:
-            self.overlay_listbox.bind("<Enter>", self.on_dnd_enter)
-            self.overlay_listbox.bind("<Leave>", self.on_dnd_leave)
-        ToolTip(self.overlay_listbox, "List of overlays for the current image. Select one to edit, or drag & drop image files onto this list to add them.")
+        # Hover feedback is bound alongside drop registration below, on the
+        # drag-only <<DropEnter>>/<<DropLeave>> events (bind once: duplicate
+        # bind() calls with the same handler stack, so each enter/leave would
+        # dispatch the callback multiple times)
 
 
         # Order/Remove Buttons Frame
         overlay_buttons_frame = ttk.Frame(overlay_frame)
         overlay_buttons_frame.grid(row=1, column=1, sticky="ns", padx=(5, 0))
 
-        overlay_up_button = ttk.Button(overlay_buttons_frame, text="▲", width=3, command=lambda: self.change_overlay_order_action("up"))
-        overlay_up_button.pack(pady=2)
-        ToolTip(overlay_up_button, "Move selected overlay up (render later/on top).")
-
-        overlay_down_button = ttk.Button(overlay_buttons_frame, text="▼", width=3, command=lambda: self.change_overlay_order_action("down"))
-        overlay_down_button.pack(pady=2)
-        ToolTip(overlay_down_button, "Move selected overlay down (render earlier/below).")
-
-        overlay_remove_button = ttk.Button(overlay_buttons_frame, text="X", width=3, command=self.remove_selected_overlay_action)
-        overlay_remove_button.pack(pady=(10,2))
-        ToolTip(overlay_remove_button, "Remove selected overlay.")
+        self.overlay_up_button = ttk.Button(overlay_buttons_frame, text="▲", width=3, command=lambda: self.change_overlay_order_action("up"))
+        self.overlay_up_button.pack(pady=2)
+        ToolTip(self.overlay_up_button, "Move selected overlay up (render later/on top).")
 
+        self.overlay_down_button = ttk.Button(overlay_buttons_frame, text="▼", width=3, command=lambda: self.change_overlay_order_action("down"))
+        self.overlay_down_button.pack(pady=2)
+        ToolTip(self.overlay_down_button, "Move selected overlay down (render earlier/below).")
 
-        # --- Right Preview Panel ---
-        preview_outer_frame = ttk.Frame(main_frame, padding=0) # No padding here
-        preview_outer_frame.grid(row=0, column=1, sticky="nsew", pady=0)
-        preview_outer_frame.rowconfigure(0, weight=1) # Canvas expands
-        preview_outer_frame.columnconfigure(0, weight=1) # Canvas expands
+        self.overlay_remove_button = ttk.Button(overlay_buttons_frame, text="X", width=3, command=self.remove_selected_overlay_action)
+        self.overlay_remove_button.pack(pady=(10,2))
+        ToolTip(self.overlay_remove_button, "Remove selected overlay.")
 
-        # Use a standard tk Frame for the canvas parent to avoid potential theme background issues
-        preview_canvas_frame = tk.Frame(preview_outer_frame, background="gray50")
-        preview_canvas_frame.grid(row=0, column=0, sticky="nsew")
-        preview_canvas_frame.rowconfigure(0, weight=1)
-        preview_canvas_frame.columnconfigure(0, weight=1)
 
-        self.preview_canvas = tk.Canvas(preview_canvas_frame, background="gray50", relief="sunken", borderwidth=1, highlightthickness=0)
-        self.preview_canvas.grid(row=0, column=0, sticky="nsew")
-        self.canvas_image_id = None # ID of the main image on canvas
 
-        # Bind Mouse Events
-        self.preview_canvas.bind("<Configure>", self.on_canvas_resize_debounced) # Handle window resize
-        self.preview_canvas.bind("<ButtonPress-1>", self.on_mouse_press)
-        self.preview_canvas.bind("<B1-Motion>", self.on_mouse_drag)
-        self.preview_canvas.bind("<ButtonRelease-1>", self.on_mouse_release)
-        # Zoom
-        if sys.platform == "darwin": # MacOS uses different binding for scroll wheel
-             self.preview_canvas.bind("<Command-MouseWheel>", self.on_mouse_wheel_zoom) # Cmd+Scroll
-             self.preview_canvas.bind("<Option-ButtonPress-1>", self.on_pan_press) # Option+Click for Pan Start
-             self.preview_canvas.bind("<Option-B1-Motion>", self.on_pan_drag)
-             self.preview_canvas.bind("<Option-ButtonRelease-1>", self.on_pan_release)
-        else: # Windows/Linux
-             self.preview_canvas.bind("<Control-MouseWheel>", self.on_mouse_wheel_zoom) # Ctrl+Scroll
-             self.preview_canvas.bind("<ButtonPress-2>", self.on_pan_press) # Middle Mouse for Pan Start
-             self.preview_canvas.bind("<B2-Motion>", self.on_pan_drag)
-             self.preview_canvas.bind("<ButtonRelease-2>", self.on_pan_release)
-
-        ToolTip(self.preview_canvas, "Image preview. Ctrl+Scroll=Zoom. MiddleClick/Alt+Drag=Pan. Drag=Select. Click/Drag Edits/Watermarks/Overlays.")
-
-        # Info/Zoom controls below canvas
-        preview_info_frame = ttk.Frame(preview_outer_frame, padding=(5, 2))
-        preview_info_frame.grid(row=1, column=0, sticky="ew")
-        preview_info_frame.columnconfigure(1, weight=1) # Let info label expand
-
-        self.image_info_label = ttk.Label(preview_info_frame, text="Load an image.", anchor=tk.W)
-        self.image_info_label.grid(row=0, column=1, sticky="ew", padx=(5,0))
-
-        self.zoom_label = ttk.Label(preview_info_frame, text="Zoom: 100%", style="Zoom.TLabel", anchor=tk.W)
-        self.zoom_label.grid(row=1, column=1, sticky="w", padx=(5,0))
-
-        zoom_button_frame = ttk.Frame(preview_info_frame)
-        zoom_button_frame.grid(row=0, column=0, rowspan=2, sticky="w") # Span 2 rows, align left
-
-        zoom_in_button = ttk.Button(zoom_button_frame, text="+", width=3, command=self.zoom_in)
-        zoom_in_button.pack(side=tk.LEFT, padx=1)
-        ToolTip(zoom_in_button, "Zoom In")
-        zoom_out_button = ttk.Button(zoom_button_frame, text="-", width=3, command=self.zoom_out)
-        zoom_out_button.pack(side=tk.LEFT, padx=1)
-        ToolTip(zoom_out_button, "Zoom Out")
-        zoom_fit_button = ttk.Button(zoom_button_frame, text="Fit", width=4, command=self.zoom_fit)
-        zoom_fit_button.pack(side=tk.LEFT, padx=1)
-        ToolTip(zoom_fit_button, "Fit Image to View")
-        zoom_100_button = ttk.Button(zoom_button_frame, text="100%", width=5, command=self.zoom_100)
-        zoom_100_button.pack(side=tk.LEFT, padx=1)
-        ToolTip(zoom_100_button, "Zoom to 100% (Actual Pixels)")
-
-
-        # --- Image List Notebook (Batch Mode) ---
-        self.image_notebook = ttk.Notebook(preview_outer_frame)
-        self.image_notebook.grid(row=2, column=0, sticky="nsew", pady=(10, 0))
-        preview_outer_frame.rowconfigure(2, weight=0) # Don't let notebook expand vertically excessively initially
-        self.image_notebook.bind("<<NotebookTabChanged>>", self.on_image_tab_change)
-        # Initially hidden if no images
-        self.image_notebook.grid_remove()
-
-        # --- Status Bar ---
-        status_frame = ttk.Frame(self.root, padding=(10, 5))
-        status_frame.grid(row=1, column=0, sticky="sew") # Span across bottom
-        status_frame.columnconfigure(0, weight=1)
-
-        self.status_label = ttk.Label(status_frame, text="Ready.", anchor=tk.W)
-        self.status_label.grid(row=0, column=0, sticky="ew")
-
-        self.progress_bar = ttk.Progressbar(status_frame, orient=tk.HORIZONTAL, mode='determinate')
-        self.progress_bar.grid(row=0, column=1, sticky="ew", padx=(10, 0))
-
-        # --- Bind Undo/Redo Keys ---
-        self.root.bind_all("<Control-z>", self.undo)
-        self.root.bind_all("<Control-y>", self.redo)
-        # MacOS specific Ctrl+Shift+Z for redo might be needed? Testing required.
-        if sys.platform == "darwin":
-            self.root.bind_all("<Command-z>", self.undo)
-            self.root.bind_all("<Command-Shift-z>", self.redo) # Cmd+Shift+Z is common Mac redo
-
-        # --- Register Additional Drop Targets ---
+        # Register the drop target that lives inside this tab at construction
+        # (see the watermark tab: crossing events don't fire during OS drags,
+        # so hover-deferred registration would miss immediate drops)
         if _tkdnd_available:
             try:
-                # Watermark Entry Drop Target
-                self.wm_img_entry.drop_target_register(DND_FILES)
-                self.wm_img_entry.dnd_bind('<<Drop>>', self.handle_watermark_drop)
-
-                # Overlay Listbox Drop Target
                 self.overlay_listbox.drop_target_register(DND_FILES)
                 self.overlay_listbox.dnd_bind('<<Drop>>', self.handle_overlay_drop)
+                self.overlay_listbox.dnd_bind('<<DropEnter>>', self.on_dnd_enter)
+                self.overlay_listbox.dnd_bind('<<DropLeave>>', self.on_dnd_leave)
+                self.overlay_listbox.dnd_bind('<<Drop>>', self.on_dnd_leave, add='+') # Un-highlight after drop
             except Exception as e:
-                print(f"Error registering additional drop targets: {e}")
+                print(f"Error registering overlay drop target: {e}")
+        # Sync the listbox with the current image's overlays
+        self._update_overlay_listbox()
 
     # --- Drag and Drop UI Feedback (Generalized) ---
     def on_dnd_enter(self, event):
-        """Change background and cursor on entering ANY DND-enabled widget."""
+        """Set the 'active' ttk state and cursor when a drag enters a DND widget.
+
+        Bound to <<DropEnter>>, so this only runs during an actual
+        drag-and-drop — ordinary mouse traversal never reaches it.
+        Hover colors come from the DND.TLabel style map set up in init_style,
+        so Tk's theme engine repaints the widget itself - no saving/restoring
+        of backgrounds in Python.
+        """
         if not _tkdnd_available:
             return
         widget = event.widget
         try:
-            # Ensure widget exists
-            if not widget.winfo_exists():
-                return
+            # No winfo_exists() pre-check: that's a Tcl round-trip per hover,
+            # and a destroyed widget just raises TclError (caught below)
 
-            # Store original background if not already stored for this widget
-            widget_id = str(widget)
-            if widget_id not in self._original_widget_bgs:
-                 # Use actual current background, handling potential errors
-                 try:
-                     current_bg = widget.cget("background")
-                     self._original_widget_bgs[widget_id] = current_bg
-                 except tk.TclError:
-                     # Fallback if cget fails (e.g., some complex widgets like Listbox)
-                     # For Listbox, background might be style-dependent or default.
-                     # Using a generic fallback is safer than potentially erroring.
-                     self._original_widget_bgs[widget_id] = "SystemWindow" # A common listbox bg
-
-            # Apply hover effect
-            # Use try-except for config as some widgets might not support 'background' directly
+            # Flip the ttk state; classic Tk widgets (Listbox) only get the cursor
             try:
-                widget.config(background="#E0E8F0") # Light blueish background
-            except tk.TclError:
-                 # Ignore if background config fails (e.g., for Listbox which uses styles)
-                 pass
+                widget.state(["active"])
+            except (tk.TclError, AttributeError):
+                pass
             widget.config(cursor="plus") # Set cursor
 
-            # Special handling for the main DND frame/label pair
-            if widget == self.dnd_label:
-                if hasattr(self, 'drag_drop_frame') and self.drag_drop_frame.winfo_exists():
-                    self.drag_drop_frame.config(cursor="plus")
-            elif widget == self.drag_drop_frame:
-                 # Also change label bg/cursor if hovering over frame
-                 if hasattr(self, 'dnd_label') and self.dnd_label.winfo_exists():
-                     label_id = str(self.dnd_label)
-                     if label_id not in self._original_widget_bgs:
-                         try:
-                             self._original_widget_bgs[label_id] = self.dnd_label.cget("background")
-                         except tk.TclError:
-                             self._original_widget_bgs[label_id] = "SystemButtonFace"
-                     try: # Protect label config too
-                         self.dnd_label.config(background="#E0E8F0", cursor="plus")
-                     except tk.TclError: pass
-
+            # Paired widget (frame/label) styled via attribute lookup, not identity checks
+            companion = getattr(widget, "_dnd_companion", None)
+            if companion is not None:
+                 try:
+                     companion.state(["active"])
+                     companion.config(cursor="plus")
+                 except (tk.TclError, AttributeError): pass
 
         except (tk.TclError, AttributeError): # Widget might be destroyed or lack config method
             pass
 
     def on_dnd_leave(self, event):
-        """Revert background and cursor on leaving ANY DND-enabled widget."""
+        """Clear the 'active' ttk state and cursor on leaving a DND-enabled widget."""
         if not _tkdnd_available:
             return
         widget = event.widget
         try:
-            # Ensure widget exists
-            if not widget.winfo_exists():
-                return
-
-            # Retrieve original background
-            widget_id = str(widget)
-            # Use a more specific fallback if available, else generic
-            default_bg = "SystemWindow" if isinstance(widget, tk.Listbox) else "SystemButtonFace"
-            original_bg = self._original_widget_bgs.get(widget_id, default_bg)
+            # As in on_dnd_enter: skip winfo_exists(), trust the TclError catch
 
-            # Revert effect
             try:
-                widget.config(background=original_bg)
-            except tk.TclError:
-                 # Ignore if background config fails
-                 pass
+                widget.state(["!active"])
+            except (tk.TclError, AttributeError):
+                pass
             widget.config(cursor="") # Revert cursor
 
-            # Special handling for the main DND frame/label pair
-            if widget == self.dnd_label:
-                 if hasattr(self, 'drag_drop_frame') and self.drag_drop_frame.winfo_exists():
-                    self.drag_drop_frame.config(cursor="")
-            elif widget == self.drag_drop_frame:
-                 # Also revert label bg/cursor if leaving frame
-                 if hasattr(self, 'dnd_label') and self.dnd_label.winfo_exists():
-                     label_id = str(self.dnd_label)
-                     original_label_bg = self._original_widget_bgs.get(label_id, "SystemButtonFace")
-                     try: # Protect label config
-                         self.dnd_label.config(background=original_label_bg, cursor="")
-                     except tk.TclError: pass
-
-        except (tk.TclError, AttributeError, KeyError): # Widget might be destroyed or lack config
+            # Paired widget (frame/label) reverted via attribute lookup
+            companion = getattr(widget, "_dnd_companion", None)
+            if companion is not None:
+                 try:
+                     companion.state(["!active"])
+                     companion.config(cursor="")
+                 except (tk.TclError, AttributeError): pass
+
+        except (tk.TclError, AttributeError): # Widget might be destroyed or lack config
              pass
     # --- End Drag and Drop UI Feedback ---
 
@@ -907,12 +1170,59 @@ class ImageMasterProApp:
     # --- UI Update & Validation ---
 
     def _get_current_image_setting(self, key, default=None):
-        """Safely get a setting for the current image."""
-        if self.current_image_path and self.current_image_path in self.image_settings:
-            return self.image_settings[self.current_image_path].get(key, default)
+        """Safely get a setting for the current image.
+
+        Runs on every widget-state refresh, so it reads the cached
+        _current_settings reference (kept in sync wherever
+        current_image_path changes) instead of re-hashing the path twice.
+        """
+        if self._current_settings is not None:
+            return self._current_settings.get(key, default)
         return default
 
+    def _new_element_id(self):
+        """Returns a unique ID for a new overlay/edit area (syscall-free)."""
+        return f"{self._id_prefix}-{next(self._next_element_id)}"
+
+    def _set_state(self, widget, state):
+        """Applies a widget state only if it differs from the last one applied.
+
+        Tk performs a full option update (and possible redraw) on every
+        config(state=...), changed or not. Diffing against a per-widget map
+        turns the typical refresh - where one or two widgets actually change -
+        from dozens of Tcl calls into a couple. All state changes must go
+        through here so the map stays accurate.
+        """
+        wid = str(widget)
+        if self._last_states.get(wid) != state:
+            widget.config(state=state)
+            self._last_states[wid] = state
+
     def update_widget_states(self, processing=False):
+        """Requests a widget-state refresh, coalesced to one sweep per idle cycle.
+
+        The actual sweep (_do_update_widget_states) issues dozens of Tcl calls;
+        action handlers often request it several times back-to-back (load +
+        selection change + undo-button refresh). Callers just mark the UI dirty
+        here; a single after_idle flush performs one sweep with the latest
+        state. A processing=True request is sticky for the burst so a
+        conversion lock can't be lost to a later unrelated request.
+        """
+        self._ui_pending_processing = self._ui_pending_processing or processing
+        if self._ui_state_job is None:
+            self._ui_state_job = self.root.after_idle(self._flush_ui_state)
+
+    def _flush_ui_state(self):
+        """Runs the coalesced widget-state sweep (incl. undo/redo buttons)."""
+        self._ui_state_job = None
+        processing = self._ui_pending_processing
+        self._ui_pending_processing = False
+        self._do_update_widget_states(processing)
+        # Fold the undo/redo button refresh into the same idle pass; the
+        # _set_state diff makes this free when nothing changed
+        self.update_undo_redo_buttons()
+
+    def _do_update_widget_states(self, processing=False):
         """Enable/disable widgets based on application state."""
         try:
             is_image_loaded = bool(self.rotated_flipped_image) # Base check on rotated/flipped image existence
@@ -929,20 +1239,20 @@ class ImageMasterProApp:
             process_lock_state = tk.NORMAL if not processing else tk.DISABLED # For things locked during conversion
 
             # --- File/Output Widgets ---
-            self.filename_entry.config(state=img_state)
-            self.output_dir_button.config(state=process_lock_state)
-            self.browse_button.config(state=process_lock_state) # Now self.browse_button exists
+            self._set_state(self.filename_entry, img_state)
+            self._set_state(self.output_dir_button, process_lock_state)
+            self._set_state(self.browse_button, process_lock_state) # Now self.browse_button exists
             # DnD Label State
             dnd_state = tk.NORMAL if _tkdnd_available and not processing else tk.DISABLED
             if hasattr(self, 'dnd_label'):
-                try: self.dnd_label.config(state=dnd_state)
+                try: self._set_state(self.dnd_label, dnd_state)
                 except: pass
 
             # --- Action Buttons ---
-            self.convert_one_button.config(state=img_state)
-            self.convert_all_button.config(state=tk.NORMAL if not is_single_image and is_image_loaded and not processing else tk.DISABLED)
-            self.reset_button.config(state=process_lock_state)
-            self.save_preset_button.config(state=process_lock_state)
+            self._set_state(self.convert_one_button, img_state)
+            self._set_state(self.convert_all_button, tk.NORMAL if not is_single_image and is_image_loaded and not processing else tk.DISABLED)
+            self._set_state(self.reset_button, process_lock_state)
+            self._set_state(self.save_preset_button, process_lock_state)
             # Undo/Redo state updated separately by update_undo_redo_buttons()
 
             # Theme Menu
@@ -950,128 +1260,96 @@ class ImageMasterProApp:
             if hasattr(self, 'theme_menu') and self.theme_menu.cget('state') == 'disabled':
                  theme_menu_state = 'disabled' # Keep disabled if themes failed initially
             if hasattr(self, 'theme_menu'):
-                self.theme_menu.config(state=theme_menu_state)
+                self._set_state(self.theme_menu, theme_menu_state)
 
 
             # --- Processing Notebook Tabs ---
             # Tab: General
-            self.preset_menu.config(state=img_state)
-            self.format_menu.config(state=img_state)
-            self.quality_entry.config(state=tk.NORMAL if is_jpeg_or_webp and img_state == tk.NORMAL else tk.DISABLED)
-            self.quality_label.config(state=tk.NORMAL if is_jpeg_or_webp and img_state == tk.NORMAL else tk.DISABLED)
+            self._set_state(self.preset_menu, img_state)
+            self._set_state(self.format_menu, img_state)
+            self._set_state(self.quality_entry, tk.NORMAL if is_jpeg_or_webp and img_state == tk.NORMAL else tk.DISABLED)
+            self._set_state(self.quality_label, tk.NORMAL if is_jpeg_or_webp and img_state == tk.NORMAL else tk.DISABLED)
             resize_state = tk.NORMAL if not is_preset_active and img_state == tk.NORMAL else tk.DISABLED
-            self.resize_width_entry.config(state=resize_state)
-            self.resize_height_entry.config(state=resize_state)
-            self.resize_info_label.config(state=resize_state)
-            self.filter_menu.config(state=img_state)
-            self.rotate_ccw_button.config(state=img_state)
-            self.rotate_cw_button.config(state=img_state)
-            self.flip_h_button.config(state=img_state)
-            self.flip_v_button.config(state=img_state)
-
-            # Tab: Adjustments
-            for widget in self.root.nametowidget(self.processing_notebook.tabs()[1]).winfo_children(): # Adjustments Frame
-                 try: widget.config(state=img_state)
+            self._set_state(self.resize_width_entry, resize_state)
+            self._set_state(self.resize_height_entry, resize_state)
+            self._set_state(self.resize_info_label, resize_state)
+            self._set_state(self.filter_menu, img_state)
+            self._set_state(self.rotate_ccw_button, img_state)
+            self._set_state(self.rotate_cw_button, img_state)
+            self._set_state(self.flip_h_button, img_state)
+            self._set_state(self.flip_v_button, img_state)
+
+            # Tab: Adjustments (widget list cached at construction)
+            for widget in self._adjust_tab_widgets:
+                 try: self._set_state(widget, img_state)
                  except tk.TclError: pass # Skip non-state widgets like labels
 
             # Tab: Edits
             has_manual_edits = bool(self._get_current_image_setting('blur_areas', []) or self._get_current_image_setting('blackout_areas', []))
-            self.blur_area_button.config(state=img_state if self.current_selection_original else tk.DISABLED)
-            self.blackout_area_button.config(state=img_state if self.current_selection_original else tk.DISABLED)
-            self.clear_areas_button.config(state=img_state if has_manual_edits else tk.DISABLED)
-            self.edit_remove_button.config(state=img_state if is_edit_area_selected else tk.DISABLED)
+            self._set_state(self.blur_area_button, img_state if self.current_selection_original else tk.DISABLED)
+            self._set_state(self.blackout_area_button, img_state if self.current_selection_original else tk.DISABLED)
+            self._set_state(self.clear_areas_button, img_state if has_manual_edits else tk.DISABLED)
+            self._set_state(self.edit_remove_button, img_state if is_edit_area_selected else tk.DISABLED)
             # Radiobuttons and blur scale should follow img_state
-            edits_tab_frame = self.root.nametowidget(self.processing_notebook.tabs()[2])
-            for child in edits_tab_frame.winfo_children():
-                 if isinstance(child, ttk.Frame): # Shape, Blur, Blackout frames
-                     for sub_child in child.winfo_children():
-                          try: # Radiobuttons, Scales, Labels, Buttons inside frames
-                              if sub_child not in [self.blur_area_button, self.blackout_area_button]: # Already handled
-                                   sub_child.config(state=img_state)
-                          except tk.TclError: pass
-                 # Handle direct children like remove/clear buttons (already done above)
+            # (flat list cached at construction, Add-Area buttons pre-excluded)
+            for sub_child in self._edits_follow_img_state:
+                 try: # Radiobuttons, Scales, Labels inside frames
+                     self._set_state(sub_child, img_state)
+                 except tk.TclError: pass
+            # Direct children like remove/clear buttons already handled above
 
             # Tab: Watermarks
             # Text WM (Global controls enabled if image loaded)
-            text_wm_frame = self.root.nametowidget(self.processing_notebook.tabs()[3]).winfo_children()[0] # text_wm_subframe
             text_wm_check_state = self.use_text_watermark.get()
-            for widget in text_wm_frame.winfo_children():
-                 try:
-                      if isinstance(widget, ttk.Checkbutton): widget.config(state=img_state)
-                      else: widget.config(state=img_state if text_wm_check_state else tk.DISABLED)
+            if self._text_wm_check is not None:
+                self._set_state(self._text_wm_check, img_state)
+            text_wm_state = img_state if text_wm_check_state else tk.DISABLED
+            for widget in self._text_wm_widgets: # Cached at construction (checkbox excluded)
+                 try: self._set_state(widget, text_wm_state)
                  except tk.TclError: pass
 
             # Image WM (Per-image controls)
-            img_wm_frame = self.root.nametowidget(self.processing_notebook.tabs()[3]).winfo_children()[1] # image_wm_subframe
             img_wm_check_state = self.use_image_watermark.get()
             # Check the GLOBAL watermark info for a path
             has_img_wm_path = bool(self.wm_img_info.get('path'))
             # Determine base state for WM controls (enabled only if not processing)
             wm_base_state = tk.NORMAL if not processing else tk.DISABLED
 
-            for widget in img_wm_frame.winfo_children():
-                 try:
-                      if isinstance(widget, ttk.Checkbutton):
-                          # Checkbox always enabled unless processing
-                          widget.config(state=wm_base_state)
-                      elif isinstance(widget, ttk.Button) and "Browse" in widget.cget("text"):
-                          # Browse enabled if checkbox checked (and not processing)
-                          # Browse button should always be enabled unless processing
-                          widget.config(state=wm_base_state)
-                      elif isinstance(widget, ttk.Button) and "Reset" in widget.cget("text"):
-                           # Reset enabled if checkbox checked AND path exists (and not processing)
-                           widget.config(state=wm_base_state if img_wm_check_state and has_img_wm_path else tk.DISABLED)
-                      elif isinstance(widget, ttk.Scale): # Opacity scale
-                           # Opacity enabled if checkbox checked AND path exists (and not processing)
-                           widget.config(state=wm_base_state if img_wm_check_state and has_img_wm_path else tk.DISABLED)
-                      elif isinstance(widget, ttk.Entry): # Path entry
-                           # Path entry enabled (readonly) if checkbox checked (and not processing)
-                           widget.config(state="readonly" if wm_base_state == tk.NORMAL and img_wm_check_state else tk.DISABLED)
-                      else: # Labels
-                           # Labels enabled if checkbox checked (and not processing)
-                           widget.config(state=wm_base_state if img_wm_check_state else tk.DISABLED)
-                 except tk.TclError: pass
-
-            # Tab: Overlays
-            overlays_tab_frame = self.root.nametowidget(self.processing_notebook.tabs()[4])
-            has_overlays = bool(self._get_current_image_setting('overlays', []))
-            # Find specific controls by checking text/type
-            add_overlay_button = None
-            overlay_up_button = None
-            overlay_down_button = None
-            overlay_remove_button = None
-
-            for child in overlays_tab_frame.winfo_children():
-                if isinstance(child, ttk.Frame): # Top control frame or button frame
-                    for sub_child in child.winfo_children():
-                        if isinstance(sub_child, ttk.Button) and "Add Overlay" in sub_child.cget("text"):
-                            add_overlay_button = sub_child
-                        elif isinstance(sub_child, ttk.Scale): # Opacity scale already handled (self.overlay_opacity_scale)
-                            pass
-                elif isinstance(child, ttk.Frame): # Side button frame
-                     for sub_child in child.winfo_children():
-                        if isinstance(sub_child, ttk.Button):
-                            if "▲" in sub_child.cget("text"): overlay_up_button = sub_child
-                            elif "▼" in sub_child.cget("text"): overlay_down_button = sub_child
-                            elif "X" in sub_child.cget("text"): overlay_remove_button = sub_child
-
-            if add_overlay_button: add_overlay_button.config(state=img_state)
-            # Opacity scale enabled only if an overlay is selected
-            self.overlay_opacity_scale.config(state=img_state if is_overlay_selected else tk.DISABLED)
-            # Layer/Remove buttons enabled only if an overlay is selected
-            if overlay_up_button: overlay_up_button.config(state=img_state if is_overlay_selected else tk.DISABLED)
-            if overlay_down_button: overlay_down_button.config(state=img_state if is_overlay_selected else tk.DISABLED)
-            if overlay_remove_button: overlay_remove_button.config(state=img_state if is_overlay_selected else tk.DISABLED)
-            # Listbox itself enabled if image loaded
-            self.overlay_listbox.config(state=img_state)
-
-
-            # Preview Zoom Buttons
-            for widget in self.zoom_label.master.winfo_children(): # Get frame containing zoom buttons/label
-                if isinstance(widget, ttk.Frame): # The button frame
-                    for button in widget.winfo_children():
-                         try: button.config(state=img_state)
-                         except: pass
+            # Widgets classified by role at construction - straight-line states
+            if self._img_wm_check is not None:
+                # Checkbox and Browse always enabled unless processing
+                self._set_state(self._img_wm_check, wm_base_state)
+                self._set_state(self._img_wm_browse, wm_base_state)
+                # Reset/opacity need checkbox checked AND a path (and not processing)
+                need_path_state = wm_base_state if img_wm_check_state and has_img_wm_path else tk.DISABLED
+                for widget in self._img_wm_need_path:
+                    self._set_state(widget, need_path_state)
+                # Path entry enabled (readonly) if checkbox checked (and not processing)
+                self._set_state(self.wm_img_entry,
+                                "readonly" if wm_base_state == tk.NORMAL and img_wm_check_state else tk.DISABLED)
+                # Labels enabled if checkbox checked (and not processing)
+                label_state = wm_base_state if img_wm_check_state else tk.DISABLED
+                for widget in self._img_wm_labels:
+                    self._set_state(widget, label_state)
+
+            # Tab: Overlays (skipped until lazily built on first visit)
+            if hasattr(self, 'overlay_listbox'):
+                # Buttons assigned to attributes at construction - no tree scan
+                self._set_state(self.add_overlay_button, img_state)
+                # Opacity scale and layer/remove buttons enabled only if an overlay is selected
+                sel_state = img_state if is_overlay_selected else tk.DISABLED
+                self._set_state(self.overlay_opacity_scale, sel_state)
+                self._set_state(self.overlay_up_button, sel_state)
+                self._set_state(self.overlay_down_button, sel_state)
+                self._set_state(self.overlay_remove_button, sel_state)
+                # Listbox itself enabled if image loaded
+                self._set_state(self.overlay_listbox, img_state)
+
+
+            # Preview Zoom Buttons (captured at construction; all ttk.Buttons,
+            # so no per-widget try/except is needed)
+            for button in self._zoom_buttons:
+                 self._set_state(button, img_state)
 
 
         except Exception as e:
@@ -1082,9 +1360,9 @@ class ImageMasterProApp:
     def update_undo_redo_buttons(self):
         """Updates the state of Undo/Redo buttons based on current stacks."""
         if hasattr(self, 'undo_button'): # Ensure buttons exist
-             self.undo_button.config(state=tk.NORMAL if self.current_undo_stack else tk.DISABLED)
+             self._set_state(self.undo_button, tk.NORMAL if self.current_undo_stack else tk.DISABLED)
         if hasattr(self, 'redo_button'):
-             self.redo_button.config(state=tk.NORMAL if self.current_redo_stack else tk.DISABLED)
+             self._set_state(self.redo_button, tk.NORMAL if self.current_redo_stack else tk.DISABLED)
 
     def validate_quality(self, value_if_allowed):
         if value_if_allowed == "": return True
@@ -1112,12 +1390,14 @@ class ImageMasterProApp:
         print(f"Attempting to change theme to: {new_theme}")
         try:
             self.themed_style.theme_use(new_theme)
-            # Force redraw/update of all widgets
-            self.root.update_idletasks()
-            # Re-apply styles that might be theme-dependent
-            self.themed_style.configure("DND.TLabel", padding=5)
-            self.themed_style.configure("Zoom.TLabel", padding=(0, 5), font=("Segoe UI", 8))
-            self.themed_style.configure("Header.TLabel", font=("Segoe UI", 9, "bold"))
+            # Re-apply styles that might be theme-dependent, before Tk's next
+            # natural redraw so the switch settles in a single layout pass
+            # (no forced update_idletasks in between)
+            self._apply_custom_styles()
+            # Theme swap rebuilds widget options, so the no-op filter in
+            # _set_state must forget its last-applied states and re-push them
+            self._last_states.clear()
+            self.update_widget_states()
             self.status_label.config(text=f"Theme changed to {new_theme}.")
             print(f"Theme successfully changed to {new_theme}")
         except Exception as e:
@@ -1127,9 +1407,7 @@ class ImageMasterProApp:
                  self.themed_style.theme_use(current_theme)
                  self.theme_var.set(current_theme)
                  # Re-apply styles for the reverted theme
-                 self.themed_style.configure("DND.TLabel", padding=5)
-                 self.themed_style.configure("Zoom.TLabel", padding=(0, 5), font=("Segoe UI", 8))
-                 self.themed_style.configure("Header.TLabel", font=("Segoe UI", 9, "bold"))
+                 self._apply_custom_styles()
             except Exception as revert_e:
                  print(f"Failed to revert theme: {revert_e}. Trying 'clam'.")
                  try:
@@ -1140,47 +1418,55 @@ class ImageMasterProApp:
 
 
     # --- File Handling ---
+    def _parse_drop_paths(self, raw_data):
+        """Parses a tkdnd drop payload into a list of file paths.
+
+        Tries paths enclosed in curly braces first (tkdnd's quoting for paths
+        with spaces), then tk.splitlist, then the raw data as a single path,
+        with a whitespace split as last resort. Shared by all drop handlers.
+        The last payload/result pair is cached: re-dropping the same files
+        (or a handler chain seeing the same event data) skips the reparse.
+        """
+        if raw_data == self._last_drop_parse[0]:
+            return list(self._last_drop_parse[1]) # Copy - callers may mutate
+        # This pattern finds text between the outermost curly braces.
+        # It handles multiple {path} {path} occurrences.
+        brace_matches = self._DND_BRACE_RE.findall(raw_data)
+        if brace_matches:
+            # If braces are found, assume each match is a path
+            files = [match.strip() for match in brace_matches if match.strip()]
+            print(f"Parsed {len(files)} paths using regex (braces): {files}")
+            self._last_drop_parse = (raw_data, files)
+            return list(files)
+        # Fallback to splitlist if no braces found or pattern doesn't match expected format
+        try:
+            files_raw = self.root.tk.splitlist(raw_data)
+            # Clean paths: strip whitespace and remove potential empty strings
+            files = [f.strip() for f in files_raw if f.strip()]
+            if files:
+                print(f"Parsed {len(files)} paths using splitlist: {files}")
+            else:
+                # If splitlist gives nothing, maybe it's a single path without braces/spaces?
+                single_path = raw_data.strip()
+                # Avoid adding empty strings if raw_data itself was just whitespace
+                if single_path:
+                    files = [single_path]
+                    print(f"Parsed 1 path using direct data (fallback): {files}")
+        except Exception as split_err:
+            print(f"Error using splitlist on data: {raw_data}. Error: {split_err}")
+            # As a last resort, try a simple split (less reliable for paths with spaces)
+            files = [f.strip() for f in raw_data.split() if f.strip()]
+            print(f"Parsed {len(files)} paths using simple split (last resort): {files}")
+        self._last_drop_parse = (raw_data, files)
+        return list(files)
+
     def handle_drop(self, event):
         if not _tkdnd_available:
             messagebox.showinfo("Drag and Drop Disabled", "Drag and Drop is disabled.")
             return
 
         try:
-            raw_data = event.data
-            # --- New Path Parsing Logic ---
-            files = []
-            # Try regex to find paths enclosed in curly braces first
-            # This pattern finds text between the outermost curly braces.
-            # It handles multiple {path} {path} occurrences.
-            brace_matches = re.findall(r'\{([^{}]+)\}', raw_data)
-            if brace_matches:
-                # If braces are found, assume each match is a path
-                files = [match.strip() for match in brace_matches if match.strip()]
-                print(f"Parsed {len(files)} paths using regex (braces): {files}")
-            else:
-                # Fallback to splitlist if no braces found or pattern doesn't match expected format
-                try:
-                    # Use splitlist as the primary fallback
-                    files_raw = self.root.tk.splitlist(raw_data)
-                    # Clean paths: strip whitespace and remove potential empty strings
-                    files = [f.strip() for f in files_raw if f.strip()]
-                    if files:
-                         print(f"Parsed {len(files)} paths using splitlist: {files}")
-                    else:
-                         # If splitlist gives nothing, maybe it's a single path without braces/spaces?
-                         single_path = raw_data.strip()
-                         # Avoid adding empty strings if raw_data itself was just whitespace
-                         if single_path:
-                             files = [single_path]
-                             print(f"Parsed 1 path using direct data (fallback): {files}")
-
-                except Exception as split_err:
-                    print(f"Error using splitlist on data: {raw_data}. Error: {split_err}")
-                    # As a last resort, try a simple split (less reliable for paths with spaces)
-                    files = [f.strip() for f in raw_data.split() if f.strip()]
-                    print(f"Parsed {len(files)} paths using simple split (last resort): {files}")
-
-            # --- End New Path Parsing Logic ---
+            files = self._parse_drop_paths(event.data)
 
             if not files:
                 messagebox.showwarning("Drop Error", "Could not identify valid file paths from dropped data.")
@@ -1192,25 +1478,25 @@ class ImageMasterProApp:
             processed_paths = set(self.image_list) # Track existing
 
             for item_path in files:
-                if not os.path.exists(item_path): continue
                 item_path = os.path.normpath(item_path)
                 if item_path in processed_paths: continue
 
-                if os.path.isfile(item_path) and self._is_image_file(item_path):
+                # isfile/isdir are False for nonexistent paths, so no separate
+                # os.path.exists stat is needed (one stat per item instead of three)
+                if self._is_image_file(item_path) and os.path.isfile(item_path):
                     if item_path not in processed_paths:
                         newly_added_files.append(item_path)
                         processed_paths.add(item_path)
                 elif os.path.isdir(item_path):
                     processed_paths.add(item_path)
                     try:
-                        for root_dir, _, filenames in os.walk(item_path):
-                            for filename in filenames:
-                                full_path = os.path.normpath(os.path.join(root_dir, filename))
-                                if full_path not in processed_paths and self._is_image_file(full_path):
-                                    newly_added_files.append(full_path)
-                                    processed_paths.add(full_path)
-                    except OSError as oe:
-                        messagebox.showwarning("Directory Error", f"Could not fully read directory:\n{item_path}\n\n{oe}")
+                        # Streamed scandir recursion; paths are normalized
+                        # only for actual matches
+                        for image_path in self._iter_images_under(item_path):
+                            full_path = os.path.normpath(image_path)
+                            if full_path not in processed_paths:
+                                newly_added_files.append(full_path)
+                                processed_paths.add(full_path)
                     except Exception as walk_e: print(f"Error walking directory '{item_path}': {walk_e}")
 
             if newly_added_files:
@@ -1256,23 +1542,8 @@ class ImageMasterProApp:
         if not _tkdnd_available: return
         print("Watermark drop detected.")
         try:
-            # --- Use the same robust path parsing logic as handle_drop ---
-            raw_data = event.data
-            files = []
-            brace_matches = re.findall(r'\{([^{}]+)\}', raw_data)
-            if brace_matches:
-                files = [match.strip() for match in brace_matches if match.strip()]
-            else:
-                try:
-                    files_raw = self.root.tk.splitlist(raw_data)
-                    files = [f.strip() for f in files_raw if f.strip()]
-                    if not files:
-                         single_path = raw_data.strip()
-                         if single_path: files = [single_path]
-                except Exception as split_err:
-                    print(f"Error using splitlist for watermark drop: {split_err}")
-                    files = [f.strip() for f in raw_data.split() if f.strip()]
-
+            # Same robust path parsing as handle_drop, shared helper
+            files = self._parse_drop_paths(event.data)
             if not files:
                  messagebox.showwarning("Drop Error", "Could not parse file path from dropped item.")
                  return
@@ -1306,23 +1577,8 @@ class ImageMasterProApp:
              return
         print("Overlay drop detected.")
         try:
-            # --- Use the same robust path parsing logic as handle_drop ---
-            raw_data = event.data
-            files = []
-            brace_matches = re.findall(r'\{([^{}]+)\}', raw_data)
-            if brace_matches:
-                files = [match.strip() for match in brace_matches if match.strip()]
-            else:
-                try:
-                    files_raw = self.root.tk.splitlist(raw_data)
-                    files = [f.strip() for f in files_raw if f.strip()]
-                    if not files:
-                         single_path = raw_data.strip()
-                         if single_path: files = [single_path]
-                except Exception as split_err:
-                    print(f"Error using splitlist for overlay drop: {split_err}")
-                    files = [f.strip() for f in raw_data.split() if f.strip()]
-
+            # Same robust path parsing as handle_drop, shared helper
+            files = self._parse_drop_paths(event.data)
             if not files:
                  messagebox.showwarning("Drop Error", "Could not parse file paths from dropped items.")
                  return
@@ -1386,20 +1642,37 @@ class ImageMasterProApp:
         except (tk.TclError, AttributeError):
              pass # No selection or notebook not ready
 
-        for tab_id in self.image_notebook.tabs():
-             try: self.image_notebook.forget(tab_id)
-             except: pass # Ignore errors during potential rapid updates
+        # Unmap the notebook while churning tabs: each forget/add triggers
+        # Tcl-side geometry recomputation, and on an unmapped widget those
+        # collapse into the single layout pass when it is re-gridded below
+        self.image_notebook.grid_remove()
+
+        # Reuse pooled dummy frames instead of creating one ttk.Frame per
+        # image on every rebuild (each widget costs a Tcl object, path name
+        # and option-DB lookup, and the old ones were simply leaked). Tabs
+        # already present just get their text reconfigured; only the delta
+        # is added/forgotten. Pool frames are never destroyed.
+        existing_tabs = self.image_notebook.tabs()
+        while len(self._tab_frame_pool) < len(self.image_list):
+            self._tab_frame_pool.append(ttk.Frame(self.image_notebook))
 
-        # Add new tabs
         for i, img_path in enumerate(self.image_list):
             filename = os.path.basename(img_path)
-            tab_frame = ttk.Frame(self.image_notebook) # Dummy frame
-            # Store index, path retrieved later
-            self.image_notebook.add(tab_frame, text=f"{i+1}: {filename[:25]}{'...' if len(filename)>25 else ''}", padding=2) # Truncate long names
+            tab_text = f"{i+1}: {filename[:25]}{'...' if len(filename)>25 else ''}" # Truncate long names
+            if i < len(existing_tabs):
+                try:
+                    self.image_notebook.tab(i, text=tab_text)
+                    continue
+                except tk.TclError: pass # Fall through to add
+            self.image_notebook.add(self._tab_frame_pool[i], text=tab_text, padding=2)
+
+        # Forget excess tabs (list shrank); frames stay pooled for next growth
+        for tab_id in reversed(existing_tabs[len(self.image_list):]):
+             try: self.image_notebook.forget(tab_id)
+             except: pass # Ignore errors during potential rapid updates
 
         # Show/hide notebook
         if not self.image_list:
-            self.image_notebook.grid_remove()
             self.clear_state() # Clear preview etc. if list is now empty
         else:
             self.image_notebook.grid()
@@ -1454,29 +1727,124 @@ class ImageMasterProApp:
 
         # 3. Update states (already done in load_image_for_preview)
 
+    def _iter_images_under(self, root_dir):
+        """Yields paths of image files under root_dir (recursive, streaming).
+
+        Explicit os.scandir recursion: extension is checked on entry.name
+        before any path string is built, entry.is_file() reuses the cached
+        stat data, and unreadable subdirectories are skipped rather than
+        aborting the whole walk.
+        """
+        extensions = self.IMAGE_EXTENSIONS_NO_DOT
+        dirs_to_scan = [root_dir]
+        while dirs_to_scan:
+            current_dir = dirs_to_scan.pop()
+            try:
+                entries = os.scandir(current_dir)
+            except OSError as oe:
+                print(f"Skipping unreadable directory '{current_dir}': {oe}")
+                continue
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            dirs_to_scan.append(entry.path)
+                        elif entry.name.rpartition('.')[2].lower() in extensions and entry.is_file():
+                            yield entry.path
+                    except OSError:
+                        continue # Broken symlink or race; skip the entry
+
     def _is_image_file(self, filepath):
-        if not isinstance(filepath, str): return False
-        try:
-            ext = os.path.splitext(filepath)[1].lower()
-            # Added more formats just in case
-            return ext in ['.png', '.jpg', '.jpeg', '.bmp', '.gif', '.tiff', '.webp', '.ico', '.ppm', '.pgm', '.pbm']
-        except Exception: return False
+        # Hot when dropping a directory with thousands of files: rpartition
+        # skips splitext's basename scan, and there is no try/except setup -
+        # none of these string ops raise on str input
+        return isinstance(filepath, str) and \
+               filepath.rpartition('.')[2].lower() in self.IMAGE_EXTENSIONS_NO_DOT
+
+    def _decode_image_worker(self, filepath, draft_size):
+        """Decodes an image file (pure PIL, no Tk calls) - runs on _io_pool.
+
+        PIL releases the GIL inside its C decode loops, so running this off
+        the main thread keeps the UI responsive on big TIFFs/JPEGs. The
+        explicit load() forces the actual decode to happen here rather than
+        lazily at first pixel access back on the Tk thread.
+        """
+        img = Image.open(filepath)
+
+        # For JPEGs, ask libjpeg to decode at a reduced DCT scale - the
+        # preview never needs more than ~2x the canvas, and draft() makes
+        # decode of large photos several times faster. Must happen before
+        # any pixel access. All edit coordinates are recorded relative to
+        # this (possibly draft-scaled) image; the conversion path picks up
+        # the reference size from settings so exports still place correctly.
+        if img.format == 'JPEG':
+            try:
+                img.draft(img.mode, draft_size)
+            except Exception as e:
+                print(f"JPEG draft decode unavailable: {e}")
+
+        # Handle EXIF Orientation
+        img = self._apply_exif_orientation(img)
+        img.load()
+        return img
 
     def load_image_for_preview(self, filepath):
-        """Loads an image, sets it as original_image, loads/inits settings, and updates preview."""
+        """Starts loading an image; decode runs on a worker, Tk work follows.
+
+        The pure-PIL part (open, draft, EXIF transpose, decode) is submitted
+        to the small I/O pool and polled with after(); settings merge and all
+        widget updates continue in _finish_image_load on the main thread.
+        Only the most recent request wins - switching tabs quickly simply
+        abandons the stale decodes.
+        """
         if not os.path.exists(filepath):
              messagebox.showerror("Load Error", f"File not found: {filepath}")
              self._handle_load_error(filepath)
              return
+        print(f"Loading image: {filepath}")
+        _load_pil_extras() # First image touch - pull in the heavy PIL submodules
+        # Canvas size must be read on the Tk thread; pass it to the worker
+        canvas_w = max(self.preview_canvas.winfo_width(), 1)
+        canvas_h = max(self.preview_canvas.winfo_height(), 1)
+        self._loading_path = filepath # Marks the only decode allowed to land
+        self.status_label.config(text=f"Loading {os.path.basename(filepath)}...")
+        future = self._io_pool.submit(self._decode_image_worker, filepath, (canvas_w * 2, canvas_h * 2))
+        self.root.after(20, self._poll_decode, filepath, future)
+
+    def _poll_decode(self, filepath, future):
+        """Checks the decode future; hands off to _finish_image_load when done."""
+        if filepath != self._loading_path:
+            return # Superseded by a newer load; drop this result
+        if not future.done():
+            self.root.after(20, self._poll_decode, filepath, future)
+            return
+        self._loading_path = None
         try:
-            print(f"Loading image: {filepath}")
-            img = Image.open(filepath)
+            img = future.result()
+        except FileNotFoundError:
+             messagebox.showerror("Image Load Error", f"File not found: {filepath}")
+             self._handle_load_error(filepath)
+             return
+        except UnidentifiedImageError:
+             messagebox.showerror("Image Load Error", f"Cannot identify image file (may be corrupt or unsupported format): {filepath}")
+             self._handle_load_error(filepath)
+             return
+        except Exception as e:
+            messagebox.showerror("Image Load Error", f"Failed to load image: {os.path.basename(filepath)}\nError: {e}")
+            import traceback
+            traceback.print_exc()
+            self._handle_load_error(filepath)
+            return
+        self._finish_image_load(filepath, img)
 
-            # Handle EXIF Orientation
-            self.original_image = self._apply_exif_orientation(img) # Keep original unmodified
+    def _finish_image_load(self, filepath, img):
+        """Applies a decoded image to app state and the UI (main thread only)."""
+        try:
+            self.original_image = img # Keep original unmodified
 
             # Initialize Rotated/Flipped version (starts same as original)
             self.rotated_flipped_image = self.original_image.copy()
+            self._base_image_version += 1
 
             self.current_image_path = filepath
 
@@ -1499,6 +1867,37 @@ class ImageMasterProApp:
                  default_settings.update(loaded_settings) # Merge loaded over defaults
                  self.image_settings[self.current_image_path] = default_settings
 
+            # Record the coordinate reference size: every area/overlay rect is
+            # stored relative to this (draft decode may shrink it vs the file).
+            # The draft target tracks the canvas, so revisiting an image after
+            # a window resize can decode at a different scale - rescale the
+            # stored geometry to the new reference instead of silently
+            # reinterpreting old coords against the new size.
+            settings = self.image_settings[self.current_image_path]
+            new_ref = list(self.original_image.size)
+            old_ref = settings.get('ref_size')
+            if old_ref and old_ref != new_ref and old_ref[0] > 0 and old_ref[1] > 0:
+                scale_x = new_ref[0] / old_ref[0]
+                scale_y = new_ref[1] / old_ref[1]
+                for area in settings.get('blur_areas', []) + settings.get('blackout_areas', []):
+                    c = area.get('coords')
+                    if c:
+                        area['coords'] = (int(c[0] * scale_x), int(c[1] * scale_y),
+                                          int(c[2] * scale_x), int(c[3] * scale_y))
+                for overlay in settings.get('overlays', []):
+                    r = overlay.get('rect')
+                    if r:
+                        overlay['rect'] = (int(r[0] * scale_x), int(r[1] * scale_y),
+                                           int(r[2] * scale_x), int(r[3] * scale_y))
+                self._geom_index = None # Derived caches hold old-reference coords
+                self._area_lookup = None
+            settings['ref_size'] = new_ref
+
+            # LRU bookkeeping: keep this entry hot, demote long-unused ones
+            self._touch_image_settings(self.current_image_path)
+
+            # Cache a direct reference so per-refresh lookups skip the double hash
+            self._current_settings = self.image_settings[self.current_image_path]
 
             # --- Apply loaded settings to UI and internal state ---
             self._apply_loaded_settings_to_ui()
@@ -1518,17 +1917,19 @@ class ImageMasterProApp:
             self.pan_offset = [0, 0]
             self._update_zoom_label()
 
+            # Drop the previous image's preview and any in-flight render so
+            # update_preview takes its synchronous first-paint path: zoom_fit
+            # below reads processed_image and must see THIS image's size, not
+            # the stale preview of whatever was displayed before the switch.
+            self._cancel_pending_preview()
+            self.processed_image = None
+
             self.update_preview() # Create and display the preview with loaded settings
             self.zoom_fit() # Automatically fit the image to the preview area on load
             self.update_widget_states() # Update enable/disable states
             self.update_undo_redo_buttons() # Update based on loaded stacks
+            self.status_label.config(text=f"Loaded {os.path.basename(filepath)}.")
 
-        except FileNotFoundError:
-             messagebox.showerror("Image Load Error", f"File not found: {filepath}")
-             self._handle_load_error(filepath)
-        except UnidentifiedImageError:
-             messagebox.showerror("Image Load Error", f"Cannot identify image file (may be corrupt or unsupported format): {filepath}")
-             self._handle_load_error(filepath)
         except Exception as e:
             messagebox.showerror("Image Load Error", f"Failed to load image: {os.path.basename(filepath)}\nError: {e}")
             import traceback
@@ -1536,20 +1937,20 @@ class ImageMasterProApp:
             self._handle_load_error(filepath)
 
     def _apply_exif_orientation(self, img):
-        """Applies EXIF orientation tag to the image and returns the corrected image."""
+        """Applies EXIF orientation tag to the image and returns the corrected image.
+
+        Delegates to ImageOps.exif_transpose, which applies the composite
+        transform in one pass - the old manual dispatch chained two
+        transpose() calls (two full buffer copies) for orientations 5 and 7.
+        """
+        # Don't pay for getexif() metadata parsing on formats that never
+        # carry an orientation tag (PNG/BMP/GIF/...)
+        if img.format not in ('JPEG', 'TIFF', 'MPO', 'WEBP', 'HEIC', 'HEIF'):
+            return img
         try:
-            exif = img.getexif()
-            orientation_tag = 274 # Standard EXIF orientation tag
-            if orientation_tag in exif:
-                orientation = exif[orientation_tag]
-                print(f"Found EXIF Orientation: {orientation}")
-                if orientation == 2: img = img.transpose(Image.Transpose.FLIP_LEFT_RIGHT)
-                elif orientation == 3: img = img.transpose(Image.Transpose.ROTATE_180)
-                elif orientation == 4: img = img.transpose(Image.Transpose.FLIP_TOP_BOTTOM)
-                elif orientation == 5: img = img.transpose(Image.Transpose.ROTATE_90).transpose(Image.Transpose.FLIP_LEFT_RIGHT)
-                elif orientation == 6: img = img.transpose(Image.Transpose.ROTATE_270)
-                elif orientation == 7: img = img.transpose(Image.Transpose.ROTATE_270).transpose(Image.Transpose.FLIP_LEFT_RIGHT)
-                elif orientation == 8: img = img.transpose(Image.Transpose.ROTATE_90)
+            transposed = ImageOps.exif_transpose(img)
+            if transposed is not None:
+                return transposed
         except (AttributeError, KeyError, IndexError, TypeError):
             # cases: image doesn't have getexif or exif data, or orientation tag is missing/invalid
             pass
@@ -1572,31 +1973,94 @@ class ImageMasterProApp:
             'redo_stack': deque()
         }
 
+    def _touch_image_settings(self, path):
+        """Marks a settings entry as most recently used and demotes stale ones.
+
+        Keeps image_settings itself intact (edits are never thrown away), but
+        entries that fall out of the MAX_ACTIVE_IMAGE_SETTINGS window have
+        their loaded overlay images explicitly close()d and set to None -
+        Pillow only releases the underlying C buffers on close(). Demoted
+        overlays reload from their stored paths when the image is revisited
+        (_reload_overlay_images) or converted.
+        """
+        if path not in self.image_settings:
+            return
+        self.image_settings.move_to_end(path)
+        excess = len(self.image_settings) - self.MAX_ACTIVE_IMAGE_SETTINGS
+        if excess <= 0:
+            return
+        for stale_path in list(self.image_settings)[:excess]:
+            for overlay in self.image_settings[stale_path].get('overlays', []):
+                pil_img = overlay.get('pil_image')
+                if pil_img is not None:
+                    try: pil_img.close()
+                    except Exception: pass
+                    overlay['pil_image'] = None
+
     def _reload_overlay_images(self, overlays):
-        """Tries to reload PIL images for overlays based on stored paths."""
+        """Validates overlay paths; actual PIL loading is deferred to first use.
+
+        Decoding every overlay eagerly made tab switches pay for images that
+        might never be previewed - _ensure_overlay_pil opens them on demand
+        instead, so this only clears stale references and dead paths.
+        """
+        # One directory listing per distinct parent instead of a stat per
+        # overlay: os.path.exists is a blocking round-trip each time on
+        # network shares, while scandir amortizes to one per directory.
+        present_by_dir = {}
         reloaded_overlays = []
         for overlay in overlays:
             # Ensure pil_image is None initially or if path changed/invalid
             overlay['pil_image'] = None
             path = overlay.get('path')
-            if path and os.path.exists(path):
-                try:
-                    overlay['pil_image'] = Image.open(path).convert("RGBA")
-                except Exception as e:
-                    print(f"Warning: Could not reload overlay image '{os.path.basename(path)}': {e}")
-                    overlay['path'] = None # Clear path if reload fails
-            else:
-                 overlay['path'] = None # Clear path if it doesn't exist
+            if path:
+                dirname = os.path.dirname(path)
+                present = present_by_dir.get(dirname)
+                if present is None:
+                    try:
+                        with os.scandir(dirname) as entries:
+                            present = {entry.name for entry in entries}
+                    except OSError:
+                        present = set() # Directory gone: all its files are too
+                    present_by_dir[dirname] = present
+                if os.path.basename(path) not in present:
+                    overlay['path'] = None # Clear path if it doesn't exist
             reloaded_overlays.append(overlay)
         return reloaded_overlays
 
+    def _ensure_overlay_pil(self, overlay_info):
+        """Returns the overlay's PIL image, loading it from path on first use.
+
+        Overlay dicts keep pil_image=None until something actually draws or
+        measures the overlay; loading memoizes into the dict, so the decode
+        cost is paid once per overlay instead of on every settings load.
+        """
+        pil_img = overlay_info.get('pil_image')
+        if pil_img is not None:
+            return pil_img
+        path = overlay_info.get('path')
+        if not path:
+            return None
+        try:
+            # Decode once per file via the shared cache; the dict gets its
+            # own copy so per-overlay close() stays safe
+            st = os.stat(path)
+            pil_img = _load_rgba_master(path, st.st_mtime_ns, st.st_size).copy()
+            overlay_info['pil_image'] = pil_img
+            return pil_img
+        except Exception as e:
+            print(f"Warning: Could not load overlay image '{os.path.basename(path)}': {e}")
+            overlay_info['path'] = None # Clear path if load fails
+            return None
+
     def _reload_wm_image(self, wm_info):
         """Tries to reload PIL image for the main watermark."""
         wm_info['pil_image'] = None
         path = wm_info.get('path')
         if path and os.path.exists(path):
             try:
-                wm_info['pil_image'] = Image.open(path).convert("RGBA")
+                st = os.stat(path)
+                wm_info['pil_image'] = _load_rgba_master(path, st.st_mtime_ns, st.st_size).copy()
             except Exception as e:
                 print(f"Warning: Could not reload watermark image '{os.path.basename(path)}': {e}")
                 wm_info['path'] = None
@@ -1644,6 +2108,8 @@ class ImageMasterProApp:
                 idx = self.image_list.index(filepath)
                 self.image_list.pop(idx)
                 if filepath in self.image_settings:
+                    if self._current_settings is self.image_settings[filepath]:
+                        self._current_settings = None
                     del self.image_settings[filepath]
                 print(f"Removed faulty image from list: {filepath}")
                 # Update the notebook (might trigger tab change)
@@ -1653,14 +2119,18 @@ class ImageMasterProApp:
 
         # If the list is now empty or the error happened without a specific file context
         if not self.image_list or not filepath:
+            self._cancel_pending_preview() # No state left for a late render to land on
             self.original_image = None
             self.rotated_flipped_image = None
+            self._base_image_version += 1
             self.processed_image = None
             self.preview_image_tk = None
             self.current_image_path = None
+            self._current_settings = None
             self.filename_var.set("")
             self.image_info_label.config(text="Error loading image.")
             self.preview_canvas.delete("all")
+            self.canvas_image_id = None
             self.current_undo_stack.clear()
             self.current_redo_stack.clear()
             self._reset_interaction_states()
@@ -1684,15 +2154,69 @@ class ImageMasterProApp:
 
     # --- Image Processing & Preview (Core Logic) ---
 
+    def _debounce(self, key, ms, fn, *args):
+        """Trailing-edge debounce: runs fn only after ms of quiet per key.
+
+        Each call cancels the pending job for its key and reschedules, so a
+        burst of N calls (e.g. every pixel of opacity-slider travel) collapses
+        into a single invocation with the final values.
+        """
+        job = self._debounce_jobs.get(key)
+        if job is not None:
+            try: self.root.after_cancel(job)
+            except tk.TclError: pass
+        def run():
+            self._debounce_jobs.pop(key, None)
+            fn(*args)
+        self._debounce_jobs[key] = self.root.after(ms, run)
+
+    def _request_preview(self):
+        """Single coalescing queue for all preview-triggering handlers.
+
+        Any number of requests (opacity slider + color change + adjustment in
+        quick succession, from any code path) collapse onto one pending after()
+        job; the render reads the current variable values when it runs, so the
+        final state always wins. Unlike a trailing-edge debounce, the job is
+        not rescheduled by further requests - during a continuous drag this
+        yields a steady ~25 renders/s instead of none until the drag pauses.
+
+        The interval adapts to what the machine keeps up with: the base 40 ms
+        is stretched to ~1.2x the last measured pipeline time (capped at
+        500 ms), so a 400 ms render on a huge image doesn't get swamped by
+        requests it can never service while small images stay at 25 fps.
+        """
+        if self._preview_update_job is None:
+            delay = min(500, max(40, int(self._last_preview_ms * 1.2)))
+            self._preview_update_job = self.root.after(delay, self._do_preview)
+
+    def _do_preview(self):
+        """Runs the coalesced preview render."""
+        self._preview_update_job = None
+        self.update_preview_safe()
+
     def update_preview_debounced(self, event=None):
-         """Requests a preview update after a short delay."""
-         if self._preview_update_job:
-              self.root.after_cancel(self._preview_update_job)
-         self._preview_update_job = self.root.after(150, self.update_preview_safe) # 150ms delay
+         """Requests a preview update via the coalescing queue (bind-friendly)."""
+         self._request_preview()
+
+    def _redisplay(self):
+        """Redraws the existing processed image (pan - no pipeline involved).
+
+        Panning only changes canvas-space placement; routing it through
+        update_preview would re-fingerprint the whole pipeline (several Tk
+        variable reads plus repr of the edit lists) on every mouse move just
+        to reach the same display call.
+        """
+        if self.processed_image is not None:
+            self.display_image_on_canvas(self.processed_image)
+
+    def _redisplay_final_quality(self):
+        """Deferred crisp redraw once pan/zoom interaction goes idle."""
+        self._hq_redraw_job = None
+        self._redisplay()
 
     def update_preview_safe(self, event=None):
         """Safely triggers preview update, handling potential errors."""
-        # Cancel any pending debounced update if called directly
+        # Cancel any pending coalesced update if called directly
         if self._preview_update_job:
               self.root.after_cancel(self._preview_update_job)
               self._preview_update_job = None
@@ -1701,9 +2225,7 @@ class ImageMasterProApp:
             try:
                 self.update_preview()
             except Exception as e:
-                print(f"Error updating preview: {e}")
-                import traceback
-                traceback.print_exc()
+                _log.error(f"Error updating preview: {e}", exc_info=True)
                 self.status_label.config(text=f"Preview Error: {e}")
                 # Optionally show a message box, but can be annoying
                 # messagebox.showerror("Preview Error", f"Error updating preview:\n{e}")
@@ -1716,6 +2238,52 @@ class ImageMasterProApp:
             self.image_info_label.config(text="Load an image to see preview and info.")
         self.update_widget_states() # Ensure widgets reflect current state
 
+    def _build_pipeline_key(self, settings):
+        """Builds a hashable fingerprint of everything feeding the preview pipeline.
+
+        Covers the per-image settings (filter, adjustments, edit areas, overlays)
+        plus the global UI state (resize, watermarks) and the render context
+        (source image identity, canvas size, zoom). If the fingerprint matches
+        the previous run, re-running the pipeline would produce an identical
+        processed image.
+        """
+        wm_info = self.wm_img_info or {}
+        adj = settings.get('adjustments', {})
+        return (
+            self.current_image_path,
+            self._base_image_version,
+            self.preview_canvas.winfo_width(), self.preview_canvas.winfo_height(),
+            # Effective zoom: the downscale stage clamps at 1.0, so any zoom-out
+            # level renders the same processed image - keying on the raw factor
+            # would force a full (identical) re-render after every zoom_fit
+            max(1.0, self.zoom_factor),
+            settings.get('filter', 'None'),
+            round(adj.get('brightness', 1.0), 3), round(adj.get('contrast', 1.0), 3),
+            round(adj.get('saturation', 1.0), 3),
+            self.preset_var.get(), self.resize_width_var.get(), self.resize_height_var.get(),
+            repr(settings.get('blur_areas', [])), repr(settings.get('blackout_areas', [])),
+            tuple((o.get('path'), o.get('rect'), o.get('angle', 0.0), o.get('opacity', 128))
+                  for o in settings.get('overlays', [])),
+            self.use_text_watermark.get(), self.watermark_text.get(),
+            self.watermark_font_size.get(), self.watermark_color.get(),
+            self.watermark_opacity.get(), self.watermark_position.get(),
+            self.use_image_watermark.get(), wm_info.get('path'),
+            wm_info.get('rect'), wm_info.get('angle', 0.0), wm_info.get('opacity', 128),
+        )
+
+    def _store_stage(self, key, img):
+        """Caches an intermediate pipeline image under its cumulative prefix key.
+
+        Entries are references, not copies - the stages that run after the
+        cached ones all return fresh images (update_preview copies before the
+        one in-place stage), so a small LRU bound is the only memory control
+        needed.
+        """
+        self._stage_cache[key] = img
+        self._stage_cache.move_to_end(key)
+        while len(self._stage_cache) > self._STAGE_CACHE_SIZE:
+            self._stage_cache.popitem(last=False)
+
     def update_preview(self):
         """Generates and displays the processed preview image on the canvas."""
         if not self.rotated_flipped_image or not self.current_image_path:
@@ -1727,54 +2295,211 @@ class ImageMasterProApp:
         # --- Get Current Image Settings ---
         settings = self.image_settings.get(self.current_image_path)
         if not settings:
-            print("Update Preview cancelled: Settings not found for current path")
+            _log.debug("Update Preview cancelled: Settings not found for current path")
             return # Should not happen if loaded correctly
 
-        # Start with the current state of the rotated/flipped image
-        img = self.rotated_flipped_image.copy()
+        # Memoization: sliders and FocusOut handlers frequently request a
+        # refresh without any input actually changing (click without drag,
+        # re-entering the same value). If nothing feeding the pipeline moved,
+        # skip the full rebuild and just redraw the existing processed image.
+        pipeline_key = self._build_pipeline_key(settings)
+        if pipeline_key == self._last_pipeline_key and self.processed_image is not None:
+            self.display_image_on_canvas(self.processed_image)
+            return
+
+        # Cumulative prefix keys for the front of the pipeline. Each key
+        # fingerprints everything that fed the image up to and including that
+        # stage, so a change in a later stage (watermark slider, new overlay,
+        # edit area tweak) can resume from the deepest cached intermediate.
+        canvas_w = max(1, self.preview_canvas.winfo_width())
+        canvas_h = max(1, self.preview_canvas.winfo_height())
+        zoom = max(1.0, self.zoom_factor)
+        adj_settings = settings.get('adjustments', {'brightness': 1.0, 'contrast': 1.0, 'saturation': 1.0})
+        preset_val = self.preset_var.get()
+        w_str, h_str = self.resize_width_var.get(), self.resize_height_var.get()
+        filter_key = (self.current_image_path, self._base_image_version,
+                      canvas_w, canvas_h, zoom, settings.get('filter', 'None'))
+        resize_key = filter_key + (preset_val, w_str, h_str)
+        adjust_key = resize_key + (round(adj_settings.get('brightness', 1.0), 3),
+                                   round(adj_settings.get('contrast', 1.0), 3),
+                                   round(adj_settings.get('saturation', 1.0), 3))
+        stage_keys = (filter_key, resize_key, adjust_key)
+
+        img = None
+        start_stage = 0
+        for i in range(len(stage_keys) - 1, -1, -1):
+            cached = self._stage_cache.get(stage_keys[i])
+            if cached is not None:
+                self._stage_cache.move_to_end(stage_keys[i]) # LRU touch
+                img = cached
+                start_stage = i + 1
+                break
+
+        # Snapshot every pipeline input on the main thread (same pattern as
+        # the conversion path): the worker must not race live settings lists
+        # the user keeps editing while a render is in flight.
+        wm_info = self.wm_img_info # Use global watermark info
+        self._preview_gen += 1
+        job = {
+            'gen': self._preview_gen,
+            'start_time': start_time,
+            'pipeline_key': pipeline_key,
+            'stage_keys': stage_keys,
+            'start_stage': start_stage,
+            'img': img,
+            'source': self.rotated_flipped_image,
+            'canvas_w': canvas_w, 'canvas_h': canvas_h, 'zoom': zoom,
+            'filter': settings.get('filter', 'None'),
+            'preset': preset_val, 'w_str': w_str, 'h_str': h_str,
+            'adjustments': dict(adj_settings),
+            'blur_areas': list(settings.get('blur_areas', [])),
+            'blackout_areas': list(settings.get('blackout_areas', [])),
+            'overlays': list(settings.get('overlays', [])),
+            'use_text_wm': bool(self.use_text_watermark.get() and self.watermark_text.get()),
+            # Snapshot the text-WM Tk variables here (main thread); the worker
+            # must not read live widget state mid-render
+            'text_wm_params': self._snapshot_text_wm_params(),
+            'wm_info': wm_info if (self.use_image_watermark.get() and wm_info and wm_info.get('path')) else None,
+        }
+
+        if self.processed_image is None:
+            # First paint for this session/image must be synchronous:
+            # zoom_fit and the pan clamp right after load read
+            # processed_image directly.
+            self._commit_preview(job, self._compose_preview(job))
+        else:
+            # Later renders go to the single-flight worker; the previous
+            # processed image stays displayed (and keeps serving coordinate
+            # math) until the new one is committed. Cancel any still-queued
+            # job - only the newest snapshot matters.
+            if self._preview_future is not None:
+                self._preview_future.cancel()
+            future = self._preview_pool.submit(self._compose_preview, job)
+            self._preview_future = future
+            future.add_done_callback(
+                lambda f, job=job: self.root.after(0, self._finish_preview_async, job, f))
+
+    def _compose_preview(self, job):
+        """Runs the pipeline stages for one snapshotted job.
+
+        Safe to call from the preview worker thread: everything it needs was
+        captured into the job dict on the main thread, and Pillow releases
+        the GIL inside its C ops so the UI stays live meanwhile. Returns
+        (processed image, base size after filter/resize/adjustments).
+        """
+        img = job['img']
+        start_stage = job['start_stage']
+        filter_key, resize_key, adjust_key = job['stage_keys']
+
+        # Start with the current state of the rotated/flipped image.
+        # For preview we process at roughly display resolution: an integer box
+        # reduce() up-front shrinks the pixel work of every later stage. Keep at
+        # least ~2x the canvas (scaled by zoom) so moderate zoom-ins stay sharp.
+        # The conversion/save path never goes through here, so exports are full-res.
+        if img is None:
+            try:
+                reduce_factor = int(min(job['source'].width / (job['canvas_w'] * 2 * job['zoom']),
+                                        job['source'].height / (job['canvas_h'] * 2 * job['zoom'])))
+                if reduce_factor >= 2:
+                    img = job['source'].reduce(reduce_factor)
+            except Exception as e:
+                _log.warning(f"Preview downscale skipped: {e}")
+            if img is None:
+                img = job['source'].copy()
 
         # --- Apply Settings to Generate Processed Image ---
         # Order: Filter -> Resize -> Adjustments -> Manual Edits -> Watermarks -> Overlays
 
         # 1. Apply Filter (Now per-image for Undo)
-        img = self.apply_filter(img, settings.get('filter', 'None')) # Use per-image filter setting
+        if start_stage <= 0:
+            img = self.apply_filter(img, job['filter']) # Use per-image filter setting
+            self._store_stage(filter_key, img)
 
         # 2. Apply Resize (Global Setting / Preset)
-        img = self.apply_resize(img, self.preset_var.get(), self.resize_width_var.get(), self.resize_height_var.get())
+        # BILINEAR is plenty for on-screen preview and much faster than LANCZOS;
+        # the conversion path keeps LANCZOS for final output quality.
+        if start_stage <= 1:
+            img = self.apply_resize(img, job['preset'], job['w_str'], job['h_str'], resample=Image.Resampling.BILINEAR)
+            self._store_stage(resize_key, img)
 
         # 3. Apply Adjustments (Per Image Setting)
-        adj_settings = settings.get('adjustments', {'brightness': 1.0, 'contrast': 1.0, 'saturation': 1.0})
-        img = self.apply_adjustments(img, adj_settings)
-
-        # Store the size of the image at this stage (after filter/resize/adjustments)
-        self.processed_base_size = img.size
-
-        # Ensure RGBA if subsequent steps need it
-        needs_rgba = (settings.get('blur_areas') or settings.get('blackout_areas') or
-                      self.use_text_watermark.get() or settings.get('wm_img_info', {}).get('path') or
-                      settings.get('overlays'))
-        if needs_rgba and img.mode != 'RGBA':
-             img = img.convert('RGBA')
+        if start_stage <= 2:
+            img = self.apply_adjustments(img, job['adjustments'])
+            self._store_stage(adjust_key, img)
+
+        # Size of the image at this stage (after filter/resize/adjustments)
+        base_size = img.size
+
+        # Alpha promotion is deferred: the watermark/overlay stages each
+        # convert to RGBA themselves only when they actually run, so the
+        # filter/resize/adjustment stages stay on the smaller RGB buffer.
+        if job['blur_areas'] or job['blackout_areas']:
+            if img.mode in ('RGB', 'RGBA'):
+                # apply_manual_edits draws into an RGB/RGBA input in place;
+                # the stage cache holds live references to the intermediates
+                # above, so hand it a private buffer rather than corrupting
+                # a cached stage.
+                img = img.copy()
 
         # 4. Apply Manual Edits (Blur/Blackout) (Per Image Setting)
-        img = self.apply_manual_edits(img, settings.get('blur_areas', []), settings.get('blackout_areas', []))
+        img = self.apply_manual_edits(img, job['blur_areas'], job['blackout_areas'])
 
         # 5. Apply Text Watermark (Global Setting - if enabled)
-        if self.use_text_watermark.get() and self.watermark_text.get():
-            img = self.apply_text_watermark(img) # Uses global settings from UI
+        if job['use_text_wm']:
+            img = self.apply_text_watermark(img, job['text_wm_params']) # Settings snapshotted at submit
 
         # 6. Apply Main Image Watermark (Per Image Setting - if enabled and path exists)
-        wm_info = self.wm_img_info # Use global watermark info
-        if self.use_image_watermark.get() and wm_info and wm_info.get('path'): # Checkbox AND path needed
+        if job['wm_info']:
             # Apply using the *specific* settings stored for this image
-            img = self.apply_single_image_overlay(img, wm_info)
+            img = self.apply_single_image_overlay(img, job['wm_info'])
 
         # 7. Apply Overlays (Per Image Setting)
-        overlays = settings.get('overlays', [])
-        img = self.apply_overlays(img, overlays) # Apply all overlays in order
+        img = self.apply_overlays(img, job['overlays']) # Apply all overlays in order
+
+        return img, base_size
+
+    def _cancel_pending_preview(self):
+        """Cancels any queued/in-flight preview render and orphans its result.
+
+        Must run whenever the image state it would land on is torn down
+        (image switch, list clear, load error) - otherwise a render that is
+        already past cancellation commits a stale frame onto the new state.
+        """
+        if self._preview_future is not None:
+            self._preview_future.cancel()
+            self._preview_future = None
+        self._preview_gen += 1 # Anything already rendering fails the gen check
+
+    def _finish_preview_async(self, job, future):
+        """Main-thread landing point for a worker-rendered preview."""
+        if job['gen'] != self._preview_gen:
+            return # Superseded while in flight; a newer render is coming
+        if future is self._preview_future:
+            self._preview_future = None
+        try:
+            result = future.result()
+        except concurrent.futures.CancelledError:
+            return
+        except Exception as e:
+            _log.error(f"Error updating preview: {e}", exc_info=True)
+            self.status_label.config(text=f"Preview Error: {e}")
+            return
+        self._commit_preview(job, result)
+
+    def _commit_preview(self, job, result):
+        """Publishes a finished pipeline result (main thread only)."""
+        img, base_size = result
+        self.processed_base_size = base_size
 
         # Store the final processed image for coordinate mapping and display
+        # The old processed image is being replaced, so any cached crops/PhotoImages
+        # derived from it are stale (ids may even be reused after GC) - drop them.
+        # The geometry index may also be stale (settings edits land here too).
+        self._preview_cache.clear()
+        self._geom_index = None
+        self._area_lookup = None
         self.processed_image = img
+        self._last_pipeline_key = job['pipeline_key']
 
         # Update Info Label
         self.image_info_label.config(text=f"Current: {os.path.basename(self.current_image_path)} ({self.original_image.width}x{self.original_image.height}) | Preview: {img.width}x{img.height}")
@@ -1782,8 +2507,10 @@ class ImageMasterProApp:
         # --- Display the processed image on the canvas ---
         self.display_image_on_canvas(self.processed_image)
 
-        end_time = time.time()
-        print(f"Preview updated in {end_time - start_time:.4f} seconds.")
+        elapsed = time.time() - job['start_time']
+        self._last_preview_ms = elapsed * 1000 # Feeds the adaptive request interval
+        if _log.isEnabledFor(logging.DEBUG): # Skip building the f-string too
+            _log.debug(f"Preview updated in {elapsed:.4f} seconds.")
 
 
     def display_image_on_canvas(self, img_to_display):
@@ -1805,77 +2532,134 @@ class ImageMasterProApp:
 
             img_w, img_h = img_to_display.size
             if img_w <= 0 or img_h <= 0:
-                 print("Display cancelled: Invalid image dimensions")
+                 _log.debug("Display cancelled: Invalid image dimensions")
                  return
 
-            # Calculate the dimensions of the fully zoomed image
-            zoomed_w = int(img_w * self.zoom_factor)
-            zoomed_h = int(img_h * self.zoom_factor)
+            # Hot path during pan/zoom: read zoom and pan once into locals
+            # instead of repeated attribute/list loads below
+            zf = self.zoom_factor
+            pan_x, pan_y = self.pan_offset
 
             # Determine the portion of the *zoomed* image visible on the canvas
             # Top-left corner of visible area in zoomed image coordinates
-            visible_x0_zoomed = -self.pan_offset[0]
-            visible_y0_zoomed = -self.pan_offset[1]
+            visible_x0_zoomed = -pan_x
+            visible_y0_zoomed = -pan_y
             # Bottom-right corner
             visible_x1_zoomed = visible_x0_zoomed + canvas_width
             visible_y1_zoomed = visible_y0_zoomed + canvas_height
 
             # Determine the corresponding portion in the *original processed* image coordinates
-            visible_x0_proc = max(0, int(visible_x0_zoomed / self.zoom_factor))
-            visible_y0_proc = max(0, int(visible_y0_zoomed / self.zoom_factor))
-            visible_x1_proc = min(img_w, int(visible_x1_zoomed / self.zoom_factor))
-            visible_y1_proc = min(img_h, int(visible_y1_zoomed / self.zoom_factor))
+            visible_x0_proc = max(0, int(visible_x0_zoomed / zf))
+            visible_y0_proc = max(0, int(visible_y0_zoomed / zf))
+            visible_x1_proc = min(img_w, int(visible_x1_zoomed / zf))
+            visible_y1_proc = min(img_h, int(visible_y1_zoomed / zf))
 
             # Check if the visible area has valid dimensions
             if visible_x1_proc <= visible_x0_proc or visible_y1_proc <= visible_y0_proc:
                 # print("Display skipped: No visible area.")
                 # Clear canvas if nothing is visible? Or leave old image? Clear for now.
                 self.preview_canvas.delete("all")
+                self.canvas_image_id = None
                 self.preview_image_tk = None
                 return
 
-            # Crop the *original processed* image to the visible portion
-            visible_img_pil = img_to_display.crop((visible_x0_proc, visible_y0_proc, visible_x1_proc, visible_y1_proc))
-
-            # Calculate the size of this cropped portion when *zoomed*
-            display_w = int(visible_img_pil.width * self.zoom_factor)
-            display_h = int(visible_img_pil.height * self.zoom_factor)
+            # Calculate the size of the visible (cropped) portion when *zoomed*
+            display_w = int((visible_x1_proc - visible_x0_proc) * zf)
+            display_h = int((visible_y1_proc - visible_y0_proc) * zf)
 
             if display_w <=0 or display_h <= 0:
                 # print("Display skipped: Calculated display size is zero.")
                 self.preview_canvas.delete("all")
+                self.canvas_image_id = None
                 self.preview_image_tk = None
                 return
 
-            # Resize the *cropped* portion to its final display size
-            # Use NEAREST for performance during zoom/pan, LANCZOS might be too slow? Test needed.
-            # LANCZOS provides better quality, let's try it first.
-            resample_method = Image.Resampling.LANCZOS
-            # resample_method = Image.Resampling.NEAREST if self.zoom_factor > 1 else Image.Resampling.LANCZOS
-            try:
-                display_img_pil = visible_img_pil.resize((display_w, display_h), resample_method)
-            except ValueError:
-                print(f"Warning: Resize failed for display ({display_w}x{display_h}). Skipping display.")
-                self.preview_canvas.delete("all")
-                self.preview_image_tk = None
-                return
-
-            # Convert to ImageTk format
-            self.preview_image_tk = ImageTk.PhotoImage(display_img_pil)
-
-            # --- Clear previous drawings and draw new image ---
-            self.preview_canvas.delete("all") # Clear everything
+            # Draft rendering while the user is actively panning/zooming:
+            # NEAREST is several times cheaper than the filtered resamplers
+            # and the motion hides the quality difference. A single
+            # full-quality redraw is scheduled once interaction goes idle.
+            interacting = (time.time() - self._last_interaction_ts) < 0.3
+            resample_method = Image.Resampling.NEAREST if interacting else Image.Resampling.BILINEAR
+
+            # Check the preview cache first - on pan/zoom the same crop at the same
+            # zoom is often requested repeatedly, and crop+resize+PhotoImage is the
+            # expensive part of this function.
+            cache_key = (id(img_to_display), round(zf, 3), interacting,
+                         visible_x0_proc, visible_y0_proc, visible_x1_proc, visible_y1_proc)
+            cached = self._preview_cache.get(cache_key)
+            if cached is not None:
+                self._preview_cache.move_to_end(cache_key) # LRU touch
+                self.preview_image_tk = cached
+            else:
+                # Crop the *original processed* image to the visible portion
+                visible_img_pil = img_to_display.crop((visible_x0_proc, visible_y0_proc, visible_x1_proc, visible_y1_proc))
+
+                # Resize the *cropped* portion to its final display size
+                # BILINEAR is visually indistinguishable at screen resolution and
+                # noticeably cheaper than LANCZOS for large crops (NEAREST during
+                # interaction, chosen above). Saved output still uses LANCZOS in
+                # the conversion path.
+                try:
+                    display_img_pil = visible_img_pil.resize((display_w, display_h), resample_method)
+                except ValueError:
+                    _log.warning(f"Resize failed for display ({display_w}x{display_h}). Skipping display.")
+                    self.preview_canvas.delete("all")
+                    self.canvas_image_id = None
+                    self.preview_image_tk = None
+                    return
+
+                scratch_key = (display_w, display_h, display_img_pil.mode)
+                if self._scratch_photo is not None and scratch_key == self._scratch_size:
+                    # Steady-state pan/drag: overwrite the reusable Tk buffer
+                    # in place - paste() skips the per-frame PhotoImage
+                    # allocation that otherwise dominates pan cost
+                    self._scratch_photo.paste(display_img_pil)
+                    self.preview_image_tk = self._scratch_photo
+                elif scratch_key == self._scratch_size:
+                    # Second consecutive miss at this size: the display size
+                    # has settled (a drag, not a zoom), so set up the
+                    # reusable buffer. Never goes into the LRU cache - its
+                    # pixels are overwritten on later frames.
+                    self._scratch_photo = ImageTk.PhotoImage(display_img_pil)
+                    self.preview_image_tk = self._scratch_photo
+                else:
+                    # New display size: immutable snapshot, safe to cache
+                    self.preview_image_tk = ImageTk.PhotoImage(display_img_pil)
+                    self._scratch_size = scratch_key
+                    self._scratch_photo = None
+                    self._preview_cache[cache_key] = self.preview_image_tk
+                    while len(self._preview_cache) > self._PREVIEW_CACHE_SIZE:
+                        self._preview_cache.popitem(last=False) # Evict least recently used
+
+            # --- Clear previous overlay drawings (the base image item persists) ---
+            for tag in ("overlay_blur", "overlay_blackout", "overlay_wm", "overlay_layer",
+                        "overlay_wm_handle", "overlay_layer_handle", "selection"):
+                self.preview_canvas.delete(tag)
+            self._canvas_item_meta.clear() # Handle metadata dies with the items
 
             # Calculate the canvas coordinates to draw the *visible* (cropped & resized) image
-            # This depends on where the top-left of the *visible* portion starts relative to the canvas (0,0)
-            canvas_draw_x = int(self.pan_offset[0] + visible_x0_proc * self.zoom_factor)
-            canvas_draw_y = int(self.pan_offset[1] + visible_y0_proc * self.zoom_factor)
-
-            # Draw the visible part of the image
-            self.canvas_image_id = self.preview_canvas.create_image(
-                canvas_draw_x, canvas_draw_y,
-                anchor=tk.NW, image=self.preview_image_tk
-            )
+            # This depends on where the top-left of the *visible* portion starts relative
+            # to the canvas (0,0). visible_*_proc came from floor division of the same
+            # pan/zoom values, so this product is exact (no re-derived float drift); the
+            # single int() here is the only truncation on the draw position.
+            canvas_draw_x = int(pan_x + visible_x0_proc * zf)
+            canvas_draw_y = int(pan_y + visible_y0_proc * zf)
+
+            # Draw the visible part of the image: keep one canvas item alive
+            # across frames and just retarget its image/coords instead of
+            # delete("all") + create_image per event
+            if self.canvas_image_id is not None:
+                try:
+                    self.preview_canvas.itemconfigure(self.canvas_image_id, image=self.preview_image_tk)
+                    self.preview_canvas.coords(self.canvas_image_id, canvas_draw_x, canvas_draw_y)
+                except tk.TclError:
+                    self.canvas_image_id = None # Item was deleted elsewhere; recreate below
+            if self.canvas_image_id is None:
+                self.canvas_image_id = self.preview_canvas.create_image(
+                    canvas_draw_x, canvas_draw_y,
+                    anchor=tk.NW, image=self.preview_image_tk
+                )
+                self.preview_canvas.tag_lower(self.canvas_image_id) # Base layer, under overlays
 
             # --- Draw Overlays ---
             # Pass current zoom and pan info to drawing functions
@@ -1883,6 +2667,12 @@ class ImageMasterProApp:
             self._draw_image_wm_overlay()
             self._draw_overlay_overlays()
 
+            # One crisp redraw after the interaction settles
+            if interacting:
+                if self._hq_redraw_job:
+                    self.root.after_cancel(self._hq_redraw_job)
+                self._hq_redraw_job = self.root.after(300, self._redisplay_final_quality)
+
             # Re-draw temporary selection rectangle (if mouse is being dragged)
             if self.selection_rect_id and self.selection_start_coords and self.selection_current_coords:
                  x0_c, y0_c = self.selection_start_coords
@@ -1894,15 +2684,15 @@ class ImageMasterProApp:
 
         except tk.TclError as e:
              # Can happen if widget is destroyed during update
-             print(f"TclError displaying image on canvas (likely widget destroyed): {e}")
+             _log.warning(f"TclError displaying image on canvas (likely widget destroyed): {e}")
              self.preview_canvas.delete("all")
+             self.canvas_image_id = None
              self.preview_image_tk = None
         except Exception as e:
-            print(f"Error displaying image on canvas: {e}")
-            import traceback
-            traceback.print_exc()
+            _log.error(f"Error displaying image on canvas: {e}", exc_info=True)
             self.status_label.config(text=f"Preview Display Error: {e}")
             self.preview_canvas.delete("all")
+            self.canvas_image_id = None
             self.preview_image_tk = None
 
     # --- Coordinate Transformation (Zoom/Pan Aware) ---
@@ -1998,18 +2788,33 @@ class ImageMasterProApp:
 
         blur_areas = settings.get('blur_areas', [])
         blackout_areas = settings.get('blackout_areas', [])
+        all_areas = ([(area, 'blur') for area in blur_areas] +
+                     [(area, 'blackout') for area in blackout_areas])
+        if not all_areas: return
 
-        # Draw Blur Areas
-        for area in blur_areas:
-            uuid, shape, coords_orig, strength = area['uuid'], area['shape'], area['coords'], area['strength']
-            is_selected = (self.selected_area_type == 'blur' and self.selected_area_uuid == uuid)
-            self._draw_area_shape(shape, coords_orig, "blur", uuid, is_selected)
+        if _numpy_available and self.original_image and self.processed_base_size:
+            # Convert every area's corners in one vectorized scale+offset
+            # instead of two original_to_canvas_coords round-trips per area
+            orig_w, orig_h = self.original_image.size
+            proc_w, proc_h = self.processed_base_size
+            if orig_w > 0 and orig_h > 0:
+                zoom = self.zoom_factor
+                scale = np.array([proc_w / orig_w * zoom, proc_h / orig_h * zoom], dtype=np.float32)
+                offset = np.array(self.pan_offset, dtype=np.float32)
+                coords = np.array([area['coords'] for area, _ in all_areas],
+                                  dtype=np.float32).reshape(-1, 2, 2)
+                canvas_coords = (coords * scale + offset).astype(int).reshape(-1, 4)
+                for (area, area_type), cc in zip(all_areas, canvas_coords):
+                    uuid = area['uuid']
+                    is_selected = (self.selected_area_type == area_type and self.selected_area_uuid == uuid)
+                    self._draw_area_shape_at(area['shape'], cc, area_type, uuid, is_selected)
+                return
 
-        # Draw Blackout Areas
-        for area in blackout_areas:
-             uuid, shape, coords_orig = area['uuid'], area['shape'], area['coords']
-             is_selected = (self.selected_area_type == 'blackout' and self.selected_area_uuid == uuid)
-             self._draw_area_shape(shape, coords_orig, "blackout", uuid, is_selected)
+        # Fallback: per-area conversion through the scalar helpers
+        for area, area_type in all_areas:
+            uuid, shape, coords_orig = area['uuid'], area['shape'], area['coords']
+            is_selected = (self.selected_area_type == area_type and self.selected_area_uuid == uuid)
+            self._draw_area_shape(shape, coords_orig, area_type, uuid, is_selected)
 
 
     def _draw_image_wm_overlay(self):
@@ -2032,8 +2837,7 @@ class ImageMasterProApp:
         settings = self.image_settings.get(self.current_image_path)
         if not settings or not self.selected_overlay_uuid: return # Only draw handles for selected
 
-        overlays = settings.get('overlays', [])
-        selected_overlay_data = next((o for o in overlays if o['uuid'] == self.selected_overlay_uuid), None)
+        selected_overlay_data = self._get_area_lookup()['overlay'].get(self.selected_overlay_uuid)
 
         if selected_overlay_data and selected_overlay_data.get('rect'):
             self._draw_interactive_handles(selected_overlay_data['rect'], selected_overlay_data['angle'],
@@ -2041,7 +2845,16 @@ class ImageMasterProApp:
 
 
     def _draw_area_shape(self, shape, coords_orig, area_type, uuid, is_selected):
-        """Helper to draw a single blur/blackout area outline."""
+        """Helper to draw a single blur/blackout area outline (original coords)."""
+        # Convert original coords to canvas coords
+        x0_orig, y0_orig, x1_orig, y1_orig = coords_orig
+        cx0, cy0 = self.original_to_canvas_coords(x0_orig, y0_orig)
+        cx1, cy1 = self.original_to_canvas_coords(x1_orig, y1_orig)
+        if all(c is not None for c in [cx0, cy0, cx1, cy1]):
+            self._draw_area_shape_at(shape, (cx0, cy0, cx1, cy1), area_type, uuid, is_selected)
+
+    def _draw_area_shape_at(self, shape, canvas_coords, area_type, uuid, is_selected):
+        """Draws one blur/blackout outline from already-converted canvas coords."""
         try:
             if area_type == 'blur':
                 outline_color = "yellow" if is_selected else "#00A0FF" # Blueish
@@ -2053,27 +2866,22 @@ class ImageMasterProApp:
             outline_width = 2 if is_selected else 1
             outline_dash = () if is_selected else (4, 2)
 
-            # Convert original coords to canvas coords
-            x0_orig, y0_orig, x1_orig, y1_orig = coords_orig
-            cx0, cy0 = self.original_to_canvas_coords(x0_orig, y0_orig)
-            cx1, cy1 = self.original_to_canvas_coords(x1_orig, y1_orig)
-
-            if all(c is not None for c in [cx0, cy0, cx1, cy1]):
-                # Ensure positive width/height on canvas for drawing
-                if cx0 > cx1: cx0, cx1 = cx1, cx0
-                if cy0 > cy1: cy0, cy1 = cy1, cy0
-                if cx1 - cx0 < 1 or cy1 - cy0 < 1: return # Too small to draw
-
-                if shape == 'rectangle':
-                    self.preview_canvas.create_rectangle(cx0, cy0, cx1, cy1,
-                                                       outline=outline_color, width=outline_width, dash=outline_dash,
-                                                       tags=tags)
-                elif shape == 'circle':
-                     self.preview_canvas.create_oval(cx0, cy0, cx1, cy1,
-                                                    outline=outline_color, width=outline_width, dash=outline_dash,
-                                                    tags=tags)
+            cx0, cy0, cx1, cy1 = canvas_coords
+            # Ensure positive width/height on canvas for drawing
+            if cx0 > cx1: cx0, cx1 = cx1, cx0
+            if cy0 > cy1: cy0, cy1 = cy1, cy0
+            if cx1 - cx0 < 1 or cy1 - cy0 < 1: return # Too small to draw
+
+            if shape == 'rectangle':
+                self.preview_canvas.create_rectangle(cx0, cy0, cx1, cy1,
+                                                   outline=outline_color, width=outline_width, dash=outline_dash,
+                                                   tags=tags)
+            elif shape == 'circle':
+                 self.preview_canvas.create_oval(cx0, cy0, cx1, cy1,
+                                                outline=outline_color, width=outline_width, dash=outline_dash,
+                                                tags=tags)
         except Exception as e:
-             print(f"Error drawing area shape {uuid}: {e}")
+             _log.warning(f"Error drawing area shape {uuid}: {e}")
 
 
     def _draw_interactive_handles(self, rect_orig, angle_degrees, area_type, uuid):
@@ -2084,13 +2892,42 @@ class ImageMasterProApp:
             center_x_orig = (x0_orig + x1_orig) / 2
             center_y_orig = (y0_orig + y1_orig) / 2
 
-            corners_orig = [(x0_orig, y0_orig), (x1_orig, y0_orig), (x1_orig, y1_orig), (x0_orig, y1_orig)]
-            corners_rotated_orig = [self._rotate_point(center_x_orig, center_y_orig, px, py, angle_degrees) for px, py in corners_orig]
-            corners_canvas = [self.original_to_canvas_coords(px, py) for px, py in corners_rotated_orig]
+            # Rotation handle geometry (original coords, pre-rotation)
+            top_mid_orig_x = (x0_orig + x1_orig) / 2
+            top_mid_orig_y = y0_orig
+            handle_offset = max(20, (y1_orig - y0_orig) * 0.1) # Offset in original coords
 
-            if any(c is None for pair in corners_canvas for c in pair):
-                # print(f"Warning: Could not get canvas coords for all interactive corners ({uuid}).")
-                return
+            # All six tracked points: 4 corners, top-mid anchor, rotation handle
+            points_orig = [(x0_orig, y0_orig), (x1_orig, y0_orig), (x1_orig, y1_orig), (x0_orig, y1_orig),
+                           (top_mid_orig_x, top_mid_orig_y),
+                           (top_mid_orig_x, top_mid_orig_y - handle_offset)]
+
+            if _numpy_available and self.original_image and self.processed_base_size:
+                # This runs on every redraw during a drag: do the trig once
+                # and push all points through a single rotate + scale + pan
+                # expression instead of per-point _rotate_point /
+                # original_to_canvas_coords round-trips.
+                zoom = self.zoom_factor
+                pan_x, pan_y = self.pan_offset
+                orig_w, orig_h = self.original_image.size
+                proc_w, proc_h = self.processed_base_size
+                if orig_w <= 0 or orig_h <= 0: return
+                scale = np.array([proc_w / orig_w * zoom, proc_h / orig_h * zoom], dtype=np.float32)
+                rotated = self._rotate_points_batch(center_x_orig, center_y_orig, points_orig, angle_degrees)
+                canvas_pts = (rotated * scale + [pan_x, pan_y]).astype(int)
+                corners_canvas = [tuple(p) for p in canvas_pts[:4]]
+                tm_cx, tm_cy = canvas_pts[4]
+                rh_cx, rh_cy = canvas_pts[5]
+            else:
+                rotated = [self._rotate_point(center_x_orig, center_y_orig, px, py, angle_degrees)
+                           for px, py in points_orig]
+                canvas_pts = [self.original_to_canvas_coords(px, py) for px, py in rotated]
+                if any(c is None for pair in canvas_pts for c in pair):
+                    # print(f"Warning: Could not get canvas coords for all interactive corners ({uuid}).")
+                    return
+                corners_canvas = canvas_pts[:4]
+                tm_cx, tm_cy = canvas_pts[4]
+                rh_cx, rh_cy = canvas_pts[5]
 
             tag_prefix = "overlay_wm" if area_type == 'wm' else "overlay_layer"
             tags = (tag_prefix, f"area_{uuid}") # Common tag + specific ID
@@ -2104,59 +2941,117 @@ class ImageMasterProApp:
             handle_size = max(3, int(3 / self.zoom_factor)) # Scale handle size slightly with zoom
             handle_tags = ['resize_tl', 'resize_tr', 'resize_br', 'resize_bl']
             for i, (cx, cy) in enumerate(corners_canvas):
-                self.preview_canvas.create_rectangle(
+                item_id = self.preview_canvas.create_rectangle(
                     cx - handle_size, cy - handle_size, cx + handle_size, cy + handle_size,
                     fill="cyan", outline="black", width=1, tags=(f"{tag_prefix}_handle", handle_tags[i], f"handle_{uuid}") # Specific ID tag
                 )
-
-            # Draw rotation handle
-            top_mid_orig_x = (x0_orig + x1_orig) / 2
-            top_mid_orig_y = y0_orig
-            handle_offset = max(20, (y1_orig - y0_orig) * 0.1) # Offset in original coords
-            rot_handle_orig_x = top_mid_orig_x
-            rot_handle_orig_y = top_mid_orig_y - handle_offset
-            rot_handle_rotated_orig = self._rotate_point(center_x_orig, center_y_orig, rot_handle_orig_x, rot_handle_orig_y, angle_degrees)
-            rh_cx, rh_cy = self.original_to_canvas_coords(rot_handle_rotated_orig[0], rot_handle_rotated_orig[1])
-
-            if rh_cx is not None and rh_cy is not None:
-                 top_mid_rotated_orig = self._rotate_point(center_x_orig, center_y_orig, top_mid_orig_x, top_mid_orig_y, angle_degrees)
-                 tm_cx, tm_cy = self.original_to_canvas_coords(top_mid_rotated_orig[0], top_mid_rotated_orig[1])
-                 if tm_cx is not None and tm_cy is not None:
-                      self.preview_canvas.create_line(tm_cx, tm_cy, rh_cx, rh_cy, fill="cyan", tags=tags)
-
-                 rot_handle_size = max(4, int(4 / self.zoom_factor)) # Scale handle size
-                 self.preview_canvas.create_oval(
-                     rh_cx - rot_handle_size, rh_cy - rot_handle_size, rh_cx + rot_handle_size, rh_cy + rot_handle_size,
-                     fill="cyan", outline="black", width=1, tags=(f"{tag_prefix}_handle", "rotate", f"handle_{uuid}") # Specific ID tag
-                 )
+                self._canvas_item_meta[item_id] = (area_type, uuid, handle_tags[i],
+                                                   (cx - handle_size, cy - handle_size,
+                                                    cx + handle_size, cy + handle_size))
+
+            # Draw rotation handle (line from the top-mid anchor, knob at the end)
+            self.preview_canvas.create_line(tm_cx, tm_cy, rh_cx, rh_cy, fill="cyan", tags=tags)
+            rot_handle_size = max(4, int(4 / self.zoom_factor)) # Scale handle size
+            item_id = self.preview_canvas.create_oval(
+                rh_cx - rot_handle_size, rh_cy - rot_handle_size, rh_cx + rot_handle_size, rh_cy + rot_handle_size,
+                fill="cyan", outline="black", width=1, tags=(f"{tag_prefix}_handle", "rotate", f"handle_{uuid}") # Specific ID tag
+            )
+            self._canvas_item_meta[item_id] = (area_type, uuid, 'rotate',
+                                               (rh_cx - rot_handle_size, rh_cy - rot_handle_size,
+                                                rh_cx + rot_handle_size, rh_cy + rot_handle_size))
         except Exception as e:
-             print(f"Error drawing interactive handles for {uuid}: {e}")
+             _log.warning(f"Error drawing interactive handles for {uuid}: {e}")
 
 
     # --- Canvas Interaction (Mouse Events) ---
 
+    def _get_geom_index(self, settings):
+        """Returns the SoA geometry index for the current image, rebuilding if stale.
+
+        Parallel NumPy columns (rects, angles, shape codes) plus aligned uuid
+        lists - hit testing reduces to a few vectorized comparisons over all
+        elements instead of a Python loop with dict lookups per element.
+        """
+        if self._geom_index is not None:
+            return self._geom_index
+
+        index = {}
+        # Overlays: rotated rects (store cos/sin of the *backwards* rotation)
+        ov_uuids, ov_rects, ov_angles = [], [], []
+        for overlay in settings.get('overlays', []):
+            if overlay.get('rect'):
+                ov_uuids.append(overlay['uuid'])
+                ov_rects.append(overlay['rect'])
+                ov_angles.append(overlay.get('angle', 0.0))
+        index['overlay_uuids'] = ov_uuids
+        index['overlay_rects'] = np.array(ov_rects, dtype=np.float32).reshape(-1, 4)
+        neg_rad = np.radians(-np.array(ov_angles, dtype=np.float32))
+        index['overlay_cos'] = np.cos(neg_rad)
+        index['overlay_sin'] = np.sin(neg_rad)
+
+        # Blur/blackout areas: axis-aligned rects/ellipses, coords pre-normalized
+        for kind in ('blur_areas', 'blackout_areas'):
+            uuids, coords, shapes = [], [], []
+            for area in settings.get(kind, []):
+                x0, y0, x1, y1 = area['coords']
+                uuids.append(area['uuid'])
+                coords.append((min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1)))
+                shapes.append(1 if area['shape'] == 'circle' else 0)
+            index[kind + '_uuids'] = uuids
+            index[kind + '_coords'] = np.array(coords, dtype=np.float32).reshape(-1, 4)
+            index[kind + '_shapes'] = np.array(shapes, dtype=np.int8)
+
+        self._geom_index = index
+        return index
+
+    def _hit_rotated_rects(self, rects, cos_a, sin_a, orig_x, orig_y):
+        """Vectorized point-in-rotated-rect over all rows. Returns topmost index or -1."""
+        if len(rects) == 0:
+            return -1
+        cx = (rects[:, 0] + rects[:, 2]) * 0.5
+        cy = (rects[:, 1] + rects[:, 3]) * 0.5
+        dx = orig_x - cx
+        dy = orig_y - cy
+        # Rotate the click point backwards around each center (see _is_point_in_rotated_rect)
+        rx = cx + dx * cos_a - dy * sin_a
+        ry = cy + dx * sin_a + dy * cos_a
+        inside = (rects[:, 0] <= rx) & (rx < rects[:, 2]) & (rects[:, 1] <= ry) & (ry < rects[:, 3])
+        hits = np.nonzero(inside)[0]
+        return int(hits[-1]) if hits.size else -1 # Last in list order = topmost drawn
+
+    def _hit_areas(self, coords, shapes, orig_x, orig_y):
+        """Vectorized point-in-area test (rects and ellipses). Returns topmost index or -1."""
+        if len(coords) == 0:
+            return -1
+        in_rect = ((coords[:, 0] <= orig_x) & (orig_x < coords[:, 2]) &
+                   (coords[:, 1] <= orig_y) & (orig_y < coords[:, 3]))
+        inside = in_rect.copy()
+        circles = shapes == 1
+        if circles.any():
+            # Same divide-free ellipse form as _is_point_in_area: compare
+            # (2*dx*h)^2 + (2*dy*w)^2 against (w*h)^2 instead of dividing
+            w = coords[:, 2] - coords[:, 0]
+            h = coords[:, 3] - coords[:, 1]
+            dx2 = 2.0 * orig_x - (coords[:, 0] + coords[:, 2])
+            dy2 = 2.0 * orig_y - (coords[:, 1] + coords[:, 3])
+            in_ellipse = (dx2 * h) ** 2 + (dy2 * w) ** 2 <= (w * h) ** 2
+            inside[circles] = in_ellipse[circles] & (w[circles] > 0) & (h[circles] > 0)
+        hits = np.nonzero(inside)[0]
+        return int(hits[-1]) if hits.size else -1
+
     def _get_element_at_canvas_coords(self, canvas_x, canvas_y):
         """ Checks canvas coordinates for interactive elements (handles, areas)"""
-        # Check handles first (they are smaller targets)
-        # Find items near the click, adjust tolerance based on zoom?
+        # Check handles first (they are smaller targets). Handles only exist
+        # for the selected element and their canvas-space boxes are recorded
+        # at draw time, so the test is a few Python compares over at most five
+        # entries instead of a Tk find_overlapping scan of every canvas item.
         tolerance = max(5, int(5 / self.zoom_factor))
-        nearby_items = self.preview_canvas.find_overlapping(canvas_x - tolerance, canvas_y - tolerance, canvas_x + tolerance, canvas_y + tolerance)
-
-        for item_id in reversed(nearby_items): # Check topmost first
-            tags = self.preview_canvas.gettags(item_id)
-            if any(t.startswith("overlay_wm_handle") or t.startswith("overlay_layer_handle") for t in tags):
-                handle_type = None
-                area_uuid = None
-                for tag in tags:
-                    if tag in ['resize_tl', 'resize_tr', 'resize_br', 'resize_bl', 'rotate']:
-                        handle_type = tag
-                    elif tag.startswith("handle_"):
-                        area_uuid = tag.split("_", 1)[1]
-
-                if handle_type and area_uuid:
-                    # Determine if it's the main WM or an overlay
-                    area_type = 'wm' if area_uuid == 'main_wm' else 'overlay'
-                    return area_type, area_uuid, handle_type # e.g., 'overlay', 'uuid123', 'resize_tr'
+        qx0, qy0 = canvas_x - tolerance, canvas_y - tolerance
+        qx1, qy1 = canvas_x + tolerance, canvas_y + tolerance
+        for area_type, elem_uuid, handle_type, (hx0, hy0, hx1, hy1) in \
+                reversed(self._canvas_item_meta.values()): # Topmost first
+            if hx0 <= qx1 and hx1 >= qx0 and hy0 <= qy1 and hy1 >= qy0:
+                return area_type, elem_uuid, handle_type # e.g. ('overlay', 'uuid123', 'resize_tr')
 
         # If no handle, check for area bodies
         orig_x, orig_y = self.canvas_to_original_coords(canvas_x, canvas_y)
@@ -2165,7 +3060,28 @@ class ImageMasterProApp:
         settings = self.image_settings.get(self.current_image_path)
         if not settings: return None, None, None
 
-        # Check overlays (topmost first - reverse order)
+        if _numpy_available:
+            # Vectorized scan over the SoA geometry index
+            index = self._get_geom_index(settings)
+            hit = self._hit_rotated_rects(index['overlay_rects'], index['overlay_cos'],
+                                          index['overlay_sin'], orig_x, orig_y)
+            if hit >= 0:
+                return 'overlay', index['overlay_uuids'][hit], 'drag' # Dragging the body
+
+            # Check main Image WM (if enabled and placed) - single element, plain test
+            wm_info = self.wm_img_info # Use global watermark info
+            if self.use_image_watermark.get() and wm_info and wm_info.get('rect'):
+                if self._is_point_in_rotated_rect(orig_x, orig_y, wm_info['rect'], wm_info['angle']):
+                     return 'wm', 'main_wm', 'drag'
+
+            for kind, label in (('blackout_areas', 'blackout'), ('blur_areas', 'blur')):
+                hit = self._hit_areas(index[kind + '_coords'], index[kind + '_shapes'], orig_x, orig_y)
+                if hit >= 0:
+                    return label, index[kind + '_uuids'][hit], 'drag'
+
+            return None, None, None
+
+        # Fallback (no NumPy): check overlays topmost first - reverse order
         overlays = settings.get('overlays', [])
         for overlay in reversed(overlays):
             if overlay.get('rect'):
@@ -2194,21 +3110,27 @@ class ImageMasterProApp:
 
 
     def _is_point_in_area(self, orig_x, orig_y, area_shape, coords_orig):
-        """Checks if original image coordinates are inside the non-rotated blur/blackout area."""
+        """Checks if original image coordinates are inside the non-rotated blur/blackout area.
+
+        Area coords are normalized (x0<x1, y0<y1) at create/update time, so
+        no re-ordering is needed here on the per-mouse-event path.
+        """
         if orig_x is None or orig_y is None: return False
         try:
-            x0, y0, x1, y1 = map(int, coords_orig)
-            if x0 > x1: x0, x1 = x1, x0
-            if y0 > y1: y0, y1 = y1, y0
+            x0, y0, x1, y1 = coords_orig
 
             if area_shape == "rectangle":
                 return x0 <= orig_x < x1 and y0 <= orig_y < y1
             elif area_shape == "circle":
-                center_x = (x0 + x1) / 2; center_y = (y0 + y1) / 2
-                radius_x = abs(x1 - x0) / 2; radius_y = abs(y1 - y0) / 2
-                if radius_x <= 0 or radius_y <= 0: return False
-                normalized_dist_sq = ((orig_x - center_x) / radius_x)**2 + ((orig_y - center_y) / radius_y)**2
-                return normalized_dist_sq <= 1
+                # Divide-free ellipse test: (dx/rx)^2 + (dy/ry)^2 <= 1 with
+                # both sides multiplied through by (rx*ry)^2 - divides cost
+                # several multiplies each and this runs per candidate per
+                # mouse event. Doubled deltas also fold away the /2 halving.
+                w = x1 - x0; h = y1 - y0
+                if w <= 0 or h <= 0: return False
+                dx = 2 * orig_x - (x0 + x1) # == 2 * (orig_x - center_x)
+                dy = 2 * orig_y - (y0 + y1)
+                return (dx * h)**2 + (dy * w)**2 <= (w * h)**2
         except (ValueError, TypeError, IndexError) as e:
             print(f"Error checking point in area ({area_shape}, {coords_orig}): {e}")
         return False
@@ -2221,6 +3143,16 @@ class ImageMasterProApp:
             center_x = (x0 + x1) / 2
             center_y = (y0 + y1) / 2
 
+            # Cheap reject before any trig: every point of the rotated rect
+            # lies within its circumscribed circle (radius = half diagonal),
+            # so most misses cost four multiplies instead of sin/cos.
+            dx = orig_x - center_x
+            dy = orig_y - center_y
+            half_w = (x1 - x0) / 2
+            half_h = (y1 - y0) / 2
+            if dx * dx + dy * dy > half_w * half_w + half_h * half_h:
+                return False
+
             # Rotate the click point *backwards* around the center
             rotated_click_x, rotated_click_y = self._rotate_point(center_x, center_y, orig_x, orig_y, -angle_degrees)
 
@@ -2306,31 +3238,26 @@ class ImageMasterProApp:
             new_angle = start_angle
 
             if self.edit_interaction_mode == 'drag':
-                # Calculate delta in original coords
+                # The canvas->original delta is a fixed scale for the whole
+                # drag (zoom and processed size can't change mid-drag), so one
+                # multiply per axis replaces the four coordinate-conversion
+                # calls plus origin-offset subtraction per motion event.
                 start_canvas_x, start_canvas_y = self.edit_drag_mouse_start
-                delta_canvas_x = canvas_x - start_canvas_x
-                delta_canvas_y = canvas_y - start_canvas_y
-                # Need delta in processed coords first
-                proc_x_start, proc_y_start = self.get_processed_coords(start_canvas_x, start_canvas_y)
-                proc_x_curr, proc_y_curr = self.get_processed_coords(canvas_x, canvas_y)
-
-                if proc_x_start is not None and proc_x_curr is not None:
-                     delta_proc_x = proc_x_curr - proc_x_start
-                     delta_proc_y = proc_y_curr - proc_y_start
-                     # Convert delta in processed space to delta in original space
-                     delta_orig_x, delta_orig_y = self.processed_to_original_coords(delta_proc_x, delta_proc_y)
-                     delta_orig_x0, delta_orig_y0 = self.processed_to_original_coords(0, 0) # Get origin offset
-                     if delta_orig_x is not None and delta_orig_x0 is not None:
-                        delta_orig_x -= delta_orig_x0 # Subtract offset
-                        delta_orig_y -= delta_orig_y0
-
-                        # Apply delta to original starting position
-                        new_rect[0] = start_rect[0] + delta_orig_x
-                        new_rect[1] = start_rect[1] + delta_orig_y
-                        new_rect[2] = start_rect[2] + delta_orig_x
-                        new_rect[3] = start_rect[3] + delta_orig_y
-                     else: print("Warning: Could not calculate original delta for drag.")
-                else: print("Warning: Could not get processed coords for drag delta.")
+                proc_size = self.processed_base_size
+                if (self.zoom_factor > 1e-6 and self.original_image and
+                        proc_size and proc_size[0] > 0 and proc_size[1] > 0):
+                     orig_w, orig_h = self.original_image.size
+                     scale_x = orig_w / (proc_size[0] * self.zoom_factor)
+                     scale_y = orig_h / (proc_size[1] * self.zoom_factor)
+                     delta_orig_x = (canvas_x - start_canvas_x) * scale_x
+                     delta_orig_y = (canvas_y - start_canvas_y) * scale_y
+
+                     # Apply delta to original starting position
+                     new_rect[0] = start_rect[0] + delta_orig_x
+                     new_rect[1] = start_rect[1] + delta_orig_y
+                     new_rect[2] = start_rect[2] + delta_orig_x
+                     new_rect[3] = start_rect[3] + delta_orig_y
+                else: _log.warning("Could not calculate original delta for drag.")
 
 
             elif self.edit_interaction_mode == 'rotate':
@@ -2379,8 +3306,12 @@ class ImageMasterProApp:
             # --- Update the actual element's state in image_settings ---
             self._update_area_state(self.selected_area_type, self.selected_area_uuid, tuple(new_rect), new_angle)
 
-            # Redraw preview (debounced might be better here?)
-            self.update_preview_safe() # Use safe direct update for responsiveness
+            # Coalesce redraws: <Motion> fires at 60-120 Hz, far faster than
+            # the pipeline renders. Collapse the burst to one render per Tk
+            # idle slot - the flush always draws the latest committed state.
+            if not self._drag_render_pending:
+                self._drag_render_pending = True
+                self.preview_canvas.after_idle(self._flush_drag_render)
 
 
         # --- Handle Selection Rectangle Drawing ---
@@ -2389,6 +3320,20 @@ class ImageMasterProApp:
             x0_c, y0_c = self.selection_start_coords
             self.preview_canvas.coords(self.selection_rect_id, x0_c, y0_c, canvas_x, canvas_y)
 
+    def _flush_drag_render(self):
+        """Renders once for a burst of coalesced drag motions (two-tier).
+
+        While an interaction is live only the existing composited frame is
+        redrawn: outlines and handles are drawn from the just-updated settings
+        state, so they track the mouse, while the expensive blur/watermark
+        compositing is deferred to the single full render on mouse release.
+        """
+        self._drag_render_pending = False
+        if self.edit_interaction_mode:
+            self._redisplay()
+        else:
+            self.update_preview_safe()
+
 
     def on_mouse_release(self, event):
         """Handles mouse button release for interaction or selection finalization."""
@@ -2475,24 +3420,40 @@ class ImageMasterProApp:
         self.update_widget_states()
 
 
+    def _get_area_lookup(self):
+        """Returns the uuid -> element dict index for the current image.
+
+        Drag interactions resolve uuids on every press/motion/release; this
+        replaces the linear next(...) scans with one dict hit. Rebuilt lazily
+        and kept off the settings dicts themselves so it never leaks into the
+        saved JSON; membership changes mark it stale (_area_lookup = None).
+        """
+        if self._area_lookup is not None and self._area_lookup_path == self.current_image_path:
+            return self._area_lookup
+        lookup = {'blur': {}, 'blackout': {}, 'overlay': {}}
+        settings = self.image_settings.get(self.current_image_path)
+        if settings:
+            for area in settings.get('blur_areas', []): lookup['blur'][area['uuid']] = area
+            for area in settings.get('blackout_areas', []): lookup['blackout'][area['uuid']] = area
+            for overlay in settings.get('overlays', []): lookup['overlay'][overlay['uuid']] = overlay
+        self._area_lookup = lookup
+        self._area_lookup_path = self.current_image_path
+        return lookup
+
+
     def _get_area_rect_angle(self, area_type, area_uuid):
         """ Gets the current rect (original coords) and angle for a given area """
         if not self.current_image_path: return None, 0.0
-        settings = self.image_settings.get(self.current_image_path)
-        if not settings: return None, 0.0
 
-        if area_type == 'blur':
-            area = next((a for a in settings.get('blur_areas', []) if a['uuid'] == area_uuid), None)
-            return (area['coords'], 0.0) if area else (None, 0.0)
-        elif area_type == 'blackout':
-            area = next((a for a in settings.get('blackout_areas', []) if a['uuid'] == area_uuid), None)
+        if area_type in ('blur', 'blackout'):
+            area = self._get_area_lookup()[area_type].get(area_uuid)
             return (area['coords'], 0.0) if area else (None, 0.0)
         elif area_type == 'wm' and area_uuid == 'main_wm':
             wm_info = self.wm_img_info # Use global watermark info
             # Ensure rect exists before returning
             return (wm_info.get('rect'), wm_info.get('angle', 0.0)) if wm_info and wm_info.get('rect') else (None, 0.0)
         elif area_type == 'overlay':
-            overlay = next((o for o in settings.get('overlays', []) if o['uuid'] == area_uuid), None)
+            overlay = self._get_area_lookup()['overlay'].get(area_uuid)
             # Ensure rect exists
             return (overlay.get('rect'), overlay.get('angle', 0.0)) if overlay and overlay.get('rect') else (None, 0.0)
 
@@ -2502,34 +3463,29 @@ class ImageMasterProApp:
     def _update_area_state(self, area_type, area_uuid, new_rect, new_angle):
          """ Updates the state (rect/angle) of an area in image_settings """
          if not self.current_image_path: return
-         settings = self.image_settings.get(self.current_image_path)
-         if not settings: return
-         updated = False
 
          # Ensure rect coords are integers
          new_rect = tuple(map(int, new_rect)) if new_rect else None
 
-         if area_type == 'blur':
-             for area in settings.get('blur_areas', []):
-                  if area['uuid'] == area_uuid: area['coords'] = new_rect; updated = True; break
-         elif area_type == 'blackout':
-              for area in settings.get('blackout_areas', []):
-                   if area['uuid'] == area_uuid: area['coords'] = new_rect; updated = True; break
+         if area_type in ('blur', 'blackout'):
+             area = self._get_area_lookup()[area_type].get(area_uuid)
+             if area:
+                  if new_rect:
+                       # Store normalized (x0<x1, y0<y1) so hit tests and the
+                       # geometry index never re-order on the hot path
+                       x0, y0, x1, y1 = new_rect
+                       new_rect = (min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1))
+                  area['coords'] = new_rect
          elif area_type == 'wm' and area_uuid == 'main_wm':
               # Update the global watermark info directly
               if self.wm_img_info: # Check if global info exists
                    self.wm_img_info['rect'] = new_rect
                    self.wm_img_info['angle'] = new_angle
-                   updated = True
          elif area_type == 'overlay':
-             for overlay in settings.get('overlays', []):
-                  if overlay['uuid'] == area_uuid:
-                       overlay['rect'] = new_rect
-                       overlay['angle'] = new_angle
-                       updated = True
-                       break
-         # if updated:
-         #      print(f"Updated state for {area_type} {area_uuid}: Rect={new_rect}, Angle={new_angle:.1f}")
+             overlay = self._get_area_lookup()['overlay'].get(area_uuid)
+             if overlay:
+                  overlay['rect'] = new_rect
+                  overlay['angle'] = new_angle
 
 
     # --- Manual Edits (Blur/Blackout) Management ---
@@ -2541,7 +3497,7 @@ class ImageMasterProApp:
             return
 
         shape, coords_orig, strength = self.current_selection_original
-        area_uuid = str(uuid.uuid4())
+        area_uuid = self._new_element_id()
         area_data = {'uuid': area_uuid, 'shape': shape, 'coords': coords_orig}
         area_type = 'blur' if blur else 'blackout'
         if blur: area_data['strength'] = strength
@@ -2570,9 +3526,16 @@ class ImageMasterProApp:
         settings = self.image_settings.get(self.current_image_path)
         if not settings: return
 
+        coords = area_data.get('coords')
+        if coords:
+            # Normalize once at insert; consumers then rely on x0<x1, y0<y1
+            x0, y0, x1, y1 = coords
+            area_data['coords'] = (min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1))
+
         list_name = area_type + '_areas'
         if list_name not in settings: settings[list_name] = []
         settings[list_name].append(area_data)
+        self._area_lookup = None # Membership changed
 
 
     def remove_selected_area_action(self):
@@ -2614,20 +3577,20 @@ class ImageMasterProApp:
         settings = self.image_settings.get(self.current_image_path)
         if not settings: return False
 
-        list_name = area_type + '_areas'
-        target_list = settings.get(list_name, [])
-        initial_len = len(target_list)
-        settings[list_name] = [area for area in target_list if area['uuid'] != area_uuid]
-        return len(settings[list_name]) < initial_len
+        area = self._get_area_lookup()[area_type].get(area_uuid)
+        self._area_lookup = None # Membership changes below
+        if area is None: return False
+        try:
+            settings.get(area_type + '_areas', []).remove(area)
+            return True
+        except ValueError:
+            return False
 
 
     def _get_edit_area_data(self, area_type, area_uuid):
          """Gets the data dict for a specific blur/blackout area."""
          if not self.current_image_path: return None
-         settings = self.image_settings.get(self.current_image_path)
-         if not settings: return None
-         target_list = settings.get(area_type + '_areas', [])
-         return next((area for area in target_list if area['uuid'] == area_uuid), None)
+         return self._get_area_lookup()[area_type].get(area_uuid)
 
 
     def clear_manual_areas_action(self):
@@ -2661,6 +3624,7 @@ class ImageMasterProApp:
          if not settings: return
          settings['blur_areas'] = []
          settings['blackout_areas'] = []
+         self._area_lookup = None # Membership changed
 
 
     def clear_selection_rectangle(self):
@@ -2834,6 +3798,7 @@ class ImageMasterProApp:
 
     def _update_overlay_listbox(self):
         """Updates the overlay listbox based on current image settings."""
+        if not hasattr(self, 'overlay_listbox'): return # Overlays tab not built yet
         self.overlay_listbox.delete(0, tk.END)
         if not self.current_image_path: return
         settings = self.image_settings.get(self.current_image_path)
@@ -2892,6 +3857,7 @@ class ImageMasterProApp:
 
     def _update_overlay_ui_for_selection(self):
          """ Updates overlay controls (opacity scale) based on selection. """
+         if not hasattr(self, 'overlay_opacity_scale'): return # Overlays tab not built yet
          if not self.current_image_path: return
          settings = self.image_settings.get(self.current_image_path)
          if not settings: return
@@ -2900,12 +3866,12 @@ class ImageMasterProApp:
               overlay = next((o for o in settings['overlays'] if o['uuid'] == self.selected_area_uuid), None)
               if overlay:
                    self.overlay_opacity_var.set(overlay.get('opacity', 128))
-                   self.overlay_opacity_scale.config(state=tk.NORMAL)
+                   self._set_state(self.overlay_opacity_scale, tk.NORMAL)
                    return
 
          # If no overlay selected or not found, disable scale and reset var
          self.overlay_opacity_var.set(128)
-         self.overlay_opacity_scale.config(state=tk.DISABLED)
+         self._set_state(self.overlay_opacity_scale, tk.DISABLED)
 
 
     def add_overlay_action(self):
@@ -2936,7 +3902,7 @@ class ImageMasterProApp:
             return False
         try:
             overlay_img = Image.open(filepath).convert("RGBA")
-            overlay_uuid = str(uuid.uuid4())
+            overlay_uuid = self._new_element_id()
             new_overlay = {
                  'uuid': overlay_uuid,
                  'path': filepath,
@@ -2997,6 +3963,7 @@ class ImageMasterProApp:
         if not settings: return
         if 'overlays' not in settings: settings['overlays'] = []
         settings['overlays'].append(overlay_data)
+        self._area_lookup = None # Membership changed
 
 
     def remove_selected_overlay_action(self):
@@ -3040,6 +4007,7 @@ class ImageMasterProApp:
         if not settings or 'overlays' not in settings: return False
         initial_len = len(settings['overlays'])
         settings['overlays'] = [o for o in settings['overlays'] if o['uuid'] != overlay_uuid]
+        self._area_lookup = None # Membership changed
         return len(settings['overlays']) < initial_len
 
 
@@ -3127,7 +4095,7 @@ class ImageMasterProApp:
 
     def _reset_object_placement(self, object_info_dict):
          """Sets initial size/position for WM or overlay dict *in place*."""
-         if not self.original_image or 'pil_image' not in object_info_dict or not object_info_dict['pil_image']:
+         if not self.original_image or self._ensure_overlay_pil(object_info_dict) is None:
               object_info_dict['rect'] = None
               object_info_dict['angle'] = 0.0
               return
@@ -3254,9 +4222,27 @@ class ImageMasterProApp:
              print(f"Filter Error ({filter_val}): {e}")
              return img # Return original on error
 
+    # Classic sepia weights (rows produce output R, G, B from input RGB)
+    _SEPIA_MATRIX = ((0.393, 0.769, 0.189),
+                     (0.349, 0.686, 0.168),
+                     (0.272, 0.534, 0.131))
+
     def _apply_sepia_filter(self, img):
         """Applies sepia tone. Assumes img is RGBA."""
         if img.mode != 'RGBA': img = img.convert('RGBA')
+
+        # Fast path: one matrix multiply over the whole pixel array instead
+        # of a Python-level loop touching every pixel tuple
+        if _numpy_available:
+            try:
+                arr = np.asarray(img, dtype=np.float32)
+                sepia = np.array(self._SEPIA_MATRIX, dtype=np.float32)
+                arr[..., :3] = arr[..., :3] @ sepia.T # Alpha passes through
+                np.clip(arr, 0, 255, out=arr)
+                return Image.fromarray(arr.astype(np.uint8), 'RGBA')
+            except Exception as e:
+                print(f"Vectorized sepia error, falling back to loop: {e}")
+
         width, height = img.size
         pixels = img.load()
         for y in range(height):
@@ -3268,7 +4254,7 @@ class ImageMasterProApp:
                 pixels[x, y] = (min(255, tr), min(255, tg), min(255, tb), a)
         return img
 
-    def apply_resize(self, img, preset_val, w_str, h_str):
+    def apply_resize(self, img, preset_val, w_str, h_str, resample=Image.Resampling.LANCZOS):
         target_w, target_h = None, None
         if preset_val != "Custom":
              dims = { "YouTube Thumbnail (1280x720)": (1280, 720), "Facebook Post (1200x630)": (1200, 630),
@@ -3296,7 +4282,7 @@ class ImageMasterProApp:
                  if target_w and target_h:
                      if (target_w, target_h) != (current_w, current_h):
                           # print(f"Resizing from {current_w}x{current_h} to {target_w}x{target_h}")
-                          img = img.resize((target_w, target_h), Image.Resampling.LANCZOS)
+                          img = img.resize((target_w, target_h), resample)
              except ZeroDivisionError:
                   print("Resize Error: Original dimension was zero.")
              except Exception as e:
@@ -3309,6 +4295,14 @@ class ImageMasterProApp:
         contrast = adj_settings.get('contrast', 1.0)
         saturation = adj_settings.get('saturation', 1.0)
 
+        # Fast path: fuse all three adjustments into one pass over the pixels
+        if _numpy_available and img.mode in ('RGB', 'RGBA'):
+            try:
+                return self._apply_adjustments_fused(img, brightness, contrast, saturation)
+            except Exception as e:
+                print(f"Fused adjustment error, falling back to PIL: {e}")
+
+        # Fallback: three sequential ImageEnhance passes
         # Apply only if value is different from default 1.0
         try:
             if abs(brightness - 1.0) > 1e-6:
@@ -3324,11 +4318,47 @@ class ImageMasterProApp:
             print(f"Adjustment application error: {e}")
         return img
 
+    def _apply_adjustments_fused(self, img, brightness, contrast, saturation):
+        """Single-pass NumPy version of the three ImageEnhance adjustments.
+
+        One float traversal of the pixels replaces three full-image
+        ImageEnhance passes and their intermediate image allocations.
+        Matches PIL semantics: brightness blends with black, contrast with
+        the mean grey level, saturation with the per-pixel luma.
+        """
+        if (abs(brightness - 1.0) <= 1e-6 and abs(contrast - 1.0) <= 1e-6 and
+                abs(saturation - 1.0) <= 1e-6):
+            return img # Nothing to do
+
+        arr = np.asarray(img, dtype=np.float32)
+        rgb = arr[..., :3] # Leave any alpha channel untouched
+        luma = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+        if abs(brightness - 1.0) > 1e-6:
+            rgb *= brightness
+        if abs(contrast - 1.0) > 1e-6:
+            mean = round(float((rgb @ luma).mean())) # PIL rounds the grey mean
+            rgb[:] = mean + (rgb - mean) * contrast
+        if abs(saturation - 1.0) > 1e-6:
+            gray = rgb @ luma
+            rgb[:] = gray[..., None] + (rgb - gray[..., None]) * saturation
+
+        np.clip(arr, 0, 255, out=arr)
+        return Image.fromarray(arr.astype(np.uint8), img.mode)
+
     def apply_manual_edits(self, img, blur_areas_list, blackout_areas_list):
         """Applies blur and blackout areas to the image (uses original coordinates)."""
         if not blur_areas_list and not blackout_areas_list: return img
 
-        editable_img = img if img.mode == 'RGBA' else img.convert('RGBA')
+        # Blur and blackout don't need alpha; edit RGB/RGBA in place. Exotic
+        # modes convert up for drawing/filtering - to RGBA when they carry
+        # transparency (LA/PA, P with a transparency key), else to RGB.
+        if img.mode in ('RGB', 'RGBA'):
+            editable_img = img
+        elif 'A' in img.getbands() or 'transparency' in img.info:
+            editable_img = img.convert('RGBA')
+        else:
+            editable_img = img.convert('RGB')
         draw = ImageDraw.Draw(editable_img)
         current_w, current_h = editable_img.size
         if not self.original_image: return img # Need original size for scaling
@@ -3338,29 +4368,55 @@ class ImageMasterProApp:
         scale_y = current_h / original_h if original_h > 0 else 1
 
         # Apply Blur Areas
-        for area in blur_areas_list:
-             shape, coords_orig, strength = area['shape'], area['coords'], area['strength']
-             ox0, oy0, ox1, oy1 = coords_orig
-             scaled_coords = (ox0 * scale_x, oy0 * scale_y, ox1 * scale_x, oy1 * scale_y)
-             crop_region = (max(0, int(scaled_coords[0])), max(0, int(scaled_coords[1])),
-                           min(current_w, int(scaled_coords[2])), min(current_h, int(scaled_coords[3])))
-
-             if crop_region[2] > crop_region[0] and crop_region[3] > crop_region[1]:
-                  try:
-                      cropped = editable_img.crop(crop_region)
-                      # Ensure blur radius isn't excessively large for small crops
-                      effective_strength = min(strength, max(cropped.width, cropped.height)/4) if cropped.width > 0 and cropped.height > 0 else strength
-                      blurred_cropped = cropped.filter(ImageFilter.GaussianBlur(radius=effective_strength))
-
-                      if shape == 'rectangle':
-                          editable_img.paste(blurred_cropped, crop_region)
-                      elif shape == 'circle':
-                          mask = Image.new('L', cropped.size, 0)
-                          mask_draw = ImageDraw.Draw(mask)
-                          mask_draw.ellipse((0, 0, cropped.width-1, cropped.height-1), fill=255) # Use -1 for bounds
-                          editable_img.paste(blurred_cropped, crop_region, mask)
-                          del mask_draw
-                  except Exception as e: print(f"Blur application error: {e}")
+        # Areas are bucketed by effective radius: all areas sharing a radius are
+        # drawn into one union mask and blurred in a single Gaussian pass, so N
+        # same-strength areas cost one convolution instead of N.
+        if blur_areas_list:
+            blur_buckets = {} # radius -> [union mask, union bbox]
+            for area in blur_areas_list:
+                 shape, coords_orig, strength = area['shape'], area['coords'], area['strength']
+                 ox0, oy0, ox1, oy1 = coords_orig
+                 scaled_coords = (ox0 * scale_x, oy0 * scale_y, ox1 * scale_x, oy1 * scale_y)
+                 crop_region = (max(0, int(scaled_coords[0])), max(0, int(scaled_coords[1])),
+                               min(current_w, int(scaled_coords[2])), min(current_h, int(scaled_coords[3])))
+
+                 if crop_region[2] <= crop_region[0] or crop_region[3] <= crop_region[1]:
+                     continue
+                 region_w = crop_region[2] - crop_region[0]
+                 region_h = crop_region[3] - crop_region[1]
+                 # Ensure blur radius isn't excessively large for small areas
+                 effective_strength = min(strength, max(region_w, region_h) / 4)
+                 radius = round(effective_strength, 1)
+
+                 bucket = blur_buckets.get(radius)
+                 if bucket is None:
+                     bucket = [Image.new('L', editable_img.size, 0), list(crop_region)]
+                     blur_buckets[radius] = bucket
+                 union_mask, union_bbox = bucket
+                 mask_draw = ImageDraw.Draw(union_mask)
+                 shape_coords = (crop_region[0], crop_region[1], crop_region[2]-1, crop_region[3]-1) # Use -1 for bounds
+                 if shape == 'circle':
+                     mask_draw.ellipse(shape_coords, fill=255)
+                 else:
+                     mask_draw.rectangle(shape_coords, fill=255)
+                 del mask_draw
+                 union_bbox[0] = min(union_bbox[0], crop_region[0])
+                 union_bbox[1] = min(union_bbox[1], crop_region[1])
+                 union_bbox[2] = max(union_bbox[2], crop_region[2])
+                 union_bbox[3] = max(union_bbox[3], crop_region[3])
+
+            for radius, (union_mask, union_bbox) in blur_buckets.items():
+                 try:
+                     # Pad the union bbox by the radius so the blur sees the real
+                     # neighbourhood instead of edge-extended crop pixels
+                     pad = int(radius * 2) + 1
+                     bx0, by0 = max(0, union_bbox[0] - pad), max(0, union_bbox[1] - pad)
+                     bx1, by1 = min(current_w, union_bbox[2] + pad), min(current_h, union_bbox[3] + pad)
+                     region = editable_img.crop((bx0, by0, bx1, by1))
+                     blurred_region = region.filter(ImageFilter.GaussianBlur(radius=radius))
+                     mask_region = union_mask.crop((bx0, by0, bx1, by1))
+                     editable_img.paste(Image.composite(blurred_region, region, mask_region), (bx0, by0))
+                 except Exception as e: _log.warning(f"Blur application error: {e}")
 
         # Apply Blackout Areas
         for area in blackout_areas_list:
@@ -3373,32 +4429,113 @@ class ImageMasterProApp:
                   try:
                       if shape == 'rectangle': draw.rectangle(scaled_coords, fill="black")
                       elif shape == 'circle': draw.ellipse(scaled_coords, fill="black")
-                  except Exception as e: print(f"Blackout application error: {e}")
+                  except Exception as e: _log.warning(f"Blackout application error: {e}")
 
         del draw
         return editable_img
 
 
-    def apply_text_watermark(self, img):
-        """Adds text watermark based on GLOBAL settings."""
+    def _acquire_layer(self, size, mode='RGBA'):
+        """Returns a cleared scratch image from the pool (or a fresh one)."""
+        key = (size[0], size[1], mode)
+        with self._layer_pool_lock:
+            free = self._layer_pool.get(key)
+            layer = free.pop() if free else None
+        if layer is not None:
+            layer.paste((0, 0, 0, 0), (0, 0, size[0], size[1])) # Fast C-level clear
+            return layer
+        return Image.new(mode, size, (0, 0, 0, 0))
+
+    def _release_layer(self, layer):
+        """Hands a scratch image back to the pool for reuse."""
+        key = (layer.width, layer.height, layer.mode)
+        with self._layer_pool_lock:
+            free = self._layer_pool.setdefault(key, [])
+            if len(free) < self._LAYER_POOL_PER_KEY:
+                free.append(layer)
+
+    def _get_text_wm_sprite(self, text, size, color_hex, opacity):
+        """Returns the rasterized text-watermark sprite for the given settings.
+
+        Rasterizing glyphs is the expensive part of the text watermark; the
+        sprite (a tight RGBA tile with opacity baked into its alpha) only
+        changes when text/font size/color/opacity change, so it is cached by
+        that tuple and simply blitted at each position. Rotated variants for
+        Diagonal Fit are cached alongside, keyed by angle. Parameters are
+        passed in (not read from Tk variables) so workers render from a
+        main-thread snapshot.
+        """
+        key = (text, size, color_hex, opacity)
+        with self._wm_cache_lock:
+            cached = self._wm_sprite_cache.get(key)
+            if cached is not None:
+                self._wm_sprite_cache.move_to_end(key) # LRU touch
+                return cached
+
+        # Cache miss: rasterize outside the lock (the expensive part)
+        r, g, b = tuple(int(color_hex.lstrip('#')[i:i+2], 16) for i in (0, 2, 4))
+        color_rgba = (r, g, b, opacity)
+        try: wm_font = ImageFont.truetype("arial.ttf", size)
+        except: wm_font = ImageFont.load_default()
+
+        measure = ImageDraw.Draw(Image.new('RGBA', (1, 1)))
+        try: bbox = measure.textbbox((0,0), text, font=wm_font, anchor='lt'); w=bbox[2]-bbox[0]; h=bbox[3]-bbox[1]
+        except: ts = measure.textsize(text,font=wm_font); w=ts[0]; h=ts[1]
+        del measure
+        w, h = max(1, w), max(1, h)
+
+        sprite = Image.new('RGBA', (w, h), (0,0,0,0))
+        sprite_draw = ImageDraw.Draw(sprite)
+        sprite_draw.text((0, 0), text, font=wm_font, fill=color_rgba, anchor='lt')
+        del sprite_draw
+
+        cached = {'sprite': sprite, 'rotated': {}}
+        with self._wm_cache_lock:
+            # A concurrent worker may have built the same entry meanwhile;
+            # keep whichever landed first so rotated variants accumulate on
+            # one shared dict
+            existing = self._wm_sprite_cache.get(key)
+            if existing is not None:
+                cached = existing
+            else:
+                # Evict least-recently-used variants (sliders generate many)
+                while len(self._wm_sprite_cache) >= self._WM_SPRITE_CACHE_SIZE:
+                    self._wm_sprite_cache.popitem(last=False)
+                self._wm_sprite_cache[key] = cached
+        return cached
+
+    def _snapshot_text_wm_params(self):
+        """Reads the global text-watermark Tk variables into a plain dict."""
+        return {
+            'text': self.watermark_text.get(),
+            'position': self.watermark_position.get(),
+            'size': self.watermark_font_size.get(),
+            'color': self.watermark_color.get(),
+            'opacity': max(0, min(255, self.watermark_opacity.get())),
+        }
+
+    def apply_text_watermark(self, img, wm_params=None):
+        """Adds text watermark based on GLOBAL settings.
+
+        wm_params is a _snapshot_text_wm_params dict; pass one captured on the
+        main thread when calling from a worker so an in-flight render can't
+        mix old and new settings while a slider moves. Defaults to reading
+        the live Tk variables for the direct (main-thread) callers.
+        """
         if img.mode != 'RGBA': img = img.convert('RGBA')
         try:
-            text = self.watermark_text.get()
+            if wm_params is None:
+                wm_params = self._snapshot_text_wm_params()
+            text = wm_params['text']
             if not text: return img
-            size = self.watermark_font_size.get()
-            color_hex = self.watermark_color.get()
-            opacity = max(0, min(255, self.watermark_opacity.get()))
-            position = self.watermark_position.get()
-            r, g, b = tuple(int(color_hex.lstrip('#')[i:i+2], 16) for i in (0, 2, 4))
-            color_rgba = (r, g, b, opacity)
+            position = wm_params['position']
 
-            text_layer = Image.new('RGBA', img.size, (0, 0, 0, 0))
-            draw = ImageDraw.Draw(text_layer)
-            try: wm_font = ImageFont.truetype("arial.ttf", size)
-            except: wm_font = ImageFont.load_default()
+            cached = self._get_text_wm_sprite(text, wm_params['size'],
+                                              wm_params['color'], wm_params['opacity'])
+            sprite = cached['sprite']
+            w, h = sprite.size
 
-            try: bbox = draw.textbbox((0,0), text, font=wm_font, anchor='lt'); w=bbox[2]-bbox[0]; h=bbox[3]-bbox[1]
-            except: ts = draw.textsize(text,font=wm_font); w=ts[0]; h=ts[1]
+            text_layer = self._acquire_layer(img.size)
 
             if position == "Tile":
                 sp_x = w + max(50, w*0.5); sp_y = h + max(30, h*0.5)
@@ -3407,34 +4544,36 @@ class ImageMasterProApp:
                 y_tile = -(h//2)
                 while y_tile < img.height:
                      x_tile = -(w//2)
-                     while x_tile < img.width: draw.text((x_tile,y_tile), text, font=wm_font, fill=color_rgba, anchor='lt'); x_tile += sp_x
+                     while x_tile < img.width: text_layer.paste(sprite, (int(x_tile), int(y_tile)), sprite); x_tile += sp_x
                      y_tile += sp_y
             elif position == "Diagonal Fit":
                  cx, cy = img.width/2, img.height/2
-                 max_dim = int(math.sqrt(w**2 + h**2)) + 2
-                 txt_img = Image.new('RGBA', (max_dim, max_dim), (0,0,0,0))
-                 txt_draw = ImageDraw.Draw(txt_img)
-                 txt_draw.text((max_dim/2, max_dim/2), text, font=wm_font, fill=color_rgba, anchor='mm')
                  angle = -math.degrees(math.atan2(img.height, img.width)) if img.width > 0 else 0
-                 rot_txt = txt_img.rotate(angle, expand=True, resample=Image.Resampling.BICUBIC)
+                 angle_key = round(angle, 1)
+                 with self._wm_cache_lock:
+                      rot_txt = cached['rotated'].get(angle_key)
+                 if rot_txt is None:
+                      rot_txt = sprite.rotate(angle, expand=True, resample=Image.Resampling.BICUBIC)
+                      with self._wm_cache_lock:
+                           cached['rotated'][angle_key] = rot_txt
                  rw, rh = rot_txt.size
                  px, py = int(cx - rw / 2), int(cy - rh / 2)
                  text_layer.paste(rot_txt, (px, py), rot_txt)
-                 del txt_draw
             else: # Standard placement
                  x_pos, y_pos = self._get_watermark_position_coords(img.size, (w, h), position)
-                 draw.text((x_pos, y_pos), text, font=wm_font, fill=color_rgba, anchor='lt')
+                 text_layer.paste(sprite, (int(x_pos), int(y_pos)), sprite)
 
-            del draw
-            return Image.alpha_composite(img, text_layer)
+            result = Image.alpha_composite(img, text_layer)
+            self._release_layer(text_layer)
+            return result
         except Exception as e:
-             print(f"Text WM Error: {e}")
+             _log.warning(f"Text WM Error: {e}")
              return img
 
 
     def apply_single_image_overlay(self, img, overlay_info):
         """Applies a single image watermark or overlay based on its info dict."""
-        if not overlay_info or not overlay_info.get('pil_image') or not overlay_info.get('rect'):
+        if not overlay_info or not overlay_info.get('rect') or self._ensure_overlay_pil(overlay_info) is None:
             # print(f"Skipping overlay application: Missing info {overlay_info}")
             return img # Cannot apply if missing image or placement
         if not self.original_image: return img # Need original size for scaling
@@ -3442,63 +4581,143 @@ class ImageMasterProApp:
         if img.mode != 'RGBA': img = img.convert('RGBA')
 
         try:
-            wm_img_original = overlay_info['pil_image'].copy() # Work with a copy
-            opacity = max(0, min(255, overlay_info.get('opacity', 128)))
-            rect_orig = overlay_info['rect']
-            angle = overlay_info.get('angle', 0.0)
+            prepared = self._prepare_overlay_sprite(overlay_info, img.size)
+            if prepared is None: return img # Invalid size
+            wm_rotated, paste_x, paste_y = prepared
+
+            # Create layer and composite
+            wm_layer = self._acquire_layer(img.size)
+            wm_layer.paste(wm_rotated, (paste_x, paste_y), wm_rotated)
+            result = Image.alpha_composite(img, wm_layer)
+            self._release_layer(wm_layer)
+            return result
+
+        except Exception as e:
+            path_hint = os.path.basename(overlay_info.get('path','Unknown')) if overlay_info else 'Unknown'
+            _log.error(f"Error applying image overlay/WM ({path_hint}): {e}", exc_info=True)
+            return img # Return original on error
+
+    def _prepare_overlay_sprite(self, overlay_info, img_size):
+        """Builds the ready-to-paste sprite for one overlay/watermark.
+
+        Applies opacity, scales the original-space rect to img_size, resizes
+        and rotates. Returns (RGBA sprite, paste_x, paste_y) or None if the
+        target size is degenerate. Assumes pil_image is already loaded.
+
+        The opacity+resize+rotate result is the dominant per-preview cost for
+        large watermarks and only changes when the source or its target
+        geometry changes, so finished sprites are LRU-cached; a repeat preview
+        is then a pure alpha blit. Consumers must not mutate the returned
+        sprite (paste/alpha_composite/asarray all only read it). Cache access
+        is guarded by _wm_cache_lock alongside the text-sprite cache.
+        """
+        opacity = max(0, min(255, overlay_info.get('opacity', 128)))
+        rect_orig = overlay_info['rect']
+        angle = overlay_info.get('angle', 0.0)
 
-            # Apply opacity
+        # Scale rect_orig coordinates to the *current* image dimensions
+        current_w, current_h = img_size
+        original_w, original_h = self.original_image.size
+        scale_x = current_w / original_w if original_w > 0 else 1
+        scale_y = current_h / original_h if original_h > 0 else 1
+
+        ox0, oy0, ox1, oy1 = rect_orig
+        scaled_rect = (ox0 * scale_x, oy0 * scale_y, ox1 * scale_x, oy1 * scale_y)
+
+        target_w = int(scaled_rect[2] - scaled_rect[0])
+        target_h = int(scaled_rect[3] - scaled_rect[1])
+
+        if target_w <= 0 or target_h <= 0: return None # Invalid size
+
+        center_x = (scaled_rect[0] + scaled_rect[2]) / 2
+        center_y = (scaled_rect[1] + scaled_rect[3]) / 2
+
+        # id() ties the key to the loaded pixels: _reload_wm_image swaps in a
+        # new pil_image object when the file changes on disk
+        key = (overlay_info.get('path'), id(overlay_info['pil_image']),
+               target_w, target_h, round(angle, 2), opacity)
+        with self._wm_cache_lock:
+            wm_rotated = self._wm_transform_cache.get(key)
+            if wm_rotated is not None:
+                self._wm_transform_cache.move_to_end(key) # LRU touch
+        if wm_rotated is None:
+            wm_img_original = overlay_info['pil_image']
+            # Apply opacity (resize below always allocates, so only copy here)
             if opacity < 255:
                  try:
+                     wm_img_original = wm_img_original.copy()
                      alpha = wm_img_original.split()[3]
                      alpha = alpha.point(lambda p: int(p * (opacity / 255.0)))
                      wm_img_original.putalpha(alpha)
                  except IndexError: pass # No alpha channel
 
-            # Scale rect_orig coordinates to the *current* image dimensions
-            current_w, current_h = img.size
-            original_w, original_h = self.original_image.size
-            scale_x = current_w / original_w if original_w > 0 else 1
-            scale_y = current_h / original_h if original_h > 0 else 1
-
-            ox0, oy0, ox1, oy1 = rect_orig
-            scaled_rect = (ox0 * scale_x, oy0 * scale_y, ox1 * scale_x, oy1 * scale_y)
-
-            target_w = int(scaled_rect[2] - scaled_rect[0])
-            target_h = int(scaled_rect[3] - scaled_rect[1])
-
-            if target_w <= 0 or target_h <= 0: return img # Invalid size
-
-            # Resize, Rotate, Paste
             wm_resized = wm_img_original.resize((target_w, target_h), Image.Resampling.LANCZOS)
             wm_rotated = wm_resized.rotate(angle, expand=True, resample=Image.Resampling.BICUBIC)
-            rot_w, rot_h = wm_rotated.size
-
-            center_x = (scaled_rect[0] + scaled_rect[2]) / 2
-            center_y = (scaled_rect[1] + scaled_rect[3]) / 2
-            paste_x = int(center_x - rot_w / 2)
-            paste_y = int(center_y - rot_h / 2)
+            with self._wm_cache_lock:
+                while len(self._wm_transform_cache) >= self._WM_TRANSFORM_CACHE_SIZE:
+                    self._wm_transform_cache.popitem(last=False)
+                self._wm_transform_cache[key] = wm_rotated
 
-            # Create layer and composite
-            wm_layer = Image.new('RGBA', img.size, (0, 0, 0, 0))
-            wm_layer.paste(wm_rotated, (paste_x, paste_y), wm_rotated)
-            return Image.alpha_composite(img, wm_layer)
-
-        except Exception as e:
-            path_hint = os.path.basename(overlay_info.get('path','Unknown')) if overlay_info else 'Unknown'
-            print(f"Error applying image overlay/WM ({path_hint}): {e}")
-            import traceback
-            traceback.print_exc()
-            return img # Return original on error
+        rot_w, rot_h = wm_rotated.size
+        paste_x = int(center_x - rot_w / 2)
+        paste_y = int(center_y - rot_h / 2)
+        return wm_rotated, paste_x, paste_y
 
     def apply_overlays(self, img, overlays_list):
         """Applies all overlays from the list in order."""
         if not overlays_list: return img
         base_img = img if img.mode == 'RGBA' else img.convert('RGBA')
+        if _numpy_available and len(overlays_list) > 1:
+            # Fused path: one float buffer, each overlay blended into its
+            # bounding-box slice only. N overlays cost their total pixel
+            # area instead of N full-image layer + alpha_composite passes.
+            try:
+                return self._apply_overlays_fused(base_img, overlays_list)
+            except Exception as e:
+                _log.warning(f"Fused overlay compositing error, falling back: {e}")
         for overlay_info in overlays_list: # Apply in list order (bottom to top)
              base_img = self.apply_single_image_overlay(base_img, overlay_info)
         return base_img
 
+    def _apply_overlays_fused(self, base_img, overlays_list):
+        """Single-pass NumPy compositor for multiple overlays.
+
+        Matches Image.alpha_composite semantics (proper \"over\" with
+        destination alpha) but only reads/writes each overlay's bounding
+        box instead of the full image per layer.
+        """
+        base = np.asarray(base_img, dtype=np.float32) # Own buffer; PIL copy
+        img_h, img_w = base.shape[:2]
+        blended = False
+        for overlay_info in overlays_list: # Apply in list order (bottom to top)
+            if (not overlay_info or not overlay_info.get('rect') or
+                    self._ensure_overlay_pil(overlay_info) is None):
+                continue
+            prepared = self._prepare_overlay_sprite(overlay_info, (img_w, img_h))
+            if prepared is None:
+                continue
+            sprite, paste_x, paste_y = prepared
+            # Clip the sprite to the image bounds
+            dx0, dy0 = max(0, paste_x), max(0, paste_y)
+            dx1 = min(img_w, paste_x + sprite.width)
+            dy1 = min(img_h, paste_y + sprite.height)
+            if dx1 <= dx0 or dy1 <= dy0:
+                continue
+            sx0, sy0 = dx0 - paste_x, dy0 - paste_y
+            ov = np.asarray(sprite, dtype=np.float32)[sy0:sy0 + (dy1 - dy0),
+                                                      sx0:sx0 + (dx1 - dx0)]
+            dst = base[dy0:dy1, dx0:dx1]
+            a_s = ov[..., 3:4] / 255.0
+            a_d = dst[..., 3:4] / 255.0
+            a_out = a_s + a_d * (1.0 - a_s)
+            safe = np.where(a_out > 0, a_out, 1.0) # Both fully transparent
+            dst[..., :3] = (ov[..., :3] * a_s + dst[..., :3] * a_d * (1.0 - a_s)) / safe
+            dst[..., 3:4] = a_out * 255.0
+            blended = True
+        if not blended:
+            return base_img
+        return Image.fromarray(np.clip(base, 0, 255).astype(np.uint8), 'RGBA')
+
     def _get_watermark_position_coords(self, main_img_size, wm_size, position_name, padding=10):
         """Calculates top-left coords for standard watermark positions."""
         W, H = main_img_size
@@ -3550,6 +4769,7 @@ class ImageMasterProApp:
         delta_pan_y = canvas_y - canvas_y_target
 
         # Update zoom and pan state
+        self._last_interaction_ts = time.time() # Draft rendering while wheel-zooming
         self.zoom_factor = new_zoom_factor
         self.pan_offset[0] += delta_pan_x
         self.pan_offset[1] += delta_pan_y
@@ -3568,6 +4788,7 @@ class ImageMasterProApp:
 
     def on_pan_drag(self, event):
         if not self._pan_active or not self.processed_image: return
+        self._last_interaction_ts = time.time() # Draft rendering while dragging
         dx = event.x - self._pan_start_x
         dy = event.y - self._pan_start_y
         self.pan_offset[0] += dx
@@ -3575,7 +4796,7 @@ class ImageMasterProApp:
         self._clamp_pan_offset() # Apply panning limits
         self._pan_start_x = event.x
         self._pan_start_y = event.y
-        self.update_preview_safe() # Redraw with new pan
+        self._redisplay() # Pan only moves the viewport; no pipeline involved
 
     def on_pan_release(self, event):
          if not self._pan_active: return
@@ -3627,6 +4848,7 @@ class ImageMasterProApp:
          delta_pan_x = focus_canvas_x - new_canvas_x
          delta_pan_y = focus_canvas_y - new_canvas_y
 
+         self._last_interaction_ts = time.time() # Draft rendering while stepping zoom
          self.zoom_factor = new_zoom_factor
          self.pan_offset[0] += delta_pan_x
          self.pan_offset[1] += delta_pan_y
@@ -3706,13 +4928,42 @@ class ImageMasterProApp:
 
 
     def on_canvas_resize_debounced(self, event=None):
-        """Handles canvas resize events, redraws preview after a delay."""
-        if self._canvas_resize_job:
-            self.root.after_cancel(self._canvas_resize_job)
-        self._canvas_resize_job = self.root.after(250, self._on_canvas_resize_action)
+        """Handles canvas resize events - throttled, not just debounced.
+
+        A window drag fires <Configure> per pixel. Pure debouncing would show
+        nothing until the drag ends; throttling redraws at most every 100 ms,
+        so the preview tracks the resize (~10 fps) with bounded work, and a
+        trailing call renders the final size.
+        """
+        # Early-exit: <Configure> also fires for moves and duplicate sizes
+        if event is not None:
+            size = (event.width, event.height)
+            if size == self._last_resize_handled:
+                return
+            self._last_resize_handled = size
+
+        now = time.monotonic()
+        elapsed_ms = (now - self._last_resize_ts) * 1000.0
+        if elapsed_ms >= 100:
+            # Leading edge: enough quiet time has passed, redraw immediately
+            if self._canvas_resize_job:
+                self.root.after_cancel(self._canvas_resize_job)
+                self._canvas_resize_job = None
+            self._last_resize_ts = now
+            self._on_canvas_resize_action()
+        elif not self._canvas_resize_job:
+            # Trailing edge: schedule one redraw for when the window expires
+            delay = max(1, int(100 - elapsed_ms))
+            self._canvas_resize_job = self.root.after(delay, self._on_canvas_resize_throttled)
+
+    def _on_canvas_resize_throttled(self):
+         """Trailing-edge resize redraw scheduled by the throttle."""
+         self._canvas_resize_job = None
+         self._last_resize_ts = time.monotonic()
+         self._on_canvas_resize_action()
 
     def _on_canvas_resize_action(self):
-         """ Actual action to perform after canvas resize debounce. """
+         """ Actual action to perform after canvas resize throttle. """
          # Option 1: Zoom to fit (might be jarring if user was zoomed in)
          # self.zoom_fit()
          # Option 2: Just redraw with current zoom/pan (better UX)
@@ -3722,10 +4973,28 @@ class ImageMasterProApp:
 
     # --- Undo/Redo System ---
 
+    def _strip_pil_from_action(self, action_dict):
+        """Drops any 'pil_image' references nested in an action payload.
+
+        History must stay parameter-only: a single leaked decoded image times
+        MAX_UNDO_HISTORY entries would dwarf everything else in memory. The
+        push sites already copy with pil_image=None; this is the central
+        guarantee so new action types can't regress it. Images are re-derived
+        from stored paths on undo/redo (_reload_overlay_images/_reload_wm_image).
+        """
+        for value in action_dict.values():
+            if isinstance(value, dict):
+                value.pop('pil_image', None)
+            elif isinstance(value, list):
+                for item in value:
+                    if isinstance(item, dict):
+                        item.pop('pil_image', None)
+
     def _add_undo_action(self, action_dict):
         """Adds an action to the current image's undo stack."""
         if not self.current_image_path: return # Cannot undo if no image selected
 
+        self._strip_pil_from_action(action_dict)
         # Clear redo stack
         self.current_redo_stack.clear()
         # Add action to undo stack
@@ -3840,6 +5109,7 @@ class ImageMasterProApp:
                  if is_undo: # Undo Clear = Restore
                       settings['blur_areas'] = list(action['removed_blurs'])
                       settings['blackout_areas'] = list(action['removed_blackouts'])
+                      self._area_lookup = None # Membership changed
                  else: # Redo Clear = Clear again
                       self._clear_manual_areas_internal()
 
@@ -4015,14 +5285,30 @@ class ImageMasterProApp:
              self._reset_interaction_states() # Deselect any areas
 
 
+    def _apply_rotation(self, img, rotation):
+        """Rotates img by `rotation` degrees, using transpose for right angles.
+
+        Image.transpose is a lossless C-level stride copy - far cheaper than
+        the general BICUBIC resampling path, which is only needed for
+        arbitrary angles.
+        """
+        transpose_op = {90: Image.Transpose.ROTATE_90,
+                        180: Image.Transpose.ROTATE_180,
+                        270: Image.Transpose.ROTATE_270}.get(rotation % 360)
+        if transpose_op is not None:
+            return img.transpose(transpose_op)
+        return img.rotate(rotation, expand=True, resample=Image.Resampling.BICUBIC)
+
     def _apply_image_transforms_from_settings(self):
         """Applies rotation/flip stored in settings to self.original_image -> self.rotated_flipped_image"""
         if not self.original_image or not self.current_image_path:
             self.rotated_flipped_image = None
+            self._base_image_version += 1
             return
         settings = self.image_settings.get(self.current_image_path)
         if not settings:
             self.rotated_flipped_image = self.original_image.copy() if self.original_image else None
+            self._base_image_version += 1
             return
 
         img = self.original_image.copy()
@@ -4032,9 +5318,10 @@ class ImageMasterProApp:
 
         if flip_h: img = img.transpose(Image.Transpose.FLIP_LEFT_RIGHT)
         if flip_v: img = img.transpose(Image.Transpose.FLIP_TOP_BOTTOM)
-        if rotation != 0: img = img.rotate(rotation, expand=True, resample=Image.Resampling.BICUBIC)
+        if rotation != 0: img = self._apply_rotation(img, rotation)
 
         self.rotated_flipped_image = img
+        self._base_image_version += 1
 
 
     def record_transform_action(self, area_type, area_uuid, old_rect, old_angle, new_rect, new_angle):
@@ -4120,6 +5407,7 @@ class ImageMasterProApp:
 
     def start_conversion_thread(self, single=False):
         """Starts the image conversion process in a separate thread."""
+        _load_pil_extras() # Workers need the full PIL toolbox; import on main thread
         images_to_process = []
         if single:
             if self.current_image_path:
@@ -4172,11 +5460,56 @@ class ImageMasterProApp:
 
 
     def convert_images_worker(self, image_paths, global_settings, all_image_settings_copy):
-        """Worker function that processes images in a background thread."""
+        """Scheduler that dispatches per-image jobs to a thread pool.
+
+        Pillow's decode/filter/resize/encode paths release the GIL, so images
+        can be processed truly in parallel. This thread only submits jobs and
+        collects results; all Tk updates are marshaled via root.after.
+        """
         total = len(image_paths)
         success_count = 0
         fail_count = 0
+        completed = 0
+
+        # At least 2 workers even on a single-core box: JPEG/PNG/WEBP encode
+        # releases the GIL inside Pillow, so image N's save genuinely overlaps
+        # image N+1's decode+process instead of serializing with it.
+        max_workers = min(total, max(2, os.cpu_count() or 1)) if total else 1
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+            future_to_path = {
+                pool.submit(self._convert_single_image, idx, image_path, total,
+                            global_settings, all_image_settings_copy): image_path
+                for idx, image_path in enumerate(image_paths, 1)
+            }
+            for future in concurrent.futures.as_completed(future_to_path):
+                image_path = future_to_path[future]
+                completed += 1
+                try:
+                    future.result()
+                    success_count += 1
+                except Exception as e:
+                    fail_count += 1
+                    error_msg = f"Failed to process {os.path.basename(image_path)}:\n{e}"
+                    print(error_msg)
+                    import traceback
+                    traceback.print_exc()
+                    # Show error message in main thread
+                    self.root.after(0, lambda msg=error_msg: messagebox.showerror("Conversion Error", msg))
+
+                # Update status and progress bar (using root.after for thread safety)
+                self.root.after(0, lambda c=completed, p=image_path: self.status_label.config(
+                    text=f"Processed {c}/{total}: {os.path.basename(p)}"
+                ))
+                self.root.after(0, lambda c=completed: self.progress_bar.config(value=c))
+
+        # --- Conversion Finished ---
+        final_status = f"Conversion complete. Success: {success_count}, Failed: {fail_count}."
+        print(final_status)
+        self.root.after(0, lambda: self.status_label.config(text=final_status))
+        self.root.after(0, lambda: self.update_widget_states(processing=False)) # Re-enable UI
 
+    def _convert_single_image(self, idx, image_path, total, global_settings, all_image_settings_copy):
+        """Processes and saves one image. Runs on a pool worker thread; raises on failure."""
         # --- Unpack global settings ---
         output_format = global_settings["output_format"]
         jpeg_quality = global_settings["jpeg_quality"]
@@ -4194,148 +5527,131 @@ class ImageMasterProApp:
         text_wm_pos = global_settings["text_wm_pos"]
         # ---
 
-        # --- Pre-load overlay/WM images used across all images (if any) ---
-        # This requires identifying common paths, potentially complex.
-        # Current approach: Load images individually within the loop for simplicity & correctness.
-
-
-        for idx, image_path in enumerate(image_paths, 1):
-            # --- Get Per-Image Settings from the passed *copy* ---
-            current_image_settings = all_image_settings_copy.get(image_path, self._get_default_image_settings())
-
-            # Extract per-image data
-            rotation = current_image_settings.get('rotation', 0)
-            flip_h = current_image_settings.get('flip_h', False)
-            flip_v = current_image_settings.get('flip_v', False)
-            adj_settings = current_image_settings.get('adjustments', {'brightness': 1.0, 'contrast': 1.0, 'saturation': 1.0})
-            blur_areas_list = current_image_settings.get('blur_areas', [])
-            blackout_areas_list = current_image_settings.get('blackout_areas', [])
-            # wm_info = current_image_settings.get('wm_img_info') # WM is now global
-            overlays_list = current_image_settings.get('overlays', []) # Contains path, rect, angle, opacity
-
-            # Update status (using root.after for thread safety)
-            self.root.after(0, lambda i=idx, p=image_path: self.status_label.config(
-                text=f"Processing {i}/{total}: {os.path.basename(p)}..."
-            ))
-
-            try:
-                # --- 1. Load Base Image & Apply EXIF ---
-                img_base = Image.open(image_path)
-                img_oriented = self._apply_exif_orientation(img_base)
-                # Store original size AFTER orientation for scaling calculations later
-                original_w_oriented, original_h_oriented = img_oriented.size
-
-                # --- 2. Apply Image Transforms (Rot/Flip) ---
-                img = img_oriented.copy() # Start from oriented version
-                if flip_h: img = img.transpose(Image.Transpose.FLIP_LEFT_RIGHT)
-                if flip_v: img = img.transpose(Image.Transpose.FLIP_TOP_BOTTOM)
-                if rotation != 0: img = img.rotate(rotation, expand=True, resample=Image.Resampling.BICUBIC)
-
-                # --- 3. Apply Filter (Global) ---
-                img = self.apply_filter(img, filter_val)
-
-                # --- 4. Apply Resize (Global/Preset) ---
-                img = self.apply_resize(img, preset_val, resize_w_str, resize_h_str)
-
-                # --- 5. Apply Adjustments (Per Image) ---
-                img = self.apply_adjustments(img, adj_settings)
-
-                # --- Ensure RGBA if needed for next steps ---
-                needs_rgba = (blur_areas_list or blackout_areas_list or use_text_wm or
-                              (self.use_image_watermark.get() and self.wm_img_info.get('path')) or overlays_list)
-                if needs_rgba and img.mode != 'RGBA':
-                     img = img.convert('RGBA')
-
-                # --- 6. Apply Manual Edits (Per Image) ---
-                # Pass ORIENTED original dimensions for coordinate scaling
-                img = self.apply_manual_edits(img, blur_areas_list, blackout_areas_list) # Now uses self.original_image which might be wrong? NO, pass dims
-                # **REVISED CALL** Pass the correct original dimensions for scaling
-                temp_original_image = Image.new('RGB', (original_w_oriented, original_h_oriented)) # Dummy image with correct size
-                img = self._apply_manual_edits_conversion_safe(img, blur_areas_list, blackout_areas_list, temp_original_image)
-                del temp_original_image
-
-
-                # --- 7. Apply Text Watermark (Global) ---
-                if use_text_wm and text_wm_text:
-                     img = self.apply_text_watermark(img) # Uses global settings directly
-
-                # --- 8. Apply Main Image Watermark (Global) ---
-                # Use global settings: self.use_image_watermark and self.wm_img_info
-                if self.use_image_watermark.get() and self.wm_img_info.get('path'):
-                     try:
-                          # Reload the global WM image info (in case file changed, though unlikely in worker)
-                          # Pass a copy to avoid modifying the main dict if reload fails partially
-                          reloaded_wm_info = self._reload_wm_image(self.wm_img_info.copy())
-                          if reloaded_wm_info and reloaded_wm_info.get('pil_image'):
-                               # Pass oriented original dimensions
-                               temp_original_image = Image.new('RGB', (original_w_oriented, original_h_oriented))
-                               img = self._apply_single_image_overlay_conversion_safe(img, reloaded_wm_info, temp_original_image)
-                               del temp_original_image
-                     except Exception as wm_load_err:
-                          print(f"Error loading WM image '{wm_info.get('path')}' during conversion: {wm_load_err}")
-
-                # --- 9. Apply Overlays (Per Image) ---
-                if overlays_list:
-                    temp_original_image = Image.new('RGB', (original_w_oriented, original_h_oriented)) # Create dummy once
-                    processed_overlays = []
-                    for ov in overlays_list:
-                         try:
-                              reloaded_ov = self._reload_overlay_images([ov.copy()])[0]
-                              if reloaded_ov['pil_image']:
-                                   processed_overlays.append(reloaded_ov)
-                         except Exception as ov_load_err:
-                              print(f"Error loading overlay '{ov.get('path')}' during conversion: {ov_load_err}")
-                    # Apply overlays using the correctly sized dummy original
-                    img = self._apply_overlays_conversion_safe(img, processed_overlays, temp_original_image)
-                    del temp_original_image
-
-
-                # --- 10. Determine Output Path ---
-                output_dir_for_file = base_output_dir if base_output_dir else os.path.dirname(image_path)
-                os.makedirs(output_dir_for_file, exist_ok=True)
-                original_basename = os.path.splitext(os.path.basename(image_path))[0]
-                out_name = self._generate_output_filename(filename_pattern, original_basename, idx, total)
-                safe_format = output_format if output_format != 'jpeg' else 'jpg'
-                output_path = os.path.join(output_dir_for_file, f"{out_name}.{safe_format}")
-
-
-                # --- 11. Save Image ---
-                save_params = {}
-                final_img_to_save = img
-                if output_format == "jpeg":
-                    if final_img_to_save.mode in ['RGBA', 'LA', 'P']:
-                        background = Image.new("RGB", final_img_to_save.size, (255, 255, 255))
-                        try: background.paste(final_img_to_save, mask=final_img_to_save.split()[3])
-                        except IndexError: background.paste(final_img_to_save)
-                        final_img_to_save = background
-                    elif final_img_to_save.mode != 'RGB':
-                         final_img_to_save = final_img_to_save.convert('RGB')
-                    save_params = {"quality": jpeg_quality, "optimize": True, "progressive": True}
-                elif output_format == "png": save_params = {"optimize": True}
-                elif output_format == "webp": save_params = {"quality": jpeg_quality, "lossless": False} # Add lossless option?
-
-                final_img_to_save.save(output_path, output_format.upper(), **save_params)
-                success_count += 1
+        # Overlay/WM images are loaded per job; paths rarely repeat across images
+
+        # --- Get Per-Image Settings from the passed *copy* ---
+        current_image_settings = all_image_settings_copy.get(image_path, self._get_default_image_settings())
+
+        # Extract per-image data
+        rotation = current_image_settings.get('rotation', 0)
+        flip_h = current_image_settings.get('flip_h', False)
+        flip_v = current_image_settings.get('flip_v', False)
+        adj_settings = current_image_settings.get('adjustments', {'brightness': 1.0, 'contrast': 1.0, 'saturation': 1.0})
+        blur_areas_list = current_image_settings.get('blur_areas', [])
+        blackout_areas_list = current_image_settings.get('blackout_areas', [])
+        # wm_info = current_image_settings.get('wm_img_info') # WM is now global
+        overlays_list = current_image_settings.get('overlays', []) # Contains path, rect, angle, opacity
+
+        # --- 1. Load Base Image & Apply EXIF ---
+        img_base = Image.open(image_path)
+        img_oriented = self._apply_exif_orientation(img_base)
+        # Store original size AFTER orientation for scaling calculations later
+        original_w_oriented, original_h_oriented = img_oriented.size
+        # Edit coordinates were recorded against the preview's reference size,
+        # which can differ from the full decode (JPEG draft loads). Scale
+        # relative to that recorded size so placements match the preview.
+        ref_size = current_image_settings.get('ref_size')
+        if ref_size:
+            original_w_oriented, original_h_oriented = ref_size
+
+        # --- 2. Apply Image Transforms (Rot/Flip) ---
+        img = img_oriented.copy() # Start from oriented version
+        if flip_h: img = img.transpose(Image.Transpose.FLIP_LEFT_RIGHT)
+        if flip_v: img = img.transpose(Image.Transpose.FLIP_TOP_BOTTOM)
+        if rotation != 0: img = self._apply_rotation(img, rotation)
 
-            except Exception as e:
-                fail_count += 1
-                error_msg = f"Failed to process {os.path.basename(image_path)}:\n{e}"
-                print(error_msg)
-                import traceback
-                traceback.print_exc()
-                # Show error message in main thread
-                self.root.after(0, lambda msg=error_msg: messagebox.showerror("Conversion Error", msg))
+        # --- 3. Apply Filter (Global) ---
+        img = self.apply_filter(img, filter_val)
 
-            # Update progress bar
-            self.root.after(0, lambda i=idx: self.progress_bar.config(value=i))
-            time.sleep(0.01) # Yield
+        # --- 4. Apply Resize (Global/Preset) ---
+        img = self.apply_resize(img, preset_val, resize_w_str, resize_h_str)
 
+        # --- 5. Apply Adjustments (Per Image) ---
+        img = self.apply_adjustments(img, adj_settings)
 
-        # --- Conversion Finished ---
-        final_status = f"Conversion complete. Success: {success_count}, Failed: {fail_count}."
-        print(final_status)
-        self.root.after(0, lambda: self.status_label.config(text=final_status))
-        self.root.after(0, lambda: self.update_widget_states(processing=False)) # Re-enable UI
+        # --- Alpha promotion is deferred: the watermark/overlay steps below
+        # convert to RGBA themselves only when they actually run, so edits
+        # and adjustments stay on the smaller RGB buffer. ---
+
+        # --- 6. Apply Manual Edits (Per Image) ---
+        # Pass ORIENTED original dimensions for coordinate scaling
+        img = self.apply_manual_edits(img, blur_areas_list, blackout_areas_list) # Now uses self.original_image which might be wrong? NO, pass dims
+        # **REVISED CALL** Pass the correct original dimensions for scaling
+        temp_original_image = Image.new('RGB', (original_w_oriented, original_h_oriented)) # Dummy image with correct size
+        img = self._apply_manual_edits_conversion_safe(img, blur_areas_list, blackout_areas_list, temp_original_image)
+        del temp_original_image
+
+
+        # --- 7. Apply Text Watermark (Global) ---
+        if use_text_wm and text_wm_text:
+             # Render from the batch snapshot, not live Tk state
+             img = self.apply_text_watermark(img, {
+                  'text': text_wm_text,
+                  'position': global_settings["text_wm_pos"],
+                  'size': global_settings["text_wm_size"],
+                  'color': global_settings["text_wm_color"],
+                  'opacity': max(0, min(255, global_settings["text_wm_opacity"])),
+             })
+
+        # --- 8. Apply Main Image Watermark (Global) ---
+        # Use global settings: self.use_image_watermark and self.wm_img_info
+        if self.use_image_watermark.get() and self.wm_img_info.get('path'):
+             try:
+                  # Reload the global WM image info (in case file changed, though unlikely in worker)
+                  # Pass a copy to avoid modifying the main dict if reload fails partially
+                  reloaded_wm_info = self._reload_wm_image(self.wm_img_info.copy())
+                  if reloaded_wm_info and reloaded_wm_info.get('pil_image'):
+                       # Pass oriented original dimensions
+                       temp_original_image = Image.new('RGB', (original_w_oriented, original_h_oriented))
+                       img = self._apply_single_image_overlay_conversion_safe(img, reloaded_wm_info, temp_original_image)
+                       del temp_original_image
+             except Exception as wm_load_err:
+                  print(f"Error loading WM image '{self.wm_img_info.get('path')}' during conversion: {wm_load_err}")
+
+        # --- 9. Apply Overlays (Per Image) ---
+        if overlays_list:
+            temp_original_image = Image.new('RGB', (original_w_oriented, original_h_oriented)) # Create dummy once
+            processed_overlays = []
+            for ov in overlays_list:
+                 try:
+                      # Force a fresh decode in this worker (don't share the
+                      # preview's PIL instance across threads)
+                      reloaded_ov = self._reload_overlay_images([ov.copy()])[0]
+                      if self._ensure_overlay_pil(reloaded_ov) is not None:
+                           processed_overlays.append(reloaded_ov)
+                 except Exception as ov_load_err:
+                      print(f"Error loading overlay '{ov.get('path')}' during conversion: {ov_load_err}")
+            # Apply overlays using the correctly sized dummy original
+            img = self._apply_overlays_conversion_safe(img, processed_overlays, temp_original_image)
+            del temp_original_image
+
+
+        # --- 10. Determine Output Path ---
+        output_dir_for_file = base_output_dir if base_output_dir else os.path.dirname(image_path)
+        os.makedirs(output_dir_for_file, exist_ok=True)
+        original_basename = os.path.splitext(os.path.basename(image_path))[0]
+        out_name = self._generate_output_filename(filename_pattern, original_basename, idx, total)
+        safe_format = output_format if output_format != 'jpeg' else 'jpg'
+        output_path = os.path.join(output_dir_for_file, f"{out_name}.{safe_format}")
+
+
+        # --- 11. Save Image ---
+        save_params = {}
+        final_img_to_save = img
+        if output_format == "jpeg":
+            if final_img_to_save.mode in ['RGBA', 'LA', 'P']:
+                background = Image.new("RGB", final_img_to_save.size, (255, 255, 255))
+                try: background.paste(final_img_to_save, mask=final_img_to_save.split()[3])
+                except IndexError: background.paste(final_img_to_save)
+                final_img_to_save = background
+            elif final_img_to_save.mode != 'RGB':
+                 final_img_to_save = final_img_to_save.convert('RGB')
+            save_params = {"quality": jpeg_quality, "optimize": True, "progressive": True}
+        elif output_format == "png": save_params = {"optimize": True}
+        elif output_format == "webp": save_params = {"quality": jpeg_quality, "lossless": False} # Add lossless option?
+
+        final_img_to_save.save(output_path, output_format.upper(), **save_params)
+        return output_path
 
     # --- Conversion Helper Methods (Thread-Safe Alternatives) ---
 
@@ -4346,7 +5662,15 @@ class ImageMasterProApp:
              print("Warning: Cannot apply manual edits during conversion - original image reference missing.")
              return img
 
-        editable_img = img if img.mode == 'RGBA' else img.convert('RGBA')
+        # Blur and blackout don't need alpha; keep RGB/RGBA as-is. Exotic
+        # modes convert up for drawing/filtering - to RGBA when they carry
+        # transparency (LA/PA, P with a transparency key), else to RGB.
+        if img.mode in ('RGB', 'RGBA'):
+            editable_img = img
+        elif 'A' in img.getbands() or 'transparency' in img.info:
+            editable_img = img.convert('RGBA')
+        else:
+            editable_img = img.convert('RGB')
         draw = ImageDraw.Draw(editable_img)
         current_w, current_h = editable_img.size
         original_w, original_h = original_img_ref.size # Get dims from reference
@@ -4391,7 +5715,7 @@ class ImageMasterProApp:
 
     def _apply_single_image_overlay_conversion_safe(self, img, overlay_info, original_img_ref):
         """Thread-safe version of apply_single_image_overlay."""
-        if not overlay_info or not overlay_info.get('pil_image') or not overlay_info.get('rect'): return img
+        if not overlay_info or not overlay_info.get('rect') or self._ensure_overlay_pil(overlay_info) is None: return img
         if not original_img_ref:
              print("Warning: Cannot apply overlay during conversion - original image reference missing.")
              return img
@@ -4433,9 +5757,11 @@ class ImageMasterProApp:
             paste_x = int(center_x - rot_w / 2)
             paste_y = int(center_y - rot_h / 2)
 
-            wm_layer = Image.new('RGBA', img.size, (0, 0, 0, 0))
+            wm_layer = self._acquire_layer(img.size)
             wm_layer.paste(wm_rotated, (paste_x, paste_y), wm_rotated)
-            return Image.alpha_composite(img, wm_layer)
+            result = Image.alpha_composite(img, wm_layer)
+            self._release_layer(wm_layer)
+            return result
 
         except Exception as e:
             path_hint = os.path.basename(overlay_info.get('path','Unknown')) if overlay_info else 'Unknown'
@@ -4532,6 +5858,7 @@ class ImageMasterProApp:
 
             # Clear visuals and info labels
             self.preview_canvas.delete("all")
+            self.canvas_image_id = None
             self.image_info_label.config(text="Load an image to see preview and info.")
             self.dnd_label.config(text="Drop images or folders here" if _tkdnd_available else "Drag & Drop (Disabled)")
             self.status_label.config(text="All settings and images reset.")
@@ -4556,7 +5883,7 @@ class ImageMasterProApp:
 
         if clear_image_list:
             self.image_list = []
-            self.image_settings = {} # Clear ALL per-image settings
+            self.image_settings = OrderedDict() # Clear ALL per-image settings
             try: # Clear notebook tabs
                 if hasattr(self, 'image_notebook') and self.image_notebook.winfo_exists():
                      for tab_id in self.image_notebook.tabs(): self.image_notebook.forget(tab_id)
@@ -4565,12 +5892,17 @@ class ImageMasterProApp:
                  print(f"Error clearing notebook: {e}")
 
 
-        # Clear current image display and state
+        # Clear current image display and state. Any in-flight preview
+        # render must die with it or it would resurrect a stale frame (and
+        # crash _commit_preview on the nulled path/image).
+        self._cancel_pending_preview()
         self.original_image = None
         self.rotated_flipped_image = None
+        self._base_image_version += 1
         self.processed_image = None
         self.preview_image_tk = None
         self.current_image_path = None
+        self._current_settings = None
         self.filename_var.set("")
         self.processed_base_size = None
 
@@ -4593,6 +5925,7 @@ class ImageMasterProApp:
 
         # Clear visuals
         self.preview_canvas.delete("all")
+        self.canvas_image_id = None
         self.image_info_label.config(text="Load an image to see preview and info.")
         self.progress_bar['value'] = 0
 
@@ -4779,11 +6112,21 @@ class ImageMasterProApp:
 
 
 # --- Utility Functions ---
+    def _rotate_points_batch(self, cx, cy, pts, angle_degrees):
+        """Rotates an (N, 2) array of points around (cx, cy) in one matmul.
+
+        Same convention as _rotate_point, but the trig is evaluated once for
+        the whole batch instead of per point. Requires NumPy; callers guard
+        on _numpy_available.
+        """
+        cos_a, sin_a = _trig_pair(angle_degrees)
+        rot = np.array([[cos_a, sin_a], [-sin_a, cos_a]], dtype=np.float32)
+        center = np.array([cx, cy], dtype=np.float32)
+        return (np.asarray(pts, dtype=np.float32) - center) @ rot + center
+
     def _rotate_point(self, cx, cy, px, py, angle_degrees):
         """ Rotates point (px, py) around center (cx, cy) by angle_degrees. """
-        angle_rad = math.radians(angle_degrees)
-        cos_a = math.cos(angle_rad)
-        sin_a = math.sin(angle_rad)
+        cos_a, sin_a = _trig_pair(angle_degrees)
         px_rel = px - cx
         py_rel = py - cy
         new_x = cx + px_rel * cos_a - py_rel * sin_a